@@ -212,9 +212,8 @@ with col1:
     )
     
     try:
-        import pandas as pd
-        df_rotas = pd.read_csv('data/rotas.csv')
-        rotas_count = len(df_rotas)
+        from utils.rotas import carregar_indice_rotas
+        rotas_count = len(carregar_indice_rotas())
     except:
         rotas_count = 0
     
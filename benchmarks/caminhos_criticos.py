@@ -0,0 +1,346 @@
+"""
+Benchmarks dos caminhos críticos de cálculo, carregamento e gráficos
+
+Mede cada caso com entradas fixas: aquece uma vez, calibra o número de
+iterações para que cada rodada dure pelo menos --tempo-min segundos e
+guarda a mediana de várias rodadas (com o coletor de lixo desligado).
+Os caches em disco ficam desativados; funções com cache em memória são
+medidas sem cache (.sem_cache) e, separadamente, com o cache quente.
+
+O resultado vai para benchmarks/resultados/<commit>.json (execuções locais,
+fora do git), com versões e máquina, e é comparado com a referência
+versionada em benchmarks/referencia.json (ou com --comparar); regressões
+acima da tolerância encerram com código 1. --atualizar-referencia grava
+a referência, só a partir de uma árvore sem alterações.
+
+    python benchmarks/caminhos_criticos.py
+    python benchmarks/caminhos_criticos.py --filtro rota --rodadas 9
+    python benchmarks/caminhos_criticos.py --comparar benchmarks/resultados/abc1234.json
+    python benchmarks/caminhos_criticos.py --atualizar-referencia
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+os.chdir(RAIZ)
+
+# Antes de importar o motor: sem cache em disco, e sem o aviso do Streamlit
+# "No runtime found" a cada uso de cache fora do servidor
+os.environ["AMARO_CACHE_DISCO_DB"] = ""
+import logging
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    calcula_custo_trecho, calcular_projecao_mensal, calcular_projecao_lote,
+    calcular_custo_rota, calcular_matriz_rotas, calcular_grade_sensibilidade
+)
+from utils.params import load_params, _limpar_cache_params
+from utils.rotas import IndiceRotas
+from utils import charts_fixed, graficos_garantidos, graficos_simples
+
+RESULTADOS_DIR = RAIZ / "benchmarks" / "resultados"
+REFERENCIA = RAIZ / "benchmarks" / "referencia.json"
+
+# Variação acima da qual --comparar aponta regressão
+TOLERANCIA_PADRAO = 0.10
+
+
+# ========================================================================
+# CASOS
+# ========================================================================
+def _indice_sintetico(n):
+    """Índice com n rotas distintas (códigos fictícios, durações fixas pela semente)"""
+    rng = np.random.default_rng(n)
+    lado = int(np.ceil(np.sqrt(n)))
+    i = np.arange(n)
+    return IndiceRotas(pd.DataFrame({
+        'origem': [f"O{v:04d}" for v in i // lado],
+        'destino': [f"D{v:04d}" for v in i % lado],
+        'duracao_h': rng.uniform(0.3, 6.0, n).round(2)
+    }))
+
+
+def _casos_calculo(params, modelo):
+    casos = {
+        "calcula_custo_trecho": lambda: calcula_custo_trecho(modelo, 120, params),
+    }
+
+    # A projeção mensal passa por calcular_projecao_lote (cache em disco desativado acima)
+    for meses in (12, 60, 240):
+        casos[f"calcular_projecao_mensal[{meses} meses]"] = (
+            lambda meses=meses: calcular_projecao_mensal(modelo, 80, meses, params, 5, 4, 3, 1e6)
+        )
+    casos["calcular_projecao_lote[1000 cenários × 60 meses]"] = lambda: calcular_projecao_lote.sem_cache(
+        np.resize(params['modelos_disponiveis'], 1000), np.linspace(20, 200, 1000), 60, params, 5, 4, 3
+    )
+    casos["calcular_grade_sensibilidade[21×10]"] = (
+        lambda: calcular_grade_sensibilidade.sem_cache(modelo, 80, params)
+    )
+    return casos
+
+
+def _casos_rotas(params, modelo, tamanhos):
+    casos = {}
+    for n in tamanhos:
+        indice = _indice_sintetico(n)
+        origens, destinos = indice.origem.tolist(), indice.destino.tolist()
+        ultima = (origens[-1], destinos[-1])
+
+        # Uma cotação em um índice de n rotas (busca O(1) + custo do trecho)
+        casos[f"calcular_custo_rota[índice {n}]"] = (
+            lambda indice=indice, ultima=ultima:
+                calcular_custo_rota.sem_cache(*ultima, modelo, params, indice)
+        )
+        casos[f"calcular_custo_rota[índice {n}, cache quente]"] = (
+            lambda indice=indice, ultima=ultima:
+                calcular_custo_rota(*ultima, modelo, params, indice)
+        )
+        # Todas as n rotas: uma a uma (até 10 mil) e na passada vetorizada
+        if n <= 10000:
+            casos[f"calcular_custo_rota[{n} rotas, uma a uma]"] = (
+                lambda indice=indice, pares=list(zip(origens, destinos)): [
+                    calcular_custo_rota.sem_cache(o, d, modelo, params, indice) for o, d in pares
+                ]
+            )
+        casos[f"calcular_matriz_rotas[{n} rotas × 1 modelo]"] = (
+            lambda indice=indice: calcular_matriz_rotas.sem_cache(params, indice, [modelo])
+        )
+    return casos
+
+
+def _casos_parametros():
+    def frio():
+        _limpar_cache_params()
+        return load_params()
+
+    return {
+        "load_params[frio]": frio,
+        "load_params[quente]": load_params,
+    }
+
+
+def _casos_graficos(params, modelo):
+    projecao = calcular_projecao_mensal(modelo, 80, 60, params)
+    grade = calcular_grade_sensibilidade.sem_cache(modelo, 80, params)
+    custos = {'combustivel': 5000, 'tripulacao': 3000, 'manutencao': 4000, 'depreciacao': 2000}
+    bordas = np.linspace(-5e5, 5e5, 51)
+    contagens = np.random.default_rng(0).integers(0, 5000, 50)
+
+    return {
+        "charts_fixed.render_chart_receitas": lambda: charts_fixed.render_chart_receitas(90000, 10000),
+        "charts_fixed.render_chart_custos": lambda: charts_fixed.render_chart_custos(custos),
+        "charts_fixed.render_chart_comparativo": lambda: charts_fixed.render_chart_comparativo(8000, 10000),
+        "charts_fixed.render_chart_projecao[60 meses]": lambda: charts_fixed.render_chart_projecao(
+            projecao['meses'], projecao['receitas'], projecao['custos']
+        ),
+        "graficos_garantidos.criar_grafico_pizza": lambda: graficos_garantidos.criar_grafico_pizza(90000, 10000),
+        "graficos_garantidos.criar_grafico_barras": lambda: graficos_garantidos.criar_grafico_barras(custos),
+        "graficos_garantidos.criar_grafico_comparativo": (
+            lambda: graficos_garantidos.criar_grafico_comparativo(8000, 10000)
+        ),
+        "graficos_garantidos.criar_grafico_linha[60 meses]": lambda: graficos_garantidos.criar_grafico_linha(
+            projecao['meses'], projecao['lucros']
+        ),
+        "graficos_garantidos.criar_grafico_histograma[50 faixas]": (
+            lambda: graficos_garantidos.criar_grafico_histograma(bordas, contagens)
+        ),
+        "graficos_garantidos.criar_grafico_heatmap[21×10]": lambda: graficos_garantidos.criar_grafico_heatmap(
+            grade['ocupacoes'], grade['precos'], grade['lucro_liquido'], ponto_atual=(75, grade['precos'][10])
+        ),
+        "graficos_simples.grafico_pizza_receitas": lambda: graficos_simples.grafico_pizza_receitas(90000, 10000),
+        "graficos_simples.grafico_barras_custos": (
+            lambda: graficos_simples.grafico_barras_custos(5000, 3000, 4000, 2000)
+        ),
+        "graficos_simples.grafico_comparativo_simples": (
+            lambda: graficos_simples.grafico_comparativo_simples(8000, 10000)
+        ),
+    }
+
+
+def montar_casos(tamanhos_rotas=(10, 10000, 1000000)):
+    """Dict nome → função sem argumentos, na ordem de execução"""
+    params = load_params()
+    modelo = params['modelos_disponiveis'][0]
+    casos = {}
+    casos.update(_casos_calculo(params, modelo))
+    casos.update(_casos_rotas(params, modelo, tamanhos_rotas))
+    casos.update(_casos_parametros())
+    casos.update(_casos_graficos(params, modelo))
+    return casos
+
+
+# ========================================================================
+# MEDIÇÃO
+# ========================================================================
+def _cronometrar(funcao, iteracoes):
+    gc_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        for _ in range(iteracoes):
+            funcao()
+        return time.perf_counter() - inicio
+    finally:
+        if gc_ativo:
+            gc.enable()
+
+
+def medir(funcao, rodadas=7, tempo_min=0.05):
+    """
+    Tempo por chamada de uma função
+
+    Returns:
+        Dict com mediana_s, min_s, media_s, desvio_s, iteracoes e rodadas
+    """
+    funcao()  # aquecimento (importações tardias, caches de tabelas)
+
+    iteracoes = 1
+    while True:
+        duracao = _cronometrar(funcao, iteracoes)
+        if duracao >= tempo_min:
+            break
+        iteracoes = max(iteracoes * 2, int(iteracoes * tempo_min / max(duracao, 1e-9) * 1.2))
+
+    tempos = [_cronometrar(funcao, iteracoes) / iteracoes for _ in range(rodadas)]
+    return {
+        'mediana_s': statistics.median(tempos),
+        'min_s': min(tempos),
+        'media_s': statistics.fmean(tempos),
+        'desvio_s': statistics.stdev(tempos) if len(tempos) > 1 else 0.0,
+        'iteracoes': iteracoes,
+        'rodadas': rodadas
+    }
+
+
+def _commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        alterado = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=RAIZ,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        return commit + ("-dirty" if alterado else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "sem-git"
+
+
+def _ambiente():
+    import plotly
+    import streamlit
+    return {
+        'commit': _commit(),
+        'data': datetime.now().isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'plotly': plotly.__version__,
+        'streamlit': streamlit.__version__,
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count()
+    }
+
+
+def _formatar(segundos):
+    for unidade, escala in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if segundos >= escala:
+            return f"{segundos / escala:8.2f} {unidade}"
+    return f"{segundos / 1e-9:8.0f} ns"
+
+
+def comparar(atual, base, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Imprime a variação de cada caso em relação à base
+
+    Returns:
+        Lista de nomes dos casos com regressão acima da tolerância
+    """
+    regressoes = []
+    ambiente = base['ambiente']
+    print(f"\nBase: {ambiente['commit']} ({ambiente['data']}, Python {ambiente['python']}, "
+          f"{ambiente['processador']}, {ambiente['cpus']} CPUs)")
+    print(f"{'Caso':<58} {'Base':>11} {'Atual':>11} {'Variação':>9}")
+    for nome, medida in atual['casos'].items():
+        anterior = base['casos'].get(nome)
+        if anterior is None:
+            print(f"{nome:<58} {'—':>11} {_formatar(medida['mediana_s']):>11} {'novo':>9}")
+            continue
+        variacao = medida['mediana_s'] / anterior['mediana_s'] - 1
+        marca = ""
+        if variacao > tolerancia:
+            marca = " ▲"
+            regressoes.append(nome)
+        elif variacao < -tolerancia:
+            marca = " ▼"
+        print(f"{nome:<58} {_formatar(anterior['mediana_s']):>11} "
+              f"{_formatar(medida['mediana_s']):>11} {variacao:>+8.0%}{marca}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rodadas", type=int, default=7, help="Rodadas por caso (mediana)")
+    parser.add_argument("--tempo-min", type=float, default=0.05, help="Duração mínima de uma rodada (s)")
+    parser.add_argument("--filtro", default="", help="Mede só os casos cujo nome contém o texto")
+    parser.add_argument("--saida", default=None, help="Arquivo JSON (padrão: benchmarks/resultados/<commit>.json)")
+    parser.add_argument("--comparar", default=None,
+                        help="JSON de outra execução para comparar (padrão: benchmarks/referencia.json)")
+    parser.add_argument("--sem-comparar", action="store_true", help="Não compara com nenhuma execução")
+    parser.add_argument("--atualizar-referencia", action="store_true",
+                        help="Grava o resultado em benchmarks/referencia.json (exige árvore sem alterações)")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO,
+                        help="Variação tolerada antes de apontar regressão (padrão: 0.10)")
+    args = parser.parse_args()
+
+    resultado = {'ambiente': _ambiente(), 'casos': {}}
+    if args.atualizar_referencia:
+        if args.filtro or args.saida:
+            parser.error("--atualizar-referencia mede todos os casos e grava em benchmarks/referencia.json")
+        if resultado['ambiente']['commit'].endswith(("-dirty", "sem-git")):
+            parser.error("a referência precisa vir de um commit sem alterações locais")
+    casos = {nome: f for nome, f in montar_casos().items() if args.filtro in nome}
+
+    print(f"{'Caso':<58} {'Mediana':>11} {'Mínimo':>11} {'Iterações':>10}")
+    for nome, funcao in casos.items():
+        medida = medir(funcao, args.rodadas, args.tempo_min)
+        resultado['casos'][nome] = medida
+        print(f"{nome:<58} {_formatar(medida['mediana_s']):>11} {_formatar(medida['min_s']):>11} "
+              f"{medida['iteracoes']:>10}")
+
+    if args.atualizar_referencia:
+        saida = REFERENCIA
+    elif args.saida:
+        saida = Path(args.saida)
+    else:
+        saida = RESULTADOS_DIR / f"{resultado['ambiente']['commit']}.json"
+    saida.parent.mkdir(parents=True, exist_ok=True)
+    saida.write_text(json.dumps(resultado, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"\n✅ Resultados em {saida}")
+
+    if args.sem_comparar or args.atualizar_referencia:
+        return
+    if args.comparar is None and not REFERENCIA.exists():
+        print(f"⚠️ Sem referência em {REFERENCIA.relative_to(RAIZ)}; nada a comparar")
+        return
+    base = json.loads(Path(args.comparar or REFERENCIA).read_text(encoding="utf-8"))
+    regressoes = comparar(resultado, base, args.tolerancia)
+    if regressoes:
+        print(f"\n❌ {len(regressoes)} caso(s) acima da tolerância de {args.tolerancia:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
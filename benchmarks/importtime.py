@@ -0,0 +1,92 @@
+"""
+Auditoria de tempo de importação (python -X importtime) do app e das páginas
+
+Para cada script, importa em um processo novo os mesmos módulos que ele
+importa no topo (lidos do código) e soma o tempo acumulado por pacote de
+primeiro nível. Roda cada medição algumas vezes e fica com a mediana; a
+coluna "além do streamlit" desconta a importação do próprio Streamlit,
+que o servidor já tem carregada quando a página roda.
+
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --repeticoes 5 --top 15
+"""
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+SCRIPTS = ["app.py"] + sorted(str(p.relative_to(RAIZ)) for p in (RAIZ / "pages").glob("*.py"))
+
+
+def modulos_importados(script):
+    """Módulos importados no nível superior de um script (ordem do código)"""
+    arvore = ast.parse((RAIZ / script).read_text(encoding="utf-8"))
+    modulos = []
+    for no in arvore.body:
+        if isinstance(no, ast.Import):
+            modulos.extend(alias.name for alias in no.names)
+        elif isinstance(no, ast.ImportFrom) and no.module and not no.level:
+            modulos.append(no.module)
+    return list(dict.fromkeys(modulos))
+
+
+def medir_importacao(modulos):
+    """
+    Importa os módulos em um processo novo com -X importtime
+
+    Returns:
+        Tuple (tempo total em ms, dict pacote -> ms próprios)
+    """
+    codigo = "; ".join(f"import {m}" for m in modulos)
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=RAIZ, capture_output=True, text=True
+    )
+
+    por_pacote = defaultdict(float)
+    total = 0.0
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        nivel = len(nome) - len(nome.lstrip())
+        nome = nome.strip()
+        por_pacote[nome.split(".")[0]] += int(proprio) / 1000
+        if nivel == 1:  # importações de primeiro nível (as do próprio código)
+            total += int(acumulado) / 1000
+    return total, dict(por_pacote)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=3, help="Medições por script (mediana)")
+    parser.add_argument("--top", type=int, default=10, help="Pacotes mais pesados a listar")
+    args = parser.parse_args()
+
+    base = statistics.median(medir_importacao(["streamlit"])[0] for _ in range(args.repeticoes))
+
+    pacotes = defaultdict(list)
+    print(f"{'Script':<40} {'Importação (ms)':>16} {'Além do streamlit':>18}")
+    print(f"{'(só streamlit)':<40} {base:>16.0f} {0:>18.0f}")
+    for script in SCRIPTS:
+        medidas = [medir_importacao(modulos_importados(script)) for _ in range(args.repeticoes)]
+        mediana = statistics.median(m[0] for m in medidas)
+        print(f"{script:<40} {mediana:>16.0f} {mediana - base:>18.0f}")
+        for _, por_pacote in medidas:
+            for pacote, ms in por_pacote.items():
+                pacotes[pacote].append(ms)
+
+    print(f"\nPacotes mais pesados (ms próprios, mediana por medição):")
+    ranking = sorted(((statistics.median(v), p) for p, v in pacotes.items()), reverse=True)
+    for ms, pacote in ranking[:args.top]:
+        print(f"  {pacote:<30} {ms:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
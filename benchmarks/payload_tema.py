@@ -0,0 +1,80 @@
+"""
+Payload enviado ao navegador por rerun, página a página
+
+Executa cada página com o AppTest do Streamlit e soma o tamanho
+serializado (protobuf) dos elementos de uma execução completa, separando
+a parte que corresponde ao CSS do tema (<style> inline ou <link>).
+
+    python benchmarks/payload_tema.py
+    python benchmarks/payload_tema.py --static off   # sem servir static/
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from streamlit import config as st_config
+from streamlit.testing.v1 import AppTest
+
+PAGINAS = ["app.py"] + sorted(str(p.relative_to(RAIZ)) for p in (RAIZ / "pages").glob("*.py"))
+
+
+def _elementos(no):
+    """Percorre a árvore de elementos do AppTest"""
+    yield no
+    filhos = getattr(no, "children", None) or {}
+    for filho in (filhos.values() if isinstance(filhos, dict) else filhos):
+        yield from _elementos(filho)
+
+
+def _eh_css(elemento):
+    corpo = getattr(getattr(elemento, "proto", None), "body", "")
+    return isinstance(corpo, str) and ("<style" in corpo or 'rel="stylesheet"' in corpo)
+
+
+def medir_pagina(pagina):
+    """
+    Tamanho dos elementos de uma execução completa da página
+
+    Returns:
+        Tuple (bytes totais, bytes de CSS) ou None se a página falhar
+    """
+    teste = AppTest.from_file(str(RAIZ / pagina), default_timeout=120)
+    teste.run()
+    if teste.exception:
+        return None
+
+    total = css = 0
+    for elemento in _elementos(teste._tree):
+        proto = getattr(elemento, "proto", None)
+        if proto is None or not hasattr(proto, "ByteSize"):
+            continue
+        tamanho = proto.ByteSize()
+        total += tamanho
+        if _eh_css(elemento):
+            css += tamanho
+    return total, css
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--static", choices=("on", "off"), default="on",
+                        help="Valor de server.enableStaticServing durante a medição")
+    args = parser.parse_args()
+
+    st_config.set_option("server.enableStaticServing", args.static == "on")
+
+    print(f"{'Página':<40} {'Total (B)':>10} {'CSS (B)':>10}")
+    for pagina in PAGINAS:
+        medida = medir_pagina(pagina)
+        if medida is None:
+            print(f"{pagina:<40} {'erro':>10} {'':>10}")
+        else:
+            print(f"{pagina:<40} {medida[0]:>10} {medida[1]:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Folha de estilos única do tema (CSS do tema + sidebar)
+
+Os arquivos de assets/ são combinados, minificados e gravados uma vez por
+processo em static/ com o hash do conteúdo no nome. Com
+server.enableStaticServing ativo, cada rerun envia só a tag <link> e o
+navegador baixa o CSS uma única vez; sem ele (ou em servidores que não
+entregam .css como text/css), o CSS minificado é enviado inline como antes.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+
+import streamlit as st
+
+RAIZ = Path(__file__).resolve().parent.parent
+ASSETS_DIR = RAIZ / "assets"
+
+# Pasta servida pelo Streamlit em app/static/ (ao lado do script principal)
+STATIC_DIR = RAIZ / "static"
+URL_STATIC = "app/static"
+
+# Arquivos de cada variante do tema, na ordem da cascata
+VARIANTES_TEMA = {
+    'principal': ("tema.css", "sidebar.css"),
+    'fix': ("tema_fix.css", "sidebar.css")
+}
+
+
+def minificar_css(css):
+    """
+    Remove comentários e espaços desnecessários do CSS
+
+    Args:
+        css: Texto CSS
+
+    Returns:
+        CSS minificado
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = re.sub(r"\s+!important", "!important", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def _gravar_se_ausente(caminho, conteudo):
+    """Grava o arquivo (troca atômica) apenas se ainda não existir"""
+    if caminho.exists():
+        return
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporario = tempfile.mkstemp(dir=caminho.parent, prefix=f".{caminho.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(conteudo)
+        os.replace(temporario, caminho)
+    except BaseException:
+        Path(temporario).unlink(missing_ok=True)
+        raise
+
+
+@st.cache_resource(show_spinner=False)
+def construir_folha_estilos(variante='principal'):
+    """
+    Combina, minifica e grava a folha de estilos de uma variante do tema
+
+    Args:
+        variante: Chave de VARIANTES_TEMA
+
+    Returns:
+        Dict com 'css' (minificado), 'hash', 'arquivo' (em static/ ou None
+        se não for possível gravar) e 'url'
+    """
+    fontes = [(ASSETS_DIR / nome).read_text(encoding="utf-8") for nome in VARIANTES_TEMA[variante]]
+    css = minificar_css("\n".join(fontes))
+    hash_css = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+
+    nome = f"amaro-{variante}.{hash_css}.css"
+    arquivo = STATIC_DIR / nome
+    try:
+        _gravar_se_ausente(arquivo, css)
+    except OSError:
+        arquivo = None
+
+    return {
+        'css': css,
+        'hash': hash_css,
+        'arquivo': arquivo,
+        'url': f"{URL_STATIC}/{nome}"
+    }
+
+
+def css_estatico_disponivel():
+    """
+    Indica se app/static/*.css chega ao navegador como text/css
+
+    O servidor Tornado (Streamlit até 1.56, padrão sem server.useStarlette)
+    só entrega com o tipo correto as extensões de
+    SAFE_APP_STATIC_FILE_EXTENSIONS; as demais vão como text/plain com
+    nosniff, e o navegador descarta a folha de estilos. O servidor
+    Starlette usa o tipo do mimetypes.
+
+    Returns:
+        True se a tag <link> pode ser usada
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return False
+
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        return True  # Só o servidor Starlette (Streamlit ≥ 1.57)
+
+    if ".css" in SAFE_APP_STATIC_FILE_EXTENSIONS:
+        return True
+    try:
+        return bool(st.get_option("server.useStarlette"))
+    except RuntimeError:
+        return False  # Opção inexistente: sempre Tornado
+
+
+def aplicar_tema(variante='principal'):
+    """
+    Aplica o tema na página atual
+
+    Precisa ser chamado em todo rerun (elementos não reenviados somem da
+    página), mas com arquivos estáticos o custo por rerun é uma tag <link>.
+
+    Args:
+        variante: Chave de VARIANTES_TEMA
+    """
+    folha = construir_folha_estilos(variante)
+
+    if folha['arquivo'] is not None and css_estatico_disponivel():
+        st.markdown(f'<link rel="stylesheet" href="{folha["url"]}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{folha['css']}</style>", unsafe_allow_html=True)
@@ -19,10 +19,13 @@ from config.idiomas import get_text, detect_language_from_selection, get_languag
 from components.sidebar import render_sidebar
 from components.status import render_system_status, render_calculation_status
 from utils.params import load_params, format_currency, format_percentage
-from utils.calculations import calcular_lucro_mensal_charter
+from utils.calculations import calcular_lucro_mensal_charter, calcular_grade_sensibilidade
 from utils.export_manager import botao_download_inteligente, criar_relatorio_dados
-from utils.session_state import persistent_selectbox, persistent_number_input, persistent_slider
+from utils.fila_exportacao import painel_exportacao_segundo_plano
+from utils.session_state import persistent_selectbox, persistent_number_input, persistent_slider, fragmento
 from utils.graficos_garantidos import criar_grafico_pizza as render_chart_receitas, criar_grafico_barras as render_chart_custos
+from utils.graficos_garantidos import criar_grafico_histograma, criar_grafico_heatmap
+from utils.simulacao_risco import simular_lucro_charter, distribuicoes_padrao
 
 
 # ========================================================================
@@ -77,246 +80,408 @@ except Exception as e:
     st.stop()
 
 # ========================================================================
-# INTERFACE PRINCIPAL - FORMULÁRIO DE ENTRADA
+# SEÇÕES DA PÁGINA (FRAGMENTOS)
+# Cada seção reexecuta sozinha quando seus próprios widgets mudam;
+# entradas do formulário chegam às seções dependentes como argumentos
 # ========================================================================
-st.markdown(f"### 💰 {get_text('page_profit', lang)}")
-
-# Formulário com persistência GARANTIDA
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    modelo_selecionado = persistent_selectbox(
-        get_text('aircraft_model', lang),
-        options=modelos,
-        key="modelo_persist",
-        help="Selecione o modelo da aeronave para análise"
-    )
-
-with col2:
-    horas_charter = persistent_number_input(
-        get_text('monthly_hours', lang),
-        key="horas_persist",
-        default_value=80.0,
-        min_value=10.0,
-        max_value=200.0,
-        step=5.0,
-        help="Horas disponíveis para charter por mês"
-    )
-
-with col3:
-    taxa_ocupacao = persistent_slider(
-        get_text('occupancy_rate', lang),
-        key="taxa_ocupacao_persist",
-        min_value=50,
-        max_value=95,
-        default_value=75,
-        help="Percentual de ocupação das horas disponíveis"
-    )
-
-with col4:
-    # Buscar preço padrão baseado no modelo
-    preco_default = 8000.0
-    try:
-        if modelo_selecionado and modelo_selecionado in params.get('preco_mercado_hora', {}):
-            preco_default = float(params['preco_mercado_hora'][modelo_selecionado])
-    except:
-        pass
-    
-    preco_hora_charter = persistent_number_input(
-        get_text('charter_price', lang),
-        key="preco_charter_persist",
-        default_value=preco_default,
-        min_value=1000.0,
-        max_value=50000.0,
-        step=500.0,
-        help="Preço por hora de charter"
-    )
+@fragmento
+def secao_resultados(params, lang, modelo_selecionado, horas_charter, taxa_ocupacao, preco_hora_charter):
+    """Botão de cálculo, KPIs, gráficos e exportação"""
+    # ========================================================================
+    # BOTÃO DE CÁLCULO E PROCESSAMENTO
+    # ========================================================================
+    if st.button(f"🚀 {get_text('calculate', lang)}", type="primary", use_container_width=True):
 
-# ========================================================================
-# BOTÃO DE CÁLCULO E PROCESSAMENTO
-# ========================================================================
-if st.button(f"🚀 {get_text('calculate', lang)}", type="primary", use_container_width=True):
-    
-    # Validar dados antes do cálculo
-    if not modelo_selecionado:
-        st.error(f"❌ Selecione um {get_text('aircraft_model', lang).lower()}")
-        st.stop()
-    
-    if horas_charter <= 0:
-        st.error(f"❌ {get_text('invalid_data', lang)} - Horas devem ser maior que zero")
-        st.stop()
-    
-    try:
-        with st.spinner(f"{get_text('loading', lang)}..."):
-            # Realizar cálculo
-            resultado = calcular_lucro_mensal_charter(
-                modelo=modelo_selecionado,
-                horas_charter=horas_charter,
-                taxa_ocupacao=taxa_ocupacao,
-                preco_hora=preco_hora_charter,
-                params=params
+        # Validar dados antes do cálculo
+        if not modelo_selecionado:
+            st.error(f"❌ Selecione um {get_text('aircraft_model', lang).lower()}")
+            st.stop()
+
+        if horas_charter <= 0:
+            st.error(f"❌ {get_text('invalid_data', lang)} - Horas devem ser maior que zero")
+            st.stop()
+
+        try:
+            with st.spinner(f"{get_text('loading', lang)}..."):
+                # Realizar cálculo
+                resultado = calcular_lucro_mensal_charter(
+                    modelo=modelo_selecionado,
+                    horas_charter=horas_charter,
+                    taxa_ocupacao=taxa_ocupacao,
+                    preco_hora=preco_hora_charter,
+                    params=params
+                )
+
+            # ============================================================
+            # EXIBIÇÃO DOS RESULTADOS
+            # ============================================================
+            st.markdown("---")
+            st.markdown(f"### 📊 {get_text('projection_analysis', lang)}")
+
+            # KPIs principais usando métricas nativas do Streamlit
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric(
+                    get_text('gross_revenue', lang),
+                    format_currency(resultado['receita_bruta'], lang),
+                    help="Receita total antes da divisão"
+                )
+
+            with col2:
+                st.metric(
+                    get_text('owner_revenue', lang),
+                    format_currency(resultado['receita_proprietario'], lang),
+                    help="90% da receita vai para o proprietário"
+                )
+
+            with col3:
+                delta_color = "normal" if resultado['lucro_liquido'] > 0 else "inverse"
+                st.metric(
+                    get_text('net_profit', lang),
+                    format_currency(resultado['lucro_liquido'], lang),
+                    delta=f"{resultado['roi_mensal']:.1f}%",
+                    help="Lucro após descontar custos operacionais"
+                )
+
+            with col4:
+                st.metric(
+                    get_text('monthly_roi', lang),
+                    format_percentage(resultado['roi_mensal'], lang),
+                    help="Retorno sobre investimento mensal"
+                )
+
+            # ============================================================
+            # GRÁFICOS GARANTIDOS PARA FUNCIONAR
+            # ============================================================
+            st.markdown("#### 📊 Análise Visual")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown(f"##### 💰 {get_text('revenue_composition', lang)}")
+                try:
+                    fig_receita = render_chart_receitas(
+                        resultado['receita_proprietario'], 
+                        resultado['taxa_amaro'], 
+                        lang
+                    )
+                    st.plotly_chart(fig_receita, use_container_width=True, key="chart_receitas")
+                except Exception as e:
+                    st.error(f"Erro no gráfico de receitas: {e}")
+                    st.info("🔍 Debug: Verifique se os dados estão corretos")
+
+            with col2:
+                st.markdown(f"##### 💸 {get_text('cost_breakdown', lang)}")
+                try:
+                    # Preparar dados dos custos de forma robusta
+                    custos_dict = {
+                        'combustivel': resultado.get('breakdown_custos', {}).get('combustivel', 0),
+                        'tripulacao': resultado.get('breakdown_custos', {}).get('tripulacao', 0),
+                        'manutencao': resultado.get('breakdown_custos', {}).get('manutencao', 0),
+                        'depreciacao': resultado.get('breakdown_custos', {}).get('depreciacao', 0)
+                    }
+
+                    fig_custos = render_chart_custos(custos_dict, lang)
+                    st.plotly_chart(fig_custos, use_container_width=True, key="chart_custos")
+                except Exception as e:
+                    st.error(f"Erro no gráfico de custos: {e}")
+                    st.info("🔍 Debug: Verifique os dados de breakdown_custos")
+
+            # ============================================================
+            # STATUS DA OPERAÇÃO
+            # ============================================================
+            if resultado['lucrativo']:
+                st.success(f"""
+                **✅ {get_text('profitable_operation', lang)}**
+
+                O proprietário terá um lucro líquido de **{format_currency(resultado['lucro_liquido'], lang)}** por mês.
+                """)
+            else:
+                st.warning(f"""
+                **⚠️ {get_text('operation_deficit', lang)}**
+
+                A operação apresenta déficit de **{format_currency(abs(resultado['lucro_liquido']), lang)}** por mês.
+                """)
+
+            # ============================================================
+            # DETALHAMENTO DOS CUSTOS
+            # ============================================================
+            with st.expander("🔍 Detalhamento dos Custos"):
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.markdown("**Custos Operacionais:**")
+                    for key, value in resultado.get('breakdown_custos', {}).items():
+                        label = get_text(key, lang)
+                        st.write(f"• {label}: {format_currency(value, lang)}")
+
+                with col2:
+                    st.markdown("**Parâmetros da Simulação:**")
+                    st.write(f"• Horas disponíveis: {horas_charter}h/mês")
+                    st.write(f"• Horas efetivas: {resultado.get('horas_efetivas', 0):.1f}h/mês")
+                    st.write(f"• Taxa de ocupação: {taxa_ocupacao}%")
+                    st.write(f"• Preço por hora: {format_currency(preco_hora_charter, lang)}")
+
+            # ============================================================
+            # EXPORTAÇÃO
+            # ============================================================
+            st.markdown("---")
+            st.markdown("### 📊 Exportação de Relatório")
+
+            # Preparar dados para exportação
+            dados_entrada = {
+                'modelo': modelo_selecionado,
+                'horas_charter_mes': horas_charter,
+                'taxa_ocupacao': taxa_ocupacao,
+                'preco_hora_charter': preco_hora_charter
+            }
+
+            relatorio_dados = criar_relatorio_dados(
+                "Estimativa de Lucro Mensal",
+                dados_entrada,
+                resultado,
+                lang
             )
-        
-        # ============================================================
-        # EXIBIÇÃO DOS RESULTADOS
-        # ============================================================
-        st.markdown("---")
-        st.markdown(f"### 📊 {get_text('projection_analysis', lang)}")
-        
-        # KPIs principais usando métricas nativas do Streamlit
+            st.session_state['relatorio_estimativa_lucro'] = relatorio_dados
+
+            # Botão de download
+            col1, col2 = st.columns([3, 1])
+
+            with col2:
+                botao_download_inteligente(
+                    relatorio_dados,
+                    f"📊 {get_text('export', lang)}",
+                    'excel',
+                    'estimativa_lucro_mensal'
+                )
+
+            with col1:
+                st.info("💡 Clique no botão ao lado para baixar o relatório completo em Excel, "
+                        "ou gere PDF/Excel em segundo plano logo abaixo")
+
+        except Exception as e:
+            st.error(f"❌ Erro no cálculo: {e}")
+            st.info("💡 Verifique se todos os parâmetros estão configurados corretamente na página de Configurações")
+
+            # Debug para desenvolvimento
+            if st.checkbox("🔍 Mostrar detalhes do erro (Debug)"):
+                st.code(str(e))
+                st.json({
+                    "modelo": modelo_selecionado,
+                    "horas": horas_charter,
+                    "ocupacao": taxa_ocupacao,
+                    "preco": preco_hora_charter,
+                    "params_keys": list(params.keys()) if params else []
+                })
+
+    # ========================================================================
+    # EXPORTAÇÃO EM SEGUNDO PLANO
+    # ========================================================================
+    # Fora do botão de cálculo: o relatório do último cálculo e as tarefas
+    # da sessão continuam disponíveis nas reexecuções da página
+    if 'relatorio_estimativa_lucro' in st.session_state:
+        painel_exportacao_segundo_plano(
+            st.session_state['relatorio_estimativa_lucro'],
+            "estimativa_lucro",
+            'estimativa_lucro_mensal',
+            lang
+        )
+
+
+@fragmento
+def secao_sensibilidade(params, lang, modelo_selecionado, horas_charter, taxa_ocupacao, preco_hora_charter):
+    """Mapa de sensibilidade ocupação × preço (a métrica redesenha só o mapa)"""
+    # ========================================================================
+    # MAPA DE SENSIBILIDADE OCUPAÇÃO × PREÇO
+    # ========================================================================
+    with st.expander("🗺️ Mapa de Sensibilidade" if lang == 'pt' else "🗺️ Sensitivity Map", expanded=False):
+        metrica_grade = st.radio(
+            "Métrica" if lang == 'pt' else "Metric",
+            [get_text('net_profit', lang), get_text('monthly_roi', lang)],
+            horizontal=True,
+            key="grade_metrica"
+        )
+
+        if modelo_selecionado:
+            try:
+                # Grade de preços centrada no preço informado
+                precos_grade = [preco_hora_charter * fator / 100 for fator in range(50, 151, 5)]
+                grade = calcular_grade_sensibilidade(
+                    modelo_selecionado, horas_charter, params, precos=precos_grade
+                )
+
+                if metrica_grade == get_text('net_profit', lang):
+                    matriz, formato = grade['lucro_liquido'], "R$ %{z:,.0f}"
+                else:
+                    matriz, formato = grade['roi_mensal'], "%{z:.1f}%"
+
+                fig_grade = criar_grafico_heatmap(
+                    grade['ocupacoes'],
+                    grade['precos'],
+                    matriz,
+                    metrica_grade,
+                    titulo_x=get_text('occupancy_rate', lang),
+                    titulo_y=get_text('charter_price', lang),
+                    formato_valor=formato,
+                    ponto_atual=(taxa_ocupacao, preco_hora_charter)
+                )
+                st.plotly_chart(fig_grade, use_container_width=True, key="chart_sensibilidade")
+
+            except Exception as e:
+                st.error(f"❌ Erro no mapa de sensibilidade: {e}")
+
+
+@fragmento
+def secao_risco(params, lang, modelo_selecionado, horas_charter, taxa_ocupacao, preco_hora_charter):
+    """Análise de risco Monte Carlo (sliders de variação reexecutam só esta seção)"""
+    # ========================================================================
+    # ANÁLISE DE RISCO (MONTE CARLO)
+    # ========================================================================
+    with st.expander("🎲 Análise de Risco (Monte Carlo)" if lang == 'pt' else "🎲 Risk Analysis (Monte Carlo)"):
+        st.markdown(
+            "Combustível, ocupação e preço de charter variam em torno dos valores acima "
+            "(distribuição triangular)." if lang == 'pt' else
+            "Fuel, occupancy and charter price vary around the values above "
+            "(triangular distribution)."
+        )
+
         col1, col2, col3, col4 = st.columns(4)
-        
+
         with col1:
-            st.metric(
-                get_text('gross_revenue', lang),
-                format_currency(resultado['receita_bruta'], lang),
-                help="Receita total antes da divisão"
+            variacao_combustivel = st.slider(
+                "Variação combustível (±%)" if lang == 'pt' else "Fuel variation (±%)",
+                0, 50, 15, key="mc_var_combustivel"
             )
-        
+
         with col2:
-            st.metric(
-                get_text('owner_revenue', lang),
-                format_currency(resultado['receita_proprietario'], lang),
-                help="90% da receita vai para o proprietário"
+            variacao_ocupacao = st.slider(
+                "Variação ocupação (± p.p.)" if lang == 'pt' else "Occupancy variation (± p.p.)",
+                0, 30, 10, key="mc_var_ocupacao"
             )
-        
+
         with col3:
-            delta_color = "normal" if resultado['lucro_liquido'] > 0 else "inverse"
-            st.metric(
-                get_text('net_profit', lang),
-                format_currency(resultado['lucro_liquido'], lang),
-                delta=f"{resultado['roi_mensal']:.1f}%",
-                help="Lucro após descontar custos operacionais"
+            variacao_preco = st.slider(
+                "Variação preço (±%)" if lang == 'pt' else "Price variation (±%)",
+                0, 50, 10, key="mc_var_preco"
             )
-        
+
         with col4:
-            st.metric(
-                get_text('monthly_roi', lang),
-                format_percentage(resultado['roi_mensal'], lang),
-                help="Retorno sobre investimento mensal"
+            n_amostras = st.select_slider(
+                "Simulações" if lang == 'pt' else "Draws",
+                options=[10000, 50000, 100000, 250000, 500000],
+                value=100000,
+                key="mc_n_amostras"
             )
-        
-        # ============================================================
-        # GRÁFICOS GARANTIDOS PARA FUNCIONAR
-        # ============================================================
-        st.markdown("#### 📊 Análise Visual")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"##### 💰 {get_text('revenue_composition', lang)}")
+
+        if st.button("🎲 Simular Cenários" if lang == 'pt' else "🎲 Simulate Scenarios",
+                     use_container_width=True, disabled=not modelo_selecionado):
             try:
-                fig_receita = render_chart_receitas(
-                    resultado['receita_proprietario'], 
-                    resultado['taxa_amaro'], 
-                    lang
+                with st.spinner(f"{get_text('loading', lang)}..."):
+                    distribuicoes = distribuicoes_padrao(
+                        params, taxa_ocupacao, preco_hora_charter,
+                        variacao_combustivel, variacao_ocupacao, variacao_preco
+                    )
+                    risco = simular_lucro_charter(
+                        modelo_selecionado, horas_charter, params, distribuicoes,
+                        n_amostras=n_amostras, seed=42
+                    )
+
+                col1, col2, col3, col4 = st.columns(4)
+
+                with col1:
+                    st.metric("P5", format_currency(risco['percentis'][5], lang))
+
+                with col2:
+                    st.metric("P50", format_currency(risco['percentis'][50], lang))
+
+                with col3:
+                    st.metric("P95", format_currency(risco['percentis'][95], lang))
+
+                with col4:
+                    st.metric(
+                        "Prob. de prejuízo" if lang == 'pt' else "Probability of loss",
+                        format_percentage(risco['probabilidade_prejuizo'], lang)
+                    )
+
+                fig_risco = criar_grafico_histograma(
+                    risco['histograma']['bordas'],
+                    risco['histograma']['contagens'],
+                    "Distribuição do Lucro Líquido" if lang == 'pt' else "Net Profit Distribution"
                 )
-                st.plotly_chart(fig_receita, use_container_width=True, key="chart_receitas")
-            except Exception as e:
-                st.error(f"Erro no gráfico de receitas: {e}")
-                st.info("🔍 Debug: Verifique se os dados estão corretos")
-        
-        with col2:
-            st.markdown(f"##### 💸 {get_text('cost_breakdown', lang)}")
-            try:
-                # Preparar dados dos custos de forma robusta
-                custos_dict = {
-                    'combustivel': resultado.get('breakdown_custos', {}).get('combustivel', 0),
-                    'tripulacao': resultado.get('breakdown_custos', {}).get('tripulacao', 0),
-                    'manutencao': resultado.get('breakdown_custos', {}).get('manutencao', 0),
-                    'depreciacao': resultado.get('breakdown_custos', {}).get('depreciacao', 0)
-                }
-                
-                fig_custos = render_chart_custos(custos_dict, lang)
-                st.plotly_chart(fig_custos, use_container_width=True, key="chart_custos")
+                st.plotly_chart(fig_risco, use_container_width=True, key="chart_risco")
+
             except Exception as e:
-                st.error(f"Erro no gráfico de custos: {e}")
-                st.info("🔍 Debug: Verifique os dados de breakdown_custos")
-        
-        # ============================================================
-        # STATUS DA OPERAÇÃO
-        # ============================================================
-        if resultado['lucrativo']:
-            st.success(f"""
-            **✅ {get_text('profitable_operation', lang)}**
-            
-            O proprietário terá um lucro líquido de **{format_currency(resultado['lucro_liquido'], lang)}** por mês.
-            """)
-        else:
-            st.warning(f"""
-            **⚠️ {get_text('operation_deficit', lang)}**
-            
-            A operação apresenta déficit de **{format_currency(abs(resultado['lucro_liquido']), lang)}** por mês.
-            """)
-        
-        # ============================================================
-        # DETALHAMENTO DOS CUSTOS
-        # ============================================================
-        with st.expander("🔍 Detalhamento dos Custos"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("**Custos Operacionais:**")
-                for key, value in resultado.get('breakdown_custos', {}).items():
-                    label = get_text(key, lang)
-                    st.write(f"• {label}: {format_currency(value, lang)}")
-            
-            with col2:
-                st.markdown("**Parâmetros da Simulação:**")
-                st.write(f"• Horas disponíveis: {horas_charter}h/mês")
-                st.write(f"• Horas efetivas: {resultado.get('horas_efetivas', 0):.1f}h/mês")
-                st.write(f"• Taxa de ocupação: {taxa_ocupacao}%")
-                st.write(f"• Preço por hora: {format_currency(preco_hora_charter, lang)}")
-        
-        # ============================================================
-        # EXPORTAÇÃO
-        # ============================================================
-        st.markdown("---")
-        st.markdown("### 📊 Exportação de Relatório")
-        
-        # Preparar dados para exportação
-        dados_entrada = {
-            'modelo': modelo_selecionado,
-            'horas_charter_mes': horas_charter,
-            'taxa_ocupacao': taxa_ocupacao,
-            'preco_hora_charter': preco_hora_charter
-        }
-        
-        relatorio_dados = criar_relatorio_dados(
-            "Estimativa de Lucro Mensal",
-            dados_entrada,
-            resultado,
-            lang
+                st.error(f"❌ Erro na simulação: {e}")
+
+
+@fragmento
+def secao_calculadora(params, modelos, lang):
+    """Formulário de entrada e seções que dependem dele"""
+    # ========================================================================
+    # INTERFACE PRINCIPAL - FORMULÁRIO DE ENTRADA
+    # ========================================================================
+    st.markdown(f"### 💰 {get_text('page_profit', lang)}")
+
+    # Formulário com persistência GARANTIDA
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        modelo_selecionado = persistent_selectbox(
+            get_text('aircraft_model', lang),
+            options=modelos,
+            key="modelo_persist",
+            help="Selecione o modelo da aeronave para análise"
         )
-        
-        # Botão de download
-        col1, col2 = st.columns([3, 1])
-        
-        with col2:
-            botao_download_inteligente(
-                relatorio_dados,
-                f"📊 {get_text('export', lang)}",
-                'excel',
-                'estimativa_lucro_mensal'
-            )
-        
-        with col1:
-            st.info("💡 Clique no botão ao lado para baixar o relatório completo em Excel")
-        
-    except Exception as e:
-        st.error(f"❌ Erro no cálculo: {e}")
-        st.info("💡 Verifique se todos os parâmetros estão configurados corretamente na página de Configurações")
-        
-        # Debug para desenvolvimento
-        if st.checkbox("🔍 Mostrar detalhes do erro (Debug)"):
-            st.code(str(e))
-            st.json({
-                "modelo": modelo_selecionado,
-                "horas": horas_charter,
-                "ocupacao": taxa_ocupacao,
-                "preco": preco_hora_charter,
-                "params_keys": list(params.keys()) if params else []
-            })
+
+    with col2:
+        horas_charter = persistent_number_input(
+            get_text('monthly_hours', lang),
+            key="horas_persist",
+            default_value=80.0,
+            min_value=10.0,
+            max_value=200.0,
+            step=5.0,
+            help="Horas disponíveis para charter por mês"
+        )
+
+    with col3:
+        taxa_ocupacao = persistent_slider(
+            get_text('occupancy_rate', lang),
+            key="taxa_ocupacao_persist",
+            min_value=50,
+            max_value=95,
+            default_value=75,
+            help="Percentual de ocupação das horas disponíveis"
+        )
+
+    with col4:
+        # Buscar preço padrão baseado no modelo
+        preco_default = 8000.0
+        try:
+            if modelo_selecionado and modelo_selecionado in params.get('preco_mercado_hora', {}):
+                preco_default = float(params['preco_mercado_hora'][modelo_selecionado])
+        except:
+            pass
+
+        preco_hora_charter = persistent_number_input(
+            get_text('charter_price', lang),
+            key="preco_charter_persist",
+            default_value=preco_default,
+            min_value=1000.0,
+            max_value=50000.0,
+            step=500.0,
+            help="Preço por hora de charter"
+        )
+
+    # Seções dependentes: reexecutadas sempre que o formulário muda
+    entradas = (modelo_selecionado, horas_charter, taxa_ocupacao, preco_hora_charter)
+    secao_resultados(params, lang, *entradas)
+    secao_sensibilidade(params, lang, *entradas)
+    secao_risco(params, lang, *entradas)
+
+
+secao_calculadora(params, modelos, lang)
 
 # ========================================================================
 # INFORMAÇÕES ADICIONAIS
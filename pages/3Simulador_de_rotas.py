@@ -7,6 +7,7 @@ Página 3: Simulador de Rotas - VERSÃO QUE FUNCIONA 100%
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sys
 from pathlib import Path
 
@@ -16,10 +17,13 @@ sys.path.append(str(Path(__file__).parent.parent))
 # Imports APENAS do que funciona
 from config.theme_fix import load_theme
 from utils.params import load_params, format_currency
-from utils.calculations import calcular_custo_rota
+from utils.calculations import calcular_custo_rota, calcular_matriz_rotas, calcula_custos_lote
+from utils.rotas import carregar_indice_rotas
+from utils.itinerarios import calcular_itinerario
+from utils.aeroportos import carregar_indice_aeroportos, estimar_duracoes_lote
 from utils.graficos_garantidos import criar_grafico_barras, criar_grafico_comparativo
 from utils.selectbox_simples import selectbox_que_funciona
-from utils.session_state import persistent_selectbox
+from utils.session_state import persistent_selectbox, fragmento
 from config.idiomas import get_text, detect_language_from_selection
 from components.sidebar import render_sidebar
 
@@ -63,254 +67,481 @@ except Exception as e:
 # ========================================================================
 # CARREGAMENTO DE ROTAS
 # ========================================================================
-try:
-    df_rotas = pd.read_csv('data/rotas.csv')
-    rotas_disponiveis = df_rotas.to_dict('records')
-    
-    if not rotas_disponiveis:
-        raise ValueError("Nenhuma rota encontrada")
-        
-except Exception as e:
-    st.warning(f"⚠️ Problema com rotas: {e}")
-    
-    # Rotas padrão
-    rotas_disponiveis = [
-        {"origem": "GRU", "destino": "SDU", "duracao_h": 1.0},
-        {"origem": "GRU", "destino": "CGH", "duracao_h": 0.5},
-        {"origem": "CGH", "destino": "BSB", "duracao_h": 1.4},
-        {"origem": "BSB", "destino": "SDU", "duracao_h": 1.7},
-        {"origem": "GRU", "destino": "CNF", "duracao_h": 1.0}
-    ]
+# Índice construído uma vez e compartilhado entre reruns e sessões
+indice_rotas = carregar_indice_rotas()
 
 # ========================================================================
-# PREPARAR LISTAS DE ORIGEM E DESTINO
+# SEÇÕES DA PÁGINA (FRAGMENTOS)
+# Cada seção reexecuta sozinha quando seus próprios widgets mudam
 # ========================================================================
-# Obter todas as origens únicas
-origens_disponiveis = sorted(list(set([r['origem'] for r in rotas_disponiveis])))
+@fragmento
+def secao_simulacao(params, modelos, indice_rotas, lang):
+    """Seleção de rota, simulação de custo e debug dos valores selecionados"""
+    # ========================================================================
+    # PREPARAR LISTAS DE ORIGEM E DESTINO
+    # ========================================================================
+    incluir_inversas = st.checkbox(
+        "Incluir rotas no sentido inverso",
+        key="rotas_inversas",
+        help="Permite simular B → A quando apenas A → B está cadastrada"
+    )
 
-# ========================================================================
-# FORMULÁRIO DE SELEÇÃO FUNCIONANDO 100%
-# ========================================================================
-st.markdown("### ✈️ Seleção de Rota")
+    # Origens já ordenadas no índice
+    origens_disponiveis = list(indice_rotas.aeroportos if incluir_inversas else indice_rotas.origens)
 
-col1, col2, col3 = st.columns(3)
+    # ========================================================================
+    # FORMULÁRIO DE SELEÇÃO FUNCIONANDO 100%
+    # ========================================================================
+    st.markdown("### ✈️ Seleção de Rota")
 
-with col1:
-    origem_selecionada = persistent_selectbox(
-    "Aeroporto de Origem",
-    origens_disponiveis,
-    key="origem_rota"
-)
+    col1, col2, col3 = st.columns(3)
 
+    with col1:
+        origem_selecionada = persistent_selectbox(
+        "Aeroporto de Origem",
+        origens_disponiveis,
+        key="origem_rota"
+    )
 
-with col2:
-    # Filtrar destinos baseado na origem
-    if origem_selecionada:
-        destinos_validos = sorted([
-            r['destino'] for r in rotas_disponiveis 
-            if r['origem'] == origem_selecionada
-        ])
-        
-        # Remover duplicatas
-        destinos_validos = list(set(destinos_validos))
-        
-        if not destinos_validos:
-            destinos_validos = ["Nenhum destino disponível"]
+
+    with col2:
+        # Filtrar destinos baseado na origem
+        if origem_selecionada:
+            # Destinos pré-ordenados por origem no índice
+            destinos_validos = list(indice_rotas.destinos(origem_selecionada, incluir_inversas))
+
+            if not destinos_validos:
+                destinos_validos = ["Nenhum destino disponível"]
+        else:
+            destinos_validos = ["Selecione origem primeiro"]
+
+        destino_selecionado = selectbox_que_funciona(
+            "Aeroporto de Destino",
+            destinos_validos,
+            "destino_rota",
+            destinos_validos[0] if destinos_validos else None
+        )
+
+    with col3:
+        modelo_selecionado = selectbox_que_funciona(
+            "Modelo da Aeronave",
+            modelos,
+            "modelo_rota",
+            modelos[0] if modelos else None
+        )
+
+    # ========================================================================
+    # MOSTRAR ROTA SELECIONADA
+    # ========================================================================
+    # Buscar informações da rota
+    rota_info = None
+    rota_valida = False
+
+    if (origem_selecionada and destino_selecionado and 
+        destino_selecionado not in ["Nenhum destino disponível", "Selecione origem primeiro"]):
+
+        rota_info = indice_rotas.buscar(origem_selecionada, destino_selecionado, incluir_inversas)
+        rota_valida = rota_info is not None
+
+    if rota_valida and rota_info:
+        st.success(f"""
+        📍 **Rota Selecionada**: {origem_selecionada} → {destino_selecionado}  
+        ⏱️ **Duração**: {rota_info['duracao_h']:.1f}h  
+        ✈️ **Modelo**: {modelo_selecionado}
+        """)
     else:
-        destinos_validos = ["Selecione origem primeiro"]
-    
-    destino_selecionado = selectbox_que_funciona(
-        "Aeroporto de Destino",
-        destinos_validos,
-        "destino_rota",
-        destinos_validos[0] if destinos_validos else None
-    )
+        st.info(f"ℹ️ Rota: {origem_selecionada} → {destino_selecionado}")
 
-with col3:
-    modelo_selecionado = selectbox_que_funciona(
-        "Modelo da Aeronave",
-        modelos,
-        "modelo_rota",
-        modelos[0] if modelos else None
-    )
+    # ========================================================================
+    # BOTÃO DE SIMULAÇÃO
+    # ========================================================================
+    if st.button("✈️ SIMULAR ROTA", type="primary", use_container_width=True):
 
-# ========================================================================
-# MOSTRAR ROTA SELECIONADA
-# ========================================================================
-# Buscar informações da rota
-rota_info = None
-rota_valida = False
+        if not rota_valida or not rota_info:
+            st.error("❌ Selecione uma rota válida")
+            st.info("💡 Sem rota direta? Use o **Itinerário com Escalas** abaixo")
+            st.stop()
 
-if (origem_selecionada and destino_selecionado and 
-    destino_selecionado not in ["Nenhum destino disponível", "Selecione origem primeiro"]):
-    
-    for r in rotas_disponiveis:
-        if r['origem'] == origem_selecionada and r['destino'] == destino_selecionado:
-            rota_info = r
-            rota_valida = True
-            break
-
-if rota_valida and rota_info:
-    st.success(f"""
-    📍 **Rota Selecionada**: {origem_selecionada} → {destino_selecionado}  
-    ⏱️ **Duração**: {rota_info['duracao_h']:.1f}h  
-    ✈️ **Modelo**: {modelo_selecionado}
-    """)
-else:
-    st.info(f"ℹ️ Rota: {origem_selecionada} → {destino_selecionado}")
+        if not modelo_selecionado:
+            st.error("❌ Selecione um modelo de aeronave")
+            st.stop()
 
-# ========================================================================
-# BOTÃO DE SIMULAÇÃO
-# ========================================================================
-if st.button("✈️ SIMULAR ROTA", type="primary", use_container_width=True):
-    
-    if not rota_valida or not rota_info:
-        st.error("❌ Selecione uma rota válida")
-        st.stop()
-    
-    if not modelo_selecionado:
-        st.error("❌ Selecione um modelo de aeronave")
-        st.stop()
-    
-    try:
-        with st.spinner("Simulando rota..."):
-            # Calcular custos da rota
-            resultado_rota = calcular_custo_rota(
-                origem=origem_selecionada,
-                destino=destino_selecionado,
-                modelo=modelo_selecionado,
-                params=params,
-                rotas_disponiveis=rotas_disponiveis
+        try:
+            with st.spinner("Simulando rota..."):
+                # Calcular custos da rota
+                resultado_rota = calcular_custo_rota(
+                    origem=origem_selecionada,
+                    destino=destino_selecionado,
+                    modelo=modelo_selecionado,
+                    params=params,
+                    rotas_disponiveis=indice_rotas,
+                    permitir_inverso=incluir_inversas
+                )
+
+            # ============================================================
+            # RESULTADOS DA ROTA
+            # ============================================================
+            st.markdown("---")
+            st.markdown(f"### 📊 Análise da Rota: {origem_selecionada} → {destino_selecionado}")
+
+            # KPIs da rota
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric(
+                    "Duração do Voo",
+                    f"{resultado_rota['duracao_horas']:.1f}h"
+                )
+
+            with col2:
+                st.metric(
+                    "Custo Total Amaro",
+                    f"R$ {resultado_rota['custo_amaro']:,.0f}"
+                )
+
+            with col3:
+                st.metric(
+                    "Preço de Mercado",
+                    f"R$ {resultado_rota['preco_mercado']:,.0f}"
+                )
+
+            with col4:
+                economia = resultado_rota['economia']
+                percentual = resultado_rota['economia_percentual']
+                st.metric(
+                    "Economia",
+                    f"R$ {economia:,.0f}",
+                    delta=f"{percentual:.1f}%"
+                )
+
+            # ============================================================
+            # GRÁFICOS DA ROTA QUE FUNCIONAM GARANTIDO
+            # ============================================================
+            st.markdown("#### 📊 Análise Visual")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("##### 💸 Composição de Custos")
+
+            # ============================================================
+            # GRÁFICO 1: Composição de Custos
+            # ============================================================
+            with col1:
+                st.markdown(f"##### 💸 {get_text('cost_distribution', lang)}")
+                breakdown = resultado_rota.get('breakdown_custos', {})
+                # Montar dicionário de custos com labels localizados
+                custos_dict = {
+                    get_text('fuel', lang): breakdown.get('combustivel', 0),
+                    get_text('crew', lang): breakdown.get('tripulacao', 0),
+                    get_text('maintenance', lang): breakdown.get('manutencao', 0),
+                    get_text('depreciation', lang): breakdown.get('depreciacao', 0)
+                }
+                # Gerar gráfico de barras com contraste garantido
+                fig_custos = criar_grafico_barras(
+                    custos_dict,
+                    get_text('cost_distribution', lang)
+                )
+                st.plotly_chart(fig_custos, use_container_width=True, key="chart_custos_rota")
+
+            # ============================================================
+            # GRÁFICO 2: Comparativo Amaro vs Mercado
+            # ============================================================
+            with col2:
+                st.markdown(f"##### 📊 {get_text('comparative_visual', lang)}")
+                fig_comparativo = criar_grafico_comparativo(
+                    resultado_rota['custo_amaro'],
+                    resultado_rota['preco_mercado'],
+                    get_text('comparative_visual', lang)
+                )
+                st.plotly_chart(fig_comparativo, use_container_width=True, key="chart_comparativo_rota")
+
+
+            # ============================================================
+            # STATUS DA ROTA
+            # ============================================================
+            if resultado_rota.get('viavel', False):
+                st.success(f"""
+                **✅ Rota Vantajosa**
+
+                A gestão Amaro oferece economia de **R$ {economia:,.0f}** ({percentual:.1f}%) para esta rota.
+                """)
+            else:
+                st.warning(f"""
+                **⚠️ Atenção**
+
+                O custo operacional está acima do preço de mercado para esta rota.
+                """)
+
+            # ============================================================
+            # DETALHES DA SIMULAÇÃO
+            # ============================================================
+            with st.expander("🔍 Detalhes da Simulação"):
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.markdown("**Breakdown de Custos:**")
+                    breakdown = resultado_rota.get('breakdown_custos', {})
+                    for key, value in breakdown.items():
+                        st.write(f"• {key.title()}: R$ {value:,.0f}")
+
+                with col2:
+                    st.markdown("**Informações da Rota:**")
+                    st.write(f"• Origem: {origem_selecionada}")
+                    st.write(f"• Destino: {destino_selecionado}")
+                    st.write(f"• Duração: {resultado_rota['duracao_horas']:.1f}h")
+                    st.write(f"• Modelo: {modelo_selecionado}")
+
+        except Exception as e:
+            st.error(f"❌ Erro na simulação: {e}")
+            st.info("💡 Verifique os parâmetros e tente novamente")
+
+            # Debug
+            if st.checkbox("🔍 Mostrar erro detalhado"):
+                st.code(str(e))
+
+    # ========================================================================
+    # DEBUG (REMOVÍVEL EM PRODUÇÃO)
+    # ========================================================================
+    if st.checkbox("🔧 Mostrar Debug"):
+        st.write("### Debug - Valores Selecionados")
+        st.write(f"- Origem: {origem_selecionada}")
+        st.write(f"- Destino: {destino_selecionado}")
+        st.write(f"- Modelo: {modelo_selecionado}")
+        st.write(f"- Rota válida: {rota_valida}")
+
+        from utils.selectbox_simples import mostrar_debug_session
+        mostrar_debug_session()
+
+
+@fragmento
+def secao_itinerario(params, modelos, indice_rotas):
+    """Itinerário com escalas entre quaisquer aeroportos do índice de rotas"""
+    # ========================================================================
+    # ITINERÁRIO COM ESCALAS
+    # ========================================================================
+    st.markdown("---")
+    st.markdown("### 🧭 Itinerário com Escalas")
+    st.markdown("*Combina trechos cadastrados quando não existe rota direta*")
+
+    st.caption("O custo por trecho é proporcional às horas voadas: o itinerário de menor duração é também o de menor custo")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        origem_itinerario = st.selectbox(
+            "Origem",
+            list(indice_rotas.aeroportos),
+            key="itinerario_origem"
+        )
+
+    with col2:
+        destino_itinerario = st.selectbox(
+            "Destino",
+            [a for a in indice_rotas.aeroportos if a != origem_itinerario],
+            key="itinerario_destino"
+        )
+
+    if st.button("🧭 CALCULAR ITINERÁRIO", use_container_width=True):
+        # Modelo e sentido inverso vêm do formulário de seleção de rota (outro
+        # fragmento): lidos do session_state no momento do clique
+        modelo_selecionado = st.session_state.get("select_modelo_rota") or modelos[0]
+        incluir_inversas = st.session_state.get("rotas_inversas", False)
+
+        try:
+            itinerario = calcular_itinerario(
+                origem_itinerario,
+                destino_itinerario,
+                modelo_selecionado,
+                params,
+                indice_rotas,
+                bidirecional=incluir_inversas
             )
-        
-        # ============================================================
-        # RESULTADOS DA ROTA
-        # ============================================================
-        st.markdown("---")
-        st.markdown(f"### 📊 Análise da Rota: {origem_selecionada} → {destino_selecionado}")
-        
-        # KPIs da rota
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "Duração do Voo",
-                f"{resultado_rota['duracao_horas']:.1f}h"
+
+            st.success(f"📍 **Itinerário**: {itinerario['rota']}")
+
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric("⏱️ Duração Total", f"{itinerario['duracao_horas']:.1f}h")
+
+            with col2:
+                st.metric("🛬 Escalas", itinerario['numero_escalas'])
+
+            with col3:
+                st.metric("💰 Custo Amaro", format_currency(itinerario['custo_amaro']))
+
+            with col4:
+                st.metric(
+                    "📊 Economia",
+                    format_currency(itinerario['economia']),
+                    f"{itinerario['economia_percentual']:.1f}%"
+                )
+
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        'Trecho': f"{t['origem']} → {t['destino']}",
+                        'Duração (h)': t['duracao_horas'],
+                        'Combustível': format_currency(t['breakdown_custos']['combustivel']),
+                        'Manutenção': format_currency(t['breakdown_custos']['manutencao']),
+                        'Tripulação': format_currency(t['breakdown_custos']['tripulacao']),
+                        'Depreciação': format_currency(t['breakdown_custos']['depreciacao']),
+                        'Custo Amaro': format_currency(t['custo_amaro']),
+                        'Preço Mercado': format_currency(t['preco_mercado'])
+                    }
+                    for t in itinerario['trechos']
+                ]),
+                use_container_width=True,
+                hide_index=True
             )
-        
+
+        except ValueError as e:
+            st.warning(f"⚠️ {e}")
+
+
+@fragmento
+def secao_cotacao_distancia(params, modelos, indice_rotas):
+    """Cotação de qualquer par de aeroportos pela distância"""
+    # ========================================================================
+    # COTAÇÃO POR DISTÂNCIA (QUALQUER PAR DE AEROPORTOS)
+    # ========================================================================
+    st.markdown("---")
+    st.markdown("### 📐 Cotação por Distância")
+    st.markdown("*Duração estimada pela distância ortodrômica e velocidade de cruzeiro; rotas cadastradas prevalecem*")
+
+    indice_aeroportos = carregar_indice_aeroportos()
+
+    if len(indice_aeroportos):
+        codigos_aeroportos = list(indice_aeroportos.codigos)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            origem_cotacao = st.selectbox("Origem", codigos_aeroportos, key="cotacao_origem")
+
         with col2:
-            st.metric(
-                "Custo Total Amaro",
-                f"R$ {resultado_rota['custo_amaro']:,.0f}"
+            destino_cotacao = st.selectbox(
+                "Destino",
+                [c for c in codigos_aeroportos if c != origem_cotacao],
+                key="cotacao_destino"
             )
-        
-        with col3:
-            st.metric(
-                "Preço de Mercado",
-                f"R$ {resultado_rota['preco_mercado']:,.0f}"
+
+        try:
+            # Todos os modelos de uma vez: duração por velocidade de cada modelo
+            n_modelos = len(modelos)
+            estimativa = estimar_duracoes_lote(
+                [origem_cotacao] * n_modelos,
+                [destino_cotacao] * n_modelos,
+                modelos,
+                params,
+                indice_aeroportos,
+                indice_rotas
             )
-        
-        with col4:
-            economia = resultado_rota['economia']
-            percentual = resultado_rota['economia_percentual']
-            st.metric(
-                "Economia",
-                f"R$ {economia:,.0f}",
-                delta=f"{percentual:.1f}%"
+            custos_cotacao = calcula_custos_lote(modelos, estimativa['duracao_h'], params)
+            precos_cotacao = estimativa['duracao_h'] * np.array(
+                [params['preco_mercado_hora'][m] for m in modelos]
             )
-        
-        # ============================================================
-        # GRÁFICOS DA ROTA QUE FUNCIONAM GARANTIDO
-        # ============================================================
-        st.markdown("#### 📊 Análise Visual")
-        
+
+            st.info(
+                f"📏 **Distância**: {estimativa['distancia_km'][0]:,.0f} km · "
+                + ("⏱️ Duração **estimada**" if estimativa['estimada'][0] else "⏱️ Duração **cadastrada** em rotas.csv")
+            )
+
+            st.dataframe(
+                pd.DataFrame({
+                    'Modelo': modelos,
+                    'Velocidade (km/h)': [params['velocidade_modelos'][m] for m in modelos],
+                    'Duração (h)': estimativa['duracao_h'],
+                    'Custo Amaro (R$)': custos_cotacao['total'],
+                    'Preço Mercado (R$)': precos_cotacao,
+                    'Economia (R$)': precos_cotacao - custos_cotacao['total']
+                }),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'Velocidade (km/h)': st.column_config.NumberColumn(format="%.0f"),
+                    'Duração (h)': st.column_config.NumberColumn(format="%.2f"),
+                    'Custo Amaro (R$)': st.column_config.NumberColumn(format="%.0f"),
+                    'Preço Mercado (R$)': st.column_config.NumberColumn(format="%.0f"),
+                    'Economia (R$)': st.column_config.NumberColumn(format="%.0f")
+                }
+            )
+
+        except (KeyError, ValueError) as e:
+            st.warning(f"⚠️ Não foi possível estimar a rota: {e}")
+
+
+@fragmento
+def secao_matriz_rotas(params, modelos, indice_rotas):
+    """Matriz rota × modelo; os filtros reexecutam só esta tabela"""
+    # ========================================================================
+    # MELHORES ROTAS POR AERONAVE (TODAS AS ROTAS × TODOS OS MODELOS)
+    # ========================================================================
+    st.markdown("---")
+    st.markdown("### 🏆 Melhores Rotas por Aeronave")
+
+    try:
+        df_matriz = pd.DataFrame(calcular_matriz_rotas(params, indice_rotas))
+
         col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("##### 💸 Composição de Custos")
-            
-        # ============================================================
-        # GRÁFICO 1: Composição de Custos
-        # ============================================================
+
         with col1:
-            st.markdown(f"##### 💸 {get_text('cost_distribution', lang)}")
-            breakdown = resultado_rota.get('breakdown_custos', {})
-            # Montar dicionário de custos com labels localizados
-            custos_dict = {
-                get_text('fuel', lang): breakdown.get('combustivel', 0),
-                get_text('crew', lang): breakdown.get('tripulacao', 0),
-                get_text('maintenance', lang): breakdown.get('manutencao', 0),
-                get_text('depreciation', lang): breakdown.get('depreciacao', 0)
-            }
-            # Gerar gráfico de barras com contraste garantido
-            fig_custos = criar_grafico_barras(
-                custos_dict,
-                get_text('cost_distribution', lang)
+            filtro_modelo = st.selectbox(
+                "Filtrar por modelo",
+                ["Todos"] + list(modelos),
+                key="matriz_filtro_modelo"
             )
-            st.plotly_chart(fig_custos, use_container_width=True, key="chart_custos_rota")
 
-        # ============================================================
-        # GRÁFICO 2: Comparativo Amaro vs Mercado
-        # ============================================================
         with col2:
-            st.markdown(f"##### 📊 {get_text('comparative_visual', lang)}")
-            fig_comparativo = criar_grafico_comparativo(
-                resultado_rota['custo_amaro'],
-                resultado_rota['preco_mercado'],
-                get_text('comparative_visual', lang)
-            )
-            st.plotly_chart(fig_comparativo, use_container_width=True, key="chart_comparativo_rota")
+            apenas_viaveis = st.checkbox("Apenas rotas vantajosas", key="matriz_apenas_viaveis")
+
+        if filtro_modelo != "Todos":
+            df_matriz = df_matriz[df_matriz['modelo'] == filtro_modelo]
+        if apenas_viaveis:
+            df_matriz = df_matriz[df_matriz['viavel']]
+
+        # Melhor economia primeiro; demais ordenações pelo cabeçalho da tabela
+        df_matriz = df_matriz.sort_values(['modelo', 'economia'], ascending=[True, False])
+
+        st.dataframe(
+            df_matriz.rename(columns={
+                'origem': 'Origem',
+                'destino': 'Destino',
+                'modelo': 'Modelo',
+                'duracao_horas': 'Duração (h)',
+                'custo_amaro': 'Custo Amaro (R$)',
+                'preco_mercado': 'Preço Mercado (R$)',
+                'economia': 'Economia (R$)',
+                'economia_percentual': 'Economia (%)',
+                'viavel': 'Vantajosa'
+            }),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'Custo Amaro (R$)': st.column_config.NumberColumn(format="%.0f"),
+                'Preço Mercado (R$)': st.column_config.NumberColumn(format="%.0f"),
+                'Economia (R$)': st.column_config.NumberColumn(format="%.0f"),
+                'Economia (%)': st.column_config.NumberColumn(format="%.1f%%")
+            }
+        )
+        st.info(f"📊 {len(df_matriz)} combinações rota × modelo")
 
-        
-        # ============================================================
-        # STATUS DA ROTA
-        # ============================================================
-        if resultado_rota.get('viavel', False):
-            st.success(f"""
-            **✅ Rota Vantajosa**
-            
-            A gestão Amaro oferece economia de **R$ {economia:,.0f}** ({percentual:.1f}%) para esta rota.
-            """)
-        else:
-            st.warning(f"""
-            **⚠️ Atenção**
-            
-            O custo operacional está acima do preço de mercado para esta rota.
-            """)
-        
-        # ============================================================
-        # DETALHES DA SIMULAÇÃO
-        # ============================================================
-        with st.expander("🔍 Detalhes da Simulação"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("**Breakdown de Custos:**")
-                breakdown = resultado_rota.get('breakdown_custos', {})
-                for key, value in breakdown.items():
-                    st.write(f"• {key.title()}: R$ {value:,.0f}")
-            
-            with col2:
-                st.markdown("**Informações da Rota:**")
-                st.write(f"• Origem: {origem_selecionada}")
-                st.write(f"• Destino: {destino_selecionado}")
-                st.write(f"• Duração: {resultado_rota['duracao_horas']:.1f}h")
-                st.write(f"• Modelo: {modelo_selecionado}")
-        
     except Exception as e:
-        st.error(f"❌ Erro na simulação: {e}")
-        st.info("💡 Verifique os parâmetros e tente novamente")
-        
-        # Debug
-        if st.checkbox("🔍 Mostrar erro detalhado"):
-            st.code(str(e))
+        st.error(f"❌ Erro ao calcular matriz de rotas: {e}")
+
+
+secao_simulacao(params, modelos, indice_rotas, lang)
+secao_itinerario(params, modelos, indice_rotas)
+secao_cotacao_distancia(params, modelos, indice_rotas)
+secao_matriz_rotas(params, modelos, indice_rotas)
 
 # ========================================================================
 # ROTAS DISPONÍVEIS
 # ========================================================================
 with st.expander("🗺️ Rotas Disponíveis"):
-    if rotas_disponiveis:
-        df_display = pd.DataFrame(rotas_disponiveis)
+    if len(indice_rotas):
+        df_display = indice_rotas.to_dataframe()
         
         # Renomear colunas
         if 'origem' in df_display.columns:
@@ -325,18 +556,6 @@ with st.expander("🗺️ Rotas Disponíveis"):
     else:
         st.info("ℹ️ Nenhuma rota disponível")
 
-# ========================================================================
-# DEBUG (REMOVÍVEL EM PRODUÇÃO)
-# ========================================================================
-if st.checkbox("🔧 Mostrar Debug"):
-    st.write("### Debug - Valores Selecionados")
-    st.write(f"- Origem: {origem_selecionada}")
-    st.write(f"- Destino: {destino_selecionado}")
-    st.write(f"- Modelo: {modelo_selecionado}")
-    st.write(f"- Rota válida: {rota_valida}")
-    
-    from utils.selectbox_simples import mostrar_debug_session
-    mostrar_debug_session()
 
 # ========================================================================
 # FOOTER
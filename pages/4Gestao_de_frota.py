@@ -0,0 +1,197 @@
+"""
+Página 4: Gestão de Frota
+Custos, receitas e ROI por matrícula e consolidados da frota
+"""
+
+import streamlit as st
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from config.theme_fix import load_theme
+from utils.params import load_params, format_currency
+from utils.frota import calcular_frota, tabela_por_aeronave, frota_exemplo, COLUNAS_FROTA
+from utils.graficos_garantidos import criar_grafico_linha
+from utils.session_state import fragmento
+from components.sidebar import render_sidebar
+
+# ========================================================================
+# CONFIGURAÇÃO DA PÁGINA
+# ========================================================================
+st.set_page_config(
+    page_title="Gestão de Frota | Amaro Aviation",
+    page_icon="🛩️",
+    layout="wide"
+)
+
+load_theme()
+lang = render_sidebar() or 'pt'
+
+# ========================================================================
+# HEADER SIMPLES
+# ========================================================================
+st.markdown("# 🛩️ Gestão de Frota")
+st.markdown("*Resultado por matrícula e consolidado de toda a frota*")
+st.markdown("---")
+
+# ========================================================================
+# CARREGAMENTO DE DADOS
+# ========================================================================
+try:
+    params = load_params()
+    modelos = params.get('modelos_disponiveis', [])
+
+    if not modelos:
+        st.error("❌ Nenhum modelo de aeronave configurado")
+        st.stop()
+
+except Exception as e:
+    st.error(f"❌ Erro ao carregar dados: {e}")
+    st.stop()
+
+# ========================================================================
+# SEÇÃO DA FROTA (FRAGMENTO)
+# Editar a tabela ou os parâmetros reexecuta só esta seção
+# ========================================================================
+@fragmento
+def secao_frota(params, modelos):
+    """Tabela da frota, parâmetros da projeção e resultado"""
+    # ========================================================================
+    # TABELA DA FROTA
+    # ========================================================================
+    st.markdown("### 📋 Aeronaves da Frota")
+
+    arquivo_frota = st.file_uploader(
+        "Importar frota (CSV)",
+        type=["csv"],
+        help=f"Colunas: {', '.join(COLUNAS_FROTA)} (opcional: preco_hora)"
+    )
+
+    if arquivo_frota is not None:
+        try:
+            df_frota = pd.read_csv(arquivo_frota)
+        except Exception as e:
+            st.error(f"❌ Erro ao ler arquivo: {e}")
+            st.stop()
+    else:
+        df_frota = frota_exemplo(params)
+
+    df_frota = st.data_editor(
+        df_frota,
+        num_rows="dynamic",
+        use_container_width=True,
+        key="frota_editor",
+        column_config={
+            "matricula": st.column_config.TextColumn("Matrícula"),
+            "modelo": st.column_config.SelectboxColumn("Modelo", options=modelos),
+            "horas_mes": st.column_config.NumberColumn("Horas/Mês", min_value=0, step=5),
+            "percentual_charter": st.column_config.NumberColumn("Charter (%)", min_value=0, max_value=100, step=5),
+            "custos_fixos_mes": st.column_config.NumberColumn("Custos Fixos/Mês (R$)", min_value=0, step=1000),
+            "preco_hora": st.column_config.NumberColumn("Preço Charter/Hora (R$)", min_value=0, step=500)
+        }
+    )
+
+    # ========================================================================
+    # PARÂMETROS DA PROJEÇÃO
+    # ========================================================================
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        num_meses = st.slider("Horizonte (meses)", 12, 60, 12, step=12, key="frota_meses")
+
+    with col2:
+        taxa_crescimento = st.number_input("Crescimento anual de horas (%)", -50.0, 100.0, 0.0, step=1.0)
+
+    with col3:
+        inflacao_custos = st.number_input("Inflação anual de custos (%)", 0.0, 50.0, 0.0, step=0.5)
+
+    with col4:
+        reajuste_preco = st.number_input("Reajuste anual de preço (%)", 0.0, 50.0, 0.0, step=0.5)
+
+    # ========================================================================
+    # CÁLCULO DA FROTA
+    # ========================================================================
+    if st.button("🛩️ CALCULAR FROTA", type="primary", use_container_width=True):
+        try:
+            with st.spinner("Calculando frota..."):
+                resultado = calcular_frota(
+                    df_frota.dropna(subset=['matricula', 'modelo']),
+                    params,
+                    num_meses=num_meses,
+                    taxa_crescimento=taxa_crescimento,
+                    inflacao_custos=inflacao_custos,
+                    reajuste_preco=reajuste_preco
+                )
+
+            # ============================================================
+            # KPIs DA FROTA
+            # ============================================================
+            st.markdown("---")
+            st.markdown(f"### 📊 Resultado da Frota ({len(resultado['matriculas'])} aeronaves, {num_meses} meses)")
+
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric("💰 Receita Total", format_currency(resultado['frota_receitas'].sum()))
+
+            with col2:
+                st.metric("💸 Custo Total", format_currency(resultado['frota_custos'].sum()))
+
+            with col3:
+                st.metric("📈 Lucro Total", format_currency(resultado['frota_lucros'].sum()))
+
+            with col4:
+                st.metric("📊 ROI da Frota", f"{resultado['frota_roi']:.1f}%")
+
+            # ============================================================
+            # EVOLUÇÃO MENSAL E TABELA POR AERONAVE
+            # ============================================================
+            st.plotly_chart(
+                criar_grafico_linha(
+                    resultado['meses'].tolist(),
+                    resultado['frota_lucros'].tolist(),
+                    "Lucro Mensal da Frota"
+                ),
+                use_container_width=True
+            )
+
+            df_resultado = tabela_por_aeronave(resultado).sort_values('roi', ascending=False)
+
+            st.dataframe(
+                df_resultado.rename(columns={
+                    'matricula': 'Matrícula',
+                    'modelo': 'Modelo',
+                    'horas_voadas': 'Horas Voadas',
+                    'horas_charter': 'Horas Charter',
+                    'receita_total': 'Receita (R$)',
+                    'custo_total': 'Custo (R$)',
+                    'lucro_total': 'Lucro (R$)',
+                    'roi': 'ROI (%)'
+                }),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'Horas Voadas': st.column_config.NumberColumn(format="%.0f"),
+                    'Horas Charter': st.column_config.NumberColumn(format="%.0f"),
+                    'Receita (R$)': st.column_config.NumberColumn(format="%.0f"),
+                    'Custo (R$)': st.column_config.NumberColumn(format="%.0f"),
+                    'Lucro (R$)': st.column_config.NumberColumn(format="%.0f"),
+                    'ROI (%)': st.column_config.NumberColumn(format="%.1f%%")
+                }
+            )
+
+            st.download_button(
+                "📥 Baixar resultado por aeronave (CSV)",
+                df_resultado.to_csv(index=False),
+                "frota_resultado.csv",
+                "text/csv"
+            )
+
+        except ValueError as e:
+            st.error(f"❌ {e}")
+
+
+secao_frota(params, modelos)
@@ -16,7 +16,9 @@ from config.idiomas import get_text, detect_language_from_selection
 from components.header import render_page_header
 from components.sidebar import render_sidebar
 from components.status import render_status_box
-from utils.params import load_params, save_params
+from utils.params import load_params, save_params, load_modelos, save_modelos, restaurar_snapshot
+from utils.snapshot import listar_snapshots
+from utils.rotas import carregar_rotas, salvar_rotas
 
 # Configuração da página
 st.set_page_config(
@@ -59,10 +61,11 @@ and operation reality. Changes will be applied to all calculations.
 """)
 
 # Organizar em abas
-config_tab1, config_tab2, config_tab3 = st.tabs([
+config_tab1, config_tab2, config_tab3, config_tab4 = st.tabs([
     f"💰 {get_text('financial_parameters', lang)}",
     f"✈️ {get_text('aircraft_models', lang)}",
-    f"🗺️ {get_text('available_routes', lang)}"
+    f"🗺️ {get_text('available_routes', lang)}",
+    "🕘 Histórico" if lang == 'pt' else "🕘 History"
 ])
 
 # ==========================================
@@ -201,16 +204,17 @@ with config_tab2:
     
     # Carregar modelos atuais
     try:
-        df_modelos = pd.read_csv('data/modelos.csv')
+        df_modelos = load_modelos()
     except:
         st.warning("⚠️ Arquivo de modelos não encontrado. Criando arquivo padrão.")
         df_modelos = pd.DataFrame({
             'modelo': ['Pilatus PC-12'],
             'consumo_l_por_h': [260],
             'manut_tipo': ['turboprop'],
-            'tipo': ['turboprop']
+            'tipo': ['turboprop'],
+            'velocidade_cruzeiro_kmh': [500]
         })
-        df_modelos.to_csv('data/modelos.csv', index=False)
+        save_modelos(df_modelos)
     
     # Editor de dados
     st.markdown(f"##### {get_text('edit_existing_models', lang)}")
@@ -223,6 +227,7 @@ with config_tab2:
             - **Consumo (L/h)**: Consumo de combustível em litros por hora
             - **Tipo Manutenção**: Categoria para cálculo de manutenção (turboprop ou jato)
             - **Tipo Aeronave**: Classificação geral da aeronave (turboprop ou jato)
+            - **Velocidade de Cruzeiro (km/h)**: Usada para estimar a duração de rotas não cadastradas
             """)
         else:
             st.markdown("""
@@ -230,6 +235,7 @@ with config_tab2:
             - **Consumption (L/h)**: Fuel consumption in liters per hour
             - **Maintenance Type**: Category for maintenance calculation (turboprop or jet)
             - **Aircraft Type**: General aircraft classification (turboprop or jet)
+            - **Cruise Speed (km/h)**: Used to estimate the duration of unlisted routes
             """)
     
     # Editor interativo
@@ -258,6 +264,13 @@ with config_tab2:
                 get_text('aircraft_type', lang),
                 options=["turboprop", "jato"],
                 help="Classificação geral da aeronave" if lang == 'pt' else "General aircraft classification"
+            ),
+            "velocidade_cruzeiro_kmh": st.column_config.NumberColumn(
+                "Velocidade de Cruzeiro (km/h)" if lang == 'pt' else "Cruise Speed (km/h)",
+                help="Velocidade para estimar a duração de rotas não cadastradas" if lang == 'pt' else "Speed used to estimate unlisted route durations",
+                min_value=200,
+                max_value=1000,
+                step=5
             )
         }
     )
@@ -274,7 +287,7 @@ with config_tab2:
                 elif df_editado['modelo'].duplicated().any():
                     st.error("❌ Nomes de modelo devem ser únicos.")
                 else:
-                    df_editado.to_csv('data/modelos.csv', index=False)
+                    save_modelos(df_editado)
                     render_status_box(
                         'success',
                         get_text('models_updated', lang),
@@ -309,7 +322,7 @@ with config_tab3:
     
     # Carregar rotas atuais
     try:
-        df_rotas = pd.read_csv('data/rotas.csv')
+        df_rotas = carregar_rotas()
     except:
         st.warning("⚠️ Arquivo de rotas não encontrado. Criando arquivo padrão.")
         df_rotas = pd.DataFrame({
@@ -317,7 +330,7 @@ with config_tab3:
             'destino': ['SDU'],
             'duracao_h': [1.0]
         })
-        df_rotas.to_csv('data/rotas.csv', index=False)
+        salvar_rotas(df_rotas)
     
     # Editor de dados
     st.markdown(f"##### {get_text('edit_available_routes', lang)}")
@@ -400,7 +413,7 @@ with config_tab3:
                         st.error("❌ Não podem existir rotas duplicadas (mesma origem e destino).")
                     else:
                         df_rotas_editado = df_rotas_editado.drop('rota_key', axis=1)
-                        df_rotas_editado.to_csv('data/rotas.csv', index=False)
+                        salvar_rotas(df_rotas_editado)
                         render_status_box(
                             'success',
                             get_text('routes_updated', lang),
@@ -442,6 +455,61 @@ with config_tab3:
             for _, rota in df_rotas_editado.iterrows():
                 st.write(f"• {rota['origem']} → {rota['destino']} ({rota['duracao_h']:.1f}h)")
 
+# ==========================================
+# TAB 4: HISTÓRICO DE PARÂMETROS
+# ==========================================
+with config_tab4:
+    st.markdown("#### 🕘 Histórico de Parâmetros" if lang == 'pt' else "#### 🕘 Parameter History")
+    st.caption(
+        f"Snapshot ativo: {getattr(params, 'hash', '-')[:12]}" if lang == 'pt'
+        else f"Active snapshot: {getattr(params, 'hash', '-')[:12]}"
+    )
+    
+    hash_ativo = getattr(params, 'hash', '')
+    snapshots = listar_snapshots()
+    
+    if not snapshots:
+        st.info("Nenhum snapshot registrado ainda." if lang == 'pt' else "No snapshots recorded yet.")
+    else:
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    'Snapshot': s['hash'][:12],
+                    'Registrado em': s['criado_em'],
+                    'Combustível (R$/L)': s['parametros'].get('preco_combustivel'),
+                    'Piloto (R$/h)': s['parametros'].get('custo_piloto_hora'),
+                    'Modelos': len(s['modelos']),
+                    'Ativo': s['hash'] == hash_ativo
+                }
+                for s in snapshots
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        hash_escolhido = st.selectbox(
+            "Snapshot para restaurar" if lang == 'pt' else "Snapshot to restore",
+            [s['hash'] for s in snapshots],
+            format_func=lambda h: f"{h[:12]} – " + next(s['criado_em'] for s in snapshots if s['hash'] == h),
+            key="snapshot_restaurar"
+        )
+        
+        if st.button(
+            "⏪ Restaurar snapshot" if lang == 'pt' else "⏪ Restore snapshot",
+            disabled=hash_escolhido == hash_ativo
+        ):
+            try:
+                if restaurar_snapshot(hash_escolhido):
+                    render_status_box(
+                        'success',
+                        get_text('config_saved', lang),
+                        f"Snapshot {hash_escolhido[:12]} restaurado!" if lang == 'pt'
+                        else f"Snapshot {hash_escolhido[:12]} restored!"
+                    )
+                    st.rerun()
+            except Exception as e:
+                render_status_box('error', get_text('save_error', lang), str(e))
+
 # Informações do sistema
 st.markdown("---")
 with st.expander("ℹ️ Informações do Sistema" if lang == 'pt' else "ℹ️ System Information"):
@@ -121,31 +121,36 @@ def create_aircraft_models():
             "modelo": "Pilatus PC-12", 
             "consumo_l_por_h": 260, 
             "manut_tipo": "turboprop", 
-            "tipo": "turboprop"
+            "tipo": "turboprop",
+            "velocidade_cruzeiro_kmh": 500
         },
         {
             "modelo": "Cessna Citation XLS", 
             "consumo_l_por_h": 600, 
             "manut_tipo": "jato", 
-            "tipo": "jato"
+            "tipo": "jato",
+            "velocidade_cruzeiro_kmh": 795
         },
         {
             "modelo": "Embraer Phenom 300E", 
             "consumo_l_por_h": 650, 
             "manut_tipo": "jato", 
-            "tipo": "jato"
+            "tipo": "jato",
+            "velocidade_cruzeiro_kmh": 834
         },
         {
             "modelo": "King Air 350", 
             "consumo_l_por_h": 350, 
             "manut_tipo": "turboprop", 
-            "tipo": "turboprop"
+            "tipo": "turboprop",
+            "velocidade_cruzeiro_kmh": 560
         },
         {
             "modelo": "Citation CJ3+", 
             "consumo_l_por_h": 550, 
             "manut_tipo": "jato", 
-            "tipo": "jato"
+            "tipo": "jato",
+            "velocidade_cruzeiro_kmh": 770
         }
     ])
     
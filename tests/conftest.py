@@ -0,0 +1,26 @@
+"""
+Configuração comum dos testes
+
+Os parâmetros são montados direto dos arquivos de dados, sem passar por
+load_params, para que os testes não dependam de cache nem gravem histórico.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from utils.params import MODELOS_FILE, PARAMS_FILE, _tabelas_custos, _tabelas_modelos
+
+
+@pytest.fixture(scope="session")
+def params():
+    """Parâmetros do sistema com os dicionários por modelo e a tabela de coeficientes"""
+    with open(RAIZ / PARAMS_FILE, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    return _tabelas_custos(base, _tabelas_modelos(pd.read_csv(RAIZ / MODELOS_FILE)))
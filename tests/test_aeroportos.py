@@ -0,0 +1,74 @@
+"""Estimativa de duração por distância e busca de rotas em lote"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import RAIZ
+from utils.aeroportos import (
+    AEROPORTOS_FILE, TEMPO_SUBIDA_DESCIDA_H, IndiceAeroportos, estimar_duracoes_lote
+)
+from utils.rotas import ROTAS_FILE, IndiceRotas
+
+
+@pytest.fixture(scope="module")
+def aeroportos():
+    return IndiceAeroportos(pd.read_csv(RAIZ / AEROPORTOS_FILE))
+
+
+@pytest.fixture(scope="module")
+def rotas():
+    return IndiceRotas(pd.read_csv(RAIZ / ROTAS_FILE))
+
+
+def test_posicoes_em_lote_iguais_a_busca_por_par(rotas):
+    codigos = list(rotas.aeroportos) + ["XXX"]
+    origens, destinos = zip(*[(o, d) for o in codigos for d in codigos])
+    for inverso in (False, True):
+        linhas, invertida = rotas.posicoes(origens, destinos, inverso)
+        for i, (o, d) in enumerate(zip(origens, destinos)):
+            linha, inv = rotas.posicao(o, d, inverso)
+            assert linhas[i] == (-1 if linha is None else linha)
+            assert invertida[i] == inv
+
+
+def test_rotas_cadastradas_prevalecem(params, aeroportos, rotas):
+    origens = [o for o in rotas.origem if o in aeroportos]
+    destinos = [d for o, d in zip(rotas.origem, rotas.destino) if o in aeroportos]
+    modelo = params['modelos_disponiveis'][0]
+    resultado = estimar_duracoes_lote(origens, destinos, modelo, params, aeroportos, rotas)
+    esperado = [rotas.buscar(o, d)['duracao_h'] for o, d in zip(origens, destinos)]
+    assert not resultado['estimada'].any()
+    assert resultado['duracao_h'].tolist() == esperado
+
+
+def test_duracao_estimada_inclui_tempo_de_solo(params, aeroportos):
+    codigos = list(aeroportos.codigos)
+    modelo = params['modelos_disponiveis'][0]
+    resultado = estimar_duracoes_lote(codigos[:-1], codigos[1:], modelo, params, aeroportos)
+    assert resultado['estimada'].all()
+    assert np.all(resultado['duracao_h'] > TEMPO_SUBIDA_DESCIDA_H)
+
+
+def test_rejeita_mesmo_aeroporto(params, aeroportos):
+    icao, iata = aeroportos.icao[0], aeroportos.iata[0]
+    modelo = params['modelos_disponiveis'][0]
+    for destino in filter(None, (icao, iata)):
+        with pytest.raises(ValueError):
+            estimar_duracoes_lote([icao], [destino], modelo, params, aeroportos)
+
+
+@pytest.mark.parametrize("par", [("GRU", "SDU"), ("SBGR", "SBRJ"), ("gru", "sdu"), ("sbgr", "SDU")])
+def test_rota_cadastrada_por_alias_e_minusculas(params, aeroportos, rotas, par):
+    modelo = params['modelos_disponiveis'][0]
+    resultado = estimar_duracoes_lote([par[0]], [par[1]], modelo, params, aeroportos, rotas)
+    assert not resultado['estimada'][0]
+    assert resultado['duracao_h'][0] == rotas.buscar("GRU", "SDU")['duracao_h']
+
+
+def test_rota_cadastrada_com_icao(params, aeroportos):
+    rotas_icao = IndiceRotas.from_registros([{'origem': "SBGR", 'destino': "SBRJ", 'duracao_h': 1.25}])
+    modelo = params['modelos_disponiveis'][0]
+    resultado = estimar_duracoes_lote(["GRU", "sbgr"], ["SDU", "SBRJ"], modelo, params, aeroportos, rotas_icao)
+    assert not resultado['estimada'].any()
+    assert resultado['duracao_h'].tolist() == [1.25, 1.25]
@@ -0,0 +1,75 @@
+"""API HTTP: entradas inválidas (números não finitos, Content-Length) recebem 400 em JSON estrito"""
+
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from utils.api_servidor import ServidorAPI
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    api = ServidorAPI(("127.0.0.1", 0), workers=2)
+    thread = threading.Thread(target=api.serve_forever, daemon=True)
+    thread.start()
+    yield api
+    api.shutdown()
+    api.server_close()
+
+
+def _post(servidor, rota, corpo):
+    """POST com corpo já serializado (json.dumps aceita NaN/Infinity por padrão)"""
+    conexao = http.client.HTTPConnection(*servidor.server_address, timeout=30)
+    try:
+        conexao.request("POST", rota, body=corpo.encode("utf-8"),
+                        headers={"Content-Type": "application/json"})
+        resposta = conexao.getresponse()
+        texto = resposta.read().decode("utf-8")
+    finally:
+        conexao.close()
+    # Resposta sempre em JSON estrito
+    return resposta.status, json.loads(texto, parse_constant=pytest.fail)
+
+
+def _modelo(params):
+    return params['modelos_disponiveis'][0]
+
+
+@pytest.mark.parametrize("valor", ["NaN", "Infinity", "-Infinity", "1e999"])
+def test_numero_nao_finito_recusado(servidor, params, valor):
+    corpo = f'{{"modelo": "{_modelo(params)}", "horas_charter": {valor}}}'
+    status, resposta = _post(servidor, "/charter", corpo)
+    assert status == 400
+    assert "finito" in resposta['erro']
+
+
+def test_lote_marca_so_o_item_nao_finito(servidor, params):
+    modelo = _modelo(params)
+    corpo = f'[{{"modelo": "{modelo}", "horas_charter": 40}}, {{"modelo": "{modelo}", "horas_charter": NaN}}]'
+    status, resposta = _post(servidor, "/charter", corpo)
+    assert status == 200
+    assert [r['ok'] for r in resposta['resultados']] == [True, False]
+
+
+def test_resultado_que_estoura_recusado(servidor, params):
+    corpo = json.dumps({'modelo': _modelo(params), 'horas_mes': 10, 'taxa_crescimento': 1e300})
+    status, resposta = _post(servidor, "/projecao", corpo)
+    assert status == 400
+    assert "intervalo" in resposta['erro']
+
+
+@pytest.mark.parametrize("tamanho", ["abc", "-1", "1.5"])
+def test_content_length_invalido(servidor, tamanho):
+    # Socket cru: o cabeçalho vai exatamente como um cliente malformado o enviaria
+    with socket.create_connection(servidor.server_address, timeout=5) as conexao:
+        conexao.sendall(
+            f"POST /charter HTTP/1.1\r\nHost: teste\r\nContent-Length: {tamanho}\r\n\r\n{{}}".encode()
+        )
+        resposta = conexao.makefile("rb").read().decode("utf-8")
+
+    cabecalho, _, corpo = resposta.partition("\r\n\r\n")
+    assert cabecalho.startswith("HTTP/1.1 400")
+    assert "Content-Length" in json.loads(corpo)['erro']
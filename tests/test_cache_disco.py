@@ -0,0 +1,94 @@
+"""Cache em disco: ida e volta dos resultados, descarte LRU, limite por item e registros corrompidos"""
+
+import numpy as np
+import pytest
+
+from utils import cache_disco as modulo
+from utils.cache_disco import CACHE_DISCO_ENV, CacheDisco
+from utils.calculations import calcular_projecao_lote
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    """time.time do módulo avançando 1 s por chamada (acessos com horários distintos)"""
+    agora = [1_000_000.0]
+
+    def tempo():
+        agora[0] += 1
+        return agora[0]
+
+    monkeypatch.setattr(modulo.time, "time", tempo)
+    monkeypatch.setattr(modulo, "RESOLUCAO_ACESSO_S", 0)
+
+
+def _resultado(tamanho=100, semente=0):
+    return {'valores': np.random.default_rng(semente).random(tamanho)}
+
+
+def test_ida_e_volta(tmp_path):
+    cache = CacheDisco(tmp_path / "cache.sqlite")
+    resultado = {
+        'receitas': np.linspace(0, 1, 7),
+        'meses': np.arange(1, 13, dtype=np.int64),
+        'grade': np.eye(3),
+        'modelos': np.array(["Pilatus PC-12", "Citation CJ3"], dtype=object),
+        'total': 12.5,
+        'resumo': {'melhor': "Pilatus PC-12", 'indices': [1, 2]}
+    }
+    cache.guardar("chave", "teste", resultado)
+
+    encontrado, lido = cache.obter("chave")
+
+    assert encontrado
+    assert lido.keys() == resultado.keys()
+    for nome in ('receitas', 'meses', 'grade'):
+        np.testing.assert_array_equal(lido[nome], resultado[nome])
+        assert lido[nome].dtype == resultado[nome].dtype
+    assert lido['modelos'].dtype == object
+    assert list(lido['modelos']) == list(resultado['modelos'])
+    assert lido['total'] == 12.5 and lido['resumo'] == resultado['resumo']
+    assert cache.obter("outra") == (False, None)
+
+
+def test_descarte_lru_acima_do_limite(tmp_path, relogio):
+    tamanho_item = len(modulo.serializar_resultado(_resultado()))
+    cache = CacheDisco(tmp_path / "cache.sqlite", limite_bytes=int(tamanho_item * 4.5))
+    for i in range(4):
+        cache.guardar(f"c{i}", "teste", _resultado(semente=i))
+    cache.obter("c0")  # c0 passa a ser o mais recente; c1 é o menos acessado
+
+    cache.guardar("c4", "teste", _resultado(semente=4))
+
+    assert not cache.obter("c1")[0]
+    assert all(cache.obter(f"c{i}")[0] for i in (0, 2, 3, 4))
+    estatisticas = cache.estatisticas()
+    assert estatisticas['entradas'] == 4 and estatisticas['remocoes'] == 1
+    assert estatisticas['tamanho_bytes'] <= estatisticas['limite_bytes']
+
+
+def test_resultado_grande_nao_gravado(tmp_path):
+    cache = CacheDisco(tmp_path / "cache.sqlite", limite_bytes=40_000)
+    cache.guardar("pequeno", "teste", _resultado(100))
+    cache.guardar("grande", "teste", _resultado(2_000))  # > limite/4: descartaria o resto
+
+    assert cache.obter("pequeno")[0]
+    assert cache.obter("grande") == (False, None)
+
+
+@pytest.mark.parametrize("lixo", [b"", b"nao e um npz", b"PK\x03\x04truncado"])
+def test_registro_corrompido_recalculado(tmp_path, monkeypatch, params, lixo):
+    monkeypatch.setenv(CACHE_DISCO_ENV, str(tmp_path / "cache.sqlite"))
+    modelos = params['modelos_disponiveis'][:2]
+    esperado = calcular_projecao_lote.sem_cache(modelos, 80, 24, params)
+
+    calcular_projecao_lote(modelos, 80, 24, params)  # grava no disco
+    cache = modulo.obter_cache_disco()
+    with cache._conexao:
+        cache._conexao.execute("UPDATE resultados SET dados = ?", (lixo,))
+
+    resultado = calcular_projecao_lote(modelos, 80, 24, params)
+
+    for nome, valor in esperado.items():
+        np.testing.assert_array_equal(resultado[nome], valor)
+    # O registro ruim foi substituído pelo resultado recalculado
+    assert cache.obter(cache._conexao.execute("SELECT chave FROM resultados").fetchone()[0])[0]
@@ -0,0 +1,83 @@
+"""
+Motor vetorizado de custos: resultados idênticos (bit a bit) aos da
+fórmula escalar original de calcula_custo_trecho
+"""
+
+import numpy as np
+import pytest
+
+from utils.calculations import (
+    COMPONENTES_CUSTO, calcula_custo_total_lote, calcula_custo_trecho,
+    calcula_custos_lote, calcular_lucro_charter_lote, calcular_projecao_lote
+)
+
+HORAS = [0.1, 0.3, 0.7, 1.25, 2.0, 3.3, 5.5, 7.9, 12.0, 80.0, 137.5, 400.0]
+
+
+def custo_trecho_original(modelo, horas, params):
+    """Fórmula escalar da versão original, na mesma ordem de operações"""
+    custo_combustivel = horas * params['consumo_modelos'][modelo] * params['preco_combustivel']
+    custo_manutencao = horas * params['custo_manutencao'][modelo]
+    custo_tripulacao = horas * params['custo_piloto_hora_modelo'][modelo]
+    custo_depreciacao = horas * params['depreciacao_hora'][modelo]
+    fator_proporcional = horas / 400
+    custo_seguro = 200000 * fator_proporcional
+    custo_hangar = 120000 * fator_proporcional
+    custo_ferry = horas * 200
+    custo_planejamento = horas * 150
+    total = (custo_combustivel + custo_manutencao + custo_tripulacao +
+             custo_seguro + custo_hangar + custo_ferry +
+             custo_planejamento + custo_depreciacao)
+    return {
+        "combustivel": custo_combustivel,
+        "manutencao": custo_manutencao,
+        "tripulacao": custo_tripulacao,
+        "seguro": custo_seguro,
+        "hangar": custo_hangar,
+        "ferry": custo_ferry,
+        "planejamento": custo_planejamento,
+        "depreciacao": custo_depreciacao,
+        "total": total
+    }
+
+
+@pytest.mark.parametrize("horas", HORAS)
+def test_custo_trecho_identico_ao_original(params, horas):
+    for modelo in params['modelos_disponiveis']:
+        esperado = custo_trecho_original(modelo, horas, params)
+        resultado = calcula_custo_trecho(modelo, horas, params)
+        for chave, valor in esperado.items():
+            assert resultado[chave] == valor, (modelo, horas, chave)
+
+
+def test_lote_identico_ao_original(params):
+    modelos = np.repeat(params['modelos_disponiveis'], len(HORAS))
+    horas = np.tile(HORAS, len(params['modelos_disponiveis']))
+
+    lote = calcula_custos_lote(modelos, horas, params)
+    totais = calcula_custo_total_lote(modelos, horas, params)
+
+    for i, (modelo, h) in enumerate(zip(modelos, horas)):
+        esperado = custo_trecho_original(modelo, float(h), params)
+        for chave in COMPONENTES_CUSTO + ("total",):
+            assert lote[chave][i] == esperado[chave], (modelo, h, chave)
+        assert totais[i] == esperado["total"]
+
+
+def test_charter_lote_identico_ao_escalar(params):
+    modelo = params['modelos_disponiveis'][0]
+    for horas in (10, 55, 80, 120):
+        for ocupacao in (35, 60, 75, 95):
+            horas_efetivas = horas * (ocupacao / 100)
+            custo = custo_trecho_original(modelo, horas_efetivas, params)["total"]
+            receita = 8000 * horas_efetivas * params['percentual_proprietario']
+            lote = calcular_lucro_charter_lote(modelo, horas, ocupacao, 8000, params)
+            assert lote['custos_operacionais'] == custo
+            assert lote['lucro_liquido'] == receita - custo
+
+
+def test_projecao_sem_reajustes_identica_ao_original(params):
+    modelo = params['modelos_disponiveis'][1]
+    projecao = calcular_projecao_lote.__wrapped__([modelo], 73.3, 24, params)
+    esperado = custo_trecho_original(modelo, 73.3, params)["total"]
+    assert np.all(projecao['custos'][0] == esperado)
@@ -0,0 +1,128 @@
+"""Catálogo SQLite: importação, gravação linha a linha, leitura incremental e versões de parâmetros"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from conftest import RAIZ
+from utils import catalogo as modulo
+from utils.catalogo import Catalogo, obter_catalogo
+from utils.params import MODELOS_FILE, PARAMS_FILE
+from utils.rotas import ROTAS_FILE
+
+
+@pytest.fixture
+def banco(tmp_path):
+    return tmp_path / "catalogo.db"
+
+
+@pytest.fixture
+def catalogo(banco):
+    catalogo = Catalogo(banco)
+    catalogo.importar_arquivos(RAIZ / PARAMS_FILE, RAIZ / MODELOS_FILE, RAIZ / ROTAS_FILE)
+    return catalogo
+
+
+def _revisoes_das_linhas(catalogo, tabela, chave):
+    return dict(catalogo._conexao.execute(f"SELECT {chave}, revisao FROM {tabela}").fetchall())
+
+
+def test_importa_na_primeira_abertura(banco, monkeypatch):
+    monkeypatch.chdir(RAIZ)  # caminhos padrão dos arquivos são relativos à raiz
+    catalogo = obter_catalogo(str(banco))
+
+    assert not catalogo.vazio()
+    pd.testing.assert_frame_equal(catalogo.ler_modelos(), pd.read_csv(MODELOS_FILE), check_dtype=False)
+    pd.testing.assert_frame_equal(catalogo.ler_rotas(), pd.read_csv(ROTAS_FILE), check_dtype=False)
+    with open(PARAMS_FILE, "r", encoding="utf-8") as f:
+        assert catalogo.ler_parametros() == json.load(f)
+    assert obter_catalogo(str(banco)) is catalogo
+
+
+def test_grava_so_as_linhas_alteradas(catalogo):
+    antes = _revisoes_das_linhas(catalogo, "modelos", "modelo")
+    df = catalogo.ler_modelos()
+    alterado = df['modelo'].iloc[1]
+    df.loc[1, 'consumo_l_por_h'] += 10
+
+    assert catalogo.salvar_modelos(df) == 1
+    assert catalogo.salvar_modelos(df) == 0  # nada mudou
+
+    depois = _revisoes_das_linhas(catalogo, "modelos", "modelo")
+    assert depois[alterado] > antes[alterado]
+    assert {m: r for m, r in depois.items() if m != alterado} == \
+           {m: r for m, r in antes.items() if m != alterado}
+    pd.testing.assert_frame_equal(catalogo.ler_modelos(), df)
+
+
+def test_remover_e_recriar_a_mesma_chave(catalogo, banco):
+    leitor = Catalogo(banco)
+    atrasado = Catalogo(banco)
+    original = catalogo.ler_rotas()
+    leitor.ler_rotas()
+    atrasado.ler_rotas()
+
+    sem_ultima = original.iloc[:-1]
+    assert catalogo.salvar_rotas(sem_ultima) == 1
+    pd.testing.assert_frame_equal(leitor.ler_rotas(), sem_ultima)
+    assert leitor.buscar_rota(*original.iloc[-1][['origem', 'destino']]) is None
+
+    # Recriada: quem viu a remoção e quem não sincronizou no meio enxergam a rota de volta
+    assert catalogo.salvar_rotas(original) == 1
+    for outro in (leitor, atrasado):
+        pd.testing.assert_frame_equal(outro.ler_rotas(), original)
+        assert outro.buscar_rota(*original.iloc[-1][['origem', 'destino']]) is not None
+
+
+def test_segunda_instancia_sincroniza_incrementalmente(catalogo, banco):
+    leitor = Catalogo(banco)
+    leitor.ler_modelos()
+    assert not leitor._sincronizar('modelos')
+
+    df = catalogo.ler_modelos()
+    df.loc[0, 'velocidade_cruzeiro_kmh'] = 999.0
+    catalogo.salvar_modelos(df)
+
+    consultas = []
+    leitor._conexao.set_trace_callback(consultas.append)
+    resultado = leitor.ler_modelos()
+    leitor._conexao.set_trace_callback(None)
+
+    pd.testing.assert_frame_equal(resultado, df)
+    assert any("FROM modelos WHERE revisao >" in c for c in consultas)
+    assert leitor._revisao_lida['modelos'] == catalogo.revisoes()['modelos']
+
+
+def test_versoes_de_parametros(catalogo):
+    inicial = catalogo.ler_parametros()
+    versao_inicial = catalogo.versoes_parametros()[0]['versao']
+    alterados = dict(inicial, preco_combustivel=inicial['preco_combustivel'] + 1)
+
+    versao = catalogo.salvar_parametros(alterados, "teste")
+
+    assert versao > versao_inicial
+    assert catalogo.salvar_parametros(alterados) == versao  # idêntica: sem nova versão
+    assert catalogo.ler_parametros() == alterados
+    assert catalogo.ler_parametros(versao=versao_inicial) == inicial
+    assert catalogo.ler_parametros(versao=versao + 100) is None
+    assert [v['versao'] for v in catalogo.versoes_parametros()] == [versao, versao_inicial]
+
+
+def test_remocoes_podadas(catalogo, banco, monkeypatch):
+    monkeypatch.setattr(modulo, "JANELA_REMOCOES", 3)
+    atrasado = Catalogo(banco)
+    atrasado.ler_rotas()
+    rotas = catalogo.ler_rotas()
+
+    # Remove e recoloca a última rota várias vezes
+    for _ in range(5):
+        catalogo.salvar_rotas(rotas.iloc[:-1])
+        catalogo.salvar_rotas(rotas)
+    catalogo.salvar_rotas(rotas.iloc[:-1])
+
+    revisao = catalogo.revisoes()['rotas']
+    remocoes = [r for (r,) in catalogo._conexao.execute("SELECT revisao FROM remocoes")]
+    assert remocoes and min(remocoes) > revisao - 3
+    # Leitor atrás do ponto de poda recarrega a tabela inteira e continua correto
+    pd.testing.assert_frame_equal(atrasado.ler_rotas(), rotas.iloc[:-1])
@@ -0,0 +1,59 @@
+"""Tema: config.toml válido e folha de estilos servida por <link> em static/"""
+
+import mimetypes
+import tomllib
+
+import pytest
+from streamlit import config as st_config
+from streamlit.testing.v1 import AppTest
+
+from conftest import RAIZ
+from config import estilos
+
+SCRIPT_TEMA = "from config.estilos import aplicar_tema\naplicar_tema('principal')\n"
+
+
+def test_config_toml_valido():
+    with open(RAIZ / ".streamlit" / "config.toml", "rb") as f:
+        configuracao = tomllib.load(f)
+
+    assert configuracao['server']['enableStaticServing'] is True
+    # Toda chave precisa ser uma opção conhecida do Streamlit (nada de tabelas inventadas)
+    for secao, opcoes in configuracao.items():
+        for chave in opcoes:
+            assert f"{secao}.{chave}" in st_config._config_options_template
+
+
+@pytest.fixture
+def static_temporario(tmp_path, monkeypatch):
+    """static/ em diretório temporário e cache da folha de estilos limpo"""
+    monkeypatch.setattr(estilos, "STATIC_DIR", tmp_path)
+    anterior = st_config.get_option("server.enableStaticServing")
+    estilos.construir_folha_estilos.clear()
+    yield tmp_path
+    estilos.construir_folha_estilos.clear()
+    st_config.set_option("server.enableStaticServing", anterior)
+
+
+def _corpo_tema():
+    teste = AppTest.from_string(SCRIPT_TEMA, default_timeout=30)
+    teste.run()
+    assert not teste.exception
+    return teste.markdown[0].value
+
+
+def test_tema_usa_link_com_static_serving(static_temporario):
+    st_config.set_option("server.enableStaticServing", True)
+    assert estilos.css_estatico_disponivel()
+
+    corpo = _corpo_tema()
+
+    assert corpo.startswith('<link rel="stylesheet" href="app/static/amaro-principal.')
+    nome = corpo.split("app/static/")[1].split('"')[0]
+    assert (static_temporario / nome).is_file()
+    assert mimetypes.guess_type(nome)[0] == "text/css"
+
+
+def test_tema_inline_sem_static_serving(static_temporario):
+    st_config.set_option("server.enableStaticServing", False)
+    assert _corpo_tema().startswith("<style>")
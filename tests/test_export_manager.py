@@ -0,0 +1,93 @@
+"""Exportações: importação leve do export_manager e lotes de cenários (Excel e ZIP de PDFs)"""
+
+import io
+import subprocess
+import sys
+import zipfile
+
+import openpyxl
+import pandas as pd
+
+from conftest import RAIZ
+from utils import export_manager as export_manager_modulo
+from utils.export_manager import criar_relatorio_dados, export_manager
+
+
+def test_importar_export_manager_nao_carrega_xlsxwriter():
+    # Processo novo: nada importado antes
+    codigo = "import sys, utils.export_manager; assert 'xlsxwriter' not in sys.modules"
+    resultado = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ,
+                               capture_output=True, text=True, timeout=120)
+    assert resultado.returncode == 0, resultado.stderr
+
+
+# ========================================================================
+# LOTE DE CENÁRIOS (EXCEL E ZIP DE PDFs)
+# ========================================================================
+def _relatorios(quantidade=4):
+    """Cenários com nomes de análise repetidos, longos e com caracteres proibidos em abas"""
+    tipos = ["Lucro Charter", "Lucro Charter", "Comparativo: Gestão Própria × Amaro [anual]",
+             "Projeção/Fluxo de caixa de 60 meses"]
+    return [
+        criar_relatorio_dados(
+            tipos[i % len(tipos)],
+            {'modelo': "Pilatus PC-12", 'horas_charter': 40 + i},
+            {'receita_bruta': 360000.0 + i, 'lucro_liquido': 1234.5 * i, 'roi_mensal': 12.5}
+        )
+        for i in range(quantidade)
+    ]
+
+
+def test_excel_lote(tmp_path):
+    relatorios = _relatorios()
+    arquivo = export_manager.export_excel_lote(relatorios)
+    caminho = tmp_path / "lote.xlsx"
+    caminho.write_bytes(arquivo.getvalue())
+
+    livro = openpyxl.load_workbook(caminho)
+    abas = livro.sheetnames
+    assert abas[0] == "Resumo" and len(abas) == len(relatorios) + 1
+    assert len(set(abas)) == len(abas)
+    assert all(len(aba) <= 31 and not set(aba) & set("[]:*?/\\") for aba in abas)
+
+    linhas = list(livro["Resumo"].iter_rows(values_only=True))
+    cabecalho, dados = linhas[0], linhas[1:]
+    assert len(dados) == len(relatorios)
+    assert [linha[cabecalho.index('Aba')] for linha in dados] == abas[1:]
+    for coluna in ('Nº', 'Horas Charter', 'Receita Bruta', 'Lucro Liquido'):
+        # Números gravados como células numéricas, não como texto
+        assert all(isinstance(linha[cabecalho.index(coluna)], (int, float)) for linha in dados)
+
+
+def _ler_zip(arquivo):
+    with zipfile.ZipFile(arquivo) as pacote:
+        pdfs = {nome: pacote.read(nome) for nome in pacote.namelist() if nome.endswith(".pdf")}
+        resumo = pd.read_csv(io.BytesIO(pacote.read("resumo.csv")), encoding="utf-8-sig")
+    return pdfs, resumo
+
+
+def test_zip_de_pdfs(monkeypatch):
+    relatorios = _relatorios()
+    gerar = export_manager_modulo.gerar_pdf_relatorio
+
+    def gerar_com_falha(report_data):
+        if report_data["parametros_entrada"]['horas_charter'] == 42:
+            raise RuntimeError("falha simulada")
+        return gerar(report_data)
+
+    monkeypatch.setattr(export_manager_modulo, "gerar_pdf_relatorio", gerar_com_falha)
+    pdfs, resumo = _ler_zip(export_manager.export_pdf_zip(relatorios, workers=1))
+
+    assert list(resumo['Arquivo'][resumo['Erro'].isna()]) == sorted(pdfs)
+    assert len(pdfs) == len(relatorios) - 1
+    assert all(conteudo.startswith(b"%PDF") for conteudo in pdfs.values())
+    assert 'Aba' not in resumo
+    falha = resumo[resumo['Erro'].notna()]
+    assert list(falha['Nº']) == [3] and falha['Erro'].iloc[0] == "falha simulada"
+
+
+def test_zip_de_pdfs_em_processos():
+    # Pool próprio com 'spawn' (sem fork do servidor com threads)
+    pdfs, resumo = _ler_zip(export_manager.export_pdf_zip(_relatorios(3), workers=2))
+    assert len(pdfs) == 3 and list(resumo['Nº']) == [1, 2, 3]
+    assert list(resumo['Arquivo']) == sorted(pdfs)
@@ -0,0 +1,194 @@
+"""Fila de exportação: estados das tarefas, limite de pendentes, armazém de arquivos e fallback em texto"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils import fila_exportacao as modulo
+from utils.export_manager import criar_relatorio_dados, export_manager
+from utils.fila_exportacao import ArmazemArtefatos, FilaCheia, FilaExportacao, exportar_para_arquivo
+
+
+@pytest.fixture
+def relatorio():
+    return criar_relatorio_dados(
+        "Lucro Charter", {'modelo': "Pilatus PC-12", 'horas_charter': 80},
+        {'receita_bruta': 540000.0, 'lucro_liquido': 123456.78}
+    )
+
+
+@pytest.mark.parametrize("formato, mime", [("csv", "text/csv"), ("json", "application/json")])
+def test_fallback_texto_gravado_em_bytes(tmp_path, monkeypatch, relatorio, formato, mime):
+    # Sem xlsxwriter/openpyxl export_excel devolve None e a cadeia cai para texto
+    monkeypatch.setattr(export_manager, "export_excel", lambda *args, **kwargs: None)
+    if formato == "json":
+        monkeypatch.setattr(export_manager, "export_csv", lambda *args, **kwargs: None)
+    caminho = tmp_path / "exportacao"
+
+    nome, mime_usado = exportar_para_arquivo('excel', relatorio, "relatorio", caminho)
+
+    assert nome.endswith(f".{formato}")
+    assert mime_usado == mime
+    texto = caminho.read_bytes().decode("utf-8")
+    assert "Pilatus PC-12" in texto
+    if formato == "json":
+        json.loads(texto)
+
+
+# ========================================================================
+# FILA
+# ========================================================================
+@pytest.fixture
+def geracao(monkeypatch):
+    """
+    Geração falsa no próprio processo: espera `liberar` e grava o conteúdo;
+    dados == "falha" levanta erro
+    """
+    liberar = threading.Event()
+
+    def exportar(tipo, dados, filename_base, caminho):
+        assert liberar.wait(30)
+        if dados == "falha":
+            raise ValueError("geração falhou")
+        with open(caminho, "wb") as destino:
+            destino.write(f"{tipo}:{dados}".encode())
+        return f"{filename_base}.bin", "application/octet-stream"
+
+    monkeypatch.setattr(modulo, "exportar_para_arquivo", exportar)
+    return liberar
+
+
+@pytest.fixture
+def fila(tmp_path):
+    fila = FilaExportacao(simultaneas=1, max_pendentes=2, armazem=ArmazemArtefatos(tmp_path))
+    # Pool de threads no lugar dos processos: a geração falsa precisa rodar aqui
+    pool = ThreadPoolExecutor(max_workers=1)
+    fila._pool_processos = lambda: pool
+    yield fila
+    fila.encerrar(esperar=False)
+    pool.shutdown(wait=False)
+
+
+def _esperar(fila, tarefa_id, estados, timeout=30):
+    limite = time.monotonic() + timeout
+    while (status := fila.status(tarefa_id))['estado'] not in estados:
+        assert time.monotonic() < limite, status
+        time.sleep(0.01)
+    return status
+
+
+def test_tarefa_percorre_os_estados(fila, geracao):
+    primeira = fila.enviar('pdf', "a", "primeira")
+    segunda = fila.enviar('excel', "b", "segunda")
+
+    assert _esperar(fila, primeira, ('executando',))['iniciada_em'] is not None
+    assert fila.status(segunda)['estado'] == 'na_fila'  # uma tarefa por vez
+    assert fila.obter_arquivo(primeira) is None
+
+    geracao.set()
+    for tarefa_id, esperado in ((primeira, b"pdf:a"), (segunda, b"excel:b")):
+        status = _esperar(fila, tarefa_id, ('concluida',))
+        assert status['progresso'] == 1.0 and status['tamanho'] == len(esperado)
+        assert fila.obter_arquivo(tarefa_id) == (esperado, status['nome_arquivo'], status['mime'])
+    assert fila.status("desconhecida") is None
+
+
+def test_erro_na_geracao(fila, geracao):
+    geracao.set()
+    tarefa_id = fila.enviar('pdf', "falha")
+
+    status = _esperar(fila, tarefa_id, ('erro',))
+
+    assert status['erro'] == "geração falhou"
+    assert fila.obter_arquivo(tarefa_id) is None
+    assert tarefa_id not in fila.armazem._itens
+
+
+def test_fila_cheia(fila, geracao):
+    ids = [fila.enviar('pdf', i) for i in range(fila.max_pendentes)]
+    with pytest.raises(FilaCheia):
+        fila.enviar('pdf', "demais")
+
+    geracao.set()
+    for tarefa_id in ids:
+        _esperar(fila, tarefa_id, ('concluida',))
+    fila.enviar('pdf', "depois")  # terminadas não contam como pendentes
+
+
+def test_tipo_e_lote_invalidos(fila):
+    with pytest.raises(ValueError):
+        fila.enviar('docx', {})
+    with pytest.raises(ValueError):
+        fila.enviar('excel_lote', [])
+
+
+def test_excel_em_processo_separado(tmp_path, relatorio):
+    fila = FilaExportacao(simultaneas=1, processos=1, armazem=ArmazemArtefatos(tmp_path))
+    try:
+        tarefa_id = fila.enviar('excel', relatorio, "relatorio")
+        status = _esperar(fila, tarefa_id, ('concluida', 'erro'), timeout=120)
+        assert status['estado'] == 'concluida', status['erro']
+
+        conteudo, nome, _ = fila.obter_arquivo(tarefa_id)
+        assert nome.endswith(".xlsx") and conteudo.startswith(b"PK")
+    finally:
+        fila.encerrar()
+
+
+# ========================================================================
+# ARMAZÉM
+# ========================================================================
+def _guardar(armazem, chave, tamanho):
+    with open(armazem.caminho(chave), "wb") as arquivo:
+        arquivo.write(b"x" * tamanho)
+    armazem.registrar(chave)
+
+
+def _chaves(armazem):
+    return list(armazem._itens)
+
+
+def test_armazem_limite_de_bytes(tmp_path):
+    armazem = ArmazemArtefatos(tmp_path, max_bytes=250)
+    for chave in "abc":
+        _guardar(armazem, chave, 100)
+
+    assert _chaves(armazem) == ["b", "c"]
+    assert armazem.bytes_usados == 200 and armazem.descartes == 1
+    assert not (tmp_path / "a").exists()
+    assert armazem.ler("a") is None and armazem.ler("c") == b"x" * 100
+
+
+def test_armazem_limite_de_quantidade(tmp_path):
+    armazem = ArmazemArtefatos(tmp_path, max_itens=2)
+    for chave in "abcd":
+        _guardar(armazem, chave, 10)
+
+    assert _chaves(armazem) == ["c", "d"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["c", "d"]
+
+
+def test_armazem_tempo_de_vida(tmp_path, monkeypatch):
+    agora = [1_000.0]
+    monkeypatch.setattr(modulo.time, "time", lambda: agora[0])
+    armazem = ArmazemArtefatos(tmp_path, ttl_segundos=60)
+    _guardar(armazem, "a", 10)
+    agora[0] += 30
+    _guardar(armazem, "b", 10)
+
+    agora[0] += 31  # "a" passou de 60 s
+    assert not armazem.contem("a") and armazem.contem("b")
+    agora[0] += 30
+    assert not armazem.contem("b") and len(armazem) == 0
+
+
+def test_armazem_mantem_o_mais_recente(tmp_path):
+    armazem = ArmazemArtefatos(tmp_path, max_bytes=100, max_itens=1)
+    _guardar(armazem, "a", 50)
+    _guardar(armazem, "grande", 500)  # sozinho já passa do limite
+
+    assert _chaves(armazem) == ["grande"]
+    assert armazem.ler("grande") == b"x" * 500
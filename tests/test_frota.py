@@ -0,0 +1,44 @@
+"""Calculadora de frota: uma aeronave reproduz a projeção mensal do modelo"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.calculations import calcular_projecao_lote
+from utils.frota import calcular_frota
+
+
+@pytest.mark.parametrize("taxas", [(0, 0, 0), (7, 4.5, 3), (-10, 12, 8)])
+def test_uma_aeronave_igual_a_projecao(params, taxas):
+    crescimento, inflacao, reajuste = taxas
+    for modelo in params['modelos_disponiveis']:
+        frota = pd.DataFrame({
+            'matricula': ["PR-AAA"],
+            'modelo': [modelo],
+            'horas_mes': [73.5],
+            'percentual_charter': [37.5],  # 50% das horas × 75% de ocupação
+            'custos_fixos_mes': [0.0]
+        })
+        resultado = calcular_frota(frota, params, 48, crescimento, inflacao, reajuste)
+        projecao = calcular_projecao_lote.sem_cache(
+            [modelo], 73.5, 48, params, crescimento, inflacao, reajuste
+        )
+
+        np.testing.assert_array_equal(resultado['horas_voadas'], projecao['horas_mensais'])
+        np.testing.assert_array_equal(resultado['custos'], projecao['custos'])
+        np.testing.assert_array_equal(resultado['receitas'], projecao['receitas'])
+        np.testing.assert_array_equal(resultado['lucros'], projecao['lucros'])
+        np.testing.assert_array_equal(resultado['frota_lucros'], projecao['lucros'][0])
+
+
+def test_aeronave_parada_so_tem_custo_fixo(params):
+    frota = pd.DataFrame({
+        'matricula': ["PR-AAA"],
+        'modelo': [params['modelos_disponiveis'][0]],
+        'horas_mes': [0.0],
+        'percentual_charter': [50.0],
+        'custos_fixos_mes': [25000.0]
+    })
+    resultado = calcular_frota(frota, params, 12)
+    assert np.all(resultado['custos'] == 25000.0)
+    assert np.all(resultado['receitas'] == 0.0)
@@ -0,0 +1,27 @@
+"""Gráficos: plotly só é importado no primeiro gráfico, inclusive com várias threads"""
+
+import subprocess
+import sys
+
+from conftest import RAIZ
+
+SCRIPT = """
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import utils.graficos_garantidos as graficos
+
+assert "plotly" not in sys.modules
+
+with ThreadPoolExecutor(8) as executor:
+    figuras = list(executor.map(lambda i: graficos.criar_grafico_pizza(90 + i, 10), range(16)))
+
+assert all(len(f.data) == 1 and f.data[0].type == "pie" for f in figuras)
+"""
+
+
+def test_plotly_sob_demanda_entre_threads():
+    # Processo novo: a importação de plotly precisa partir do zero
+    resultado = subprocess.run([sys.executable, "-c", SCRIPT], cwd=RAIZ,
+                               capture_output=True, text=True, timeout=120)
+    assert resultado.returncode == 0, resultado.stderr
@@ -0,0 +1,63 @@
+"""Histórico de parâmetros: só gravações registram, sem avançar a geração, com poda"""
+
+import os
+import shutil
+
+import pytest
+
+from conftest import RAIZ
+from utils import params as mod_params
+from utils.params import MODELOS_FILE, PARAMS_FILE, load_params, save_params
+from utils.snapshot import HISTORICO_DIR, listar_snapshots, registrar_snapshot
+from utils.storage import geracao_atual
+
+
+@pytest.fixture
+def repo_temporario(tmp_path, monkeypatch):
+    """Cópia dos arquivos de configuração em um diretório temporário"""
+    for relativo in (PARAMS_FILE, MODELOS_FILE):
+        destino = tmp_path / relativo
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(RAIZ / relativo, destino)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("AMARO_CATALOGO_DB", raising=False)
+    load_params.clear()
+    yield tmp_path
+    load_params.clear()
+
+
+def test_leitura_nao_grava_historico(repo_temporario):
+    load_params()
+    assert not (repo_temporario / HISTORICO_DIR).exists()
+    assert geracao_atual() == 0
+
+
+def test_gravacao_registra_estado_anterior_e_novo(repo_temporario):
+    anterior = load_params().hash
+    params = dict(load_params())
+    params['preco_combustivel'] = params['preco_combustivel'] + 1
+    geracao = geracao_atual()
+
+    assert save_params(params)
+
+    novo = load_params().hash
+    assert novo != anterior
+    assert {s['hash'] for s in listar_snapshots()} == {anterior, novo}
+    # Só a gravação dos parâmetros avança a geração; o histórico não
+    assert geracao_atual() == geracao + 1
+
+
+def test_historico_podado(repo_temporario):
+    snapshot = load_params()
+    base, _, df_modelos, _ = mod_params._fontes()
+    historico = repo_temporario / HISTORICO_DIR
+    historico.mkdir(parents=True)
+    for i in range(5):
+        antigo = historico / f"antigo{i}.json"
+        antigo.write_text("{}")
+        os.utime(antigo, ns=(i, i))
+
+    assert registrar_snapshot(snapshot, base, df_modelos, max_registros=3)
+
+    restantes = sorted(p.name for p in historico.glob("*.json"))
+    assert restantes == sorted([f"{snapshot.hash}.json", "antigo4.json", "antigo3.json"])
@@ -0,0 +1,61 @@
+"""Precificação em lote: linhas inválidas marcadas em 'erro', válidas iguais ao cálculo escalar"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.calculations import calcular_lucro_mensal_charter
+from utils.lote import COLUNAS_CHARTER, precificar_bloco
+
+
+def test_entradas_invalidas_marcadas(params):
+    modelo = params['modelos_disponiveis'][0]
+    bloco = pd.DataFrame({
+        'modelo': [modelo, modelo, modelo, modelo, modelo, "Inexistente", modelo],
+        'horas_charter': [80, 0, -10, 80, 80, 80, np.nan],
+        'taxa_ocupacao': [75, 75, -50, -5, 0, 75, 75],
+        'preco_hora': [9000, 9000, 9000, 9000, -1, 9000, 9000]
+    })
+
+    resultado = precificar_bloco(bloco, params, None)
+
+    assert list(resultado['erro']) == [
+        "",
+        "Número de horas deve ser maior que zero",
+        "taxa de ocupação negativa",
+        "taxa de ocupação negativa",
+        "preço por hora negativo",
+        "modelo não encontrado",
+        ""  # sem horas: charter não solicitado
+    ]
+    invalidas = resultado['erro'] != ""
+    for coluna in COLUNAS_CHARTER:
+        assert resultado.loc[invalidas, coluna].isna().all()
+        assert resultado[coluna].iloc[-1:].isna().all()
+
+
+@pytest.mark.parametrize("entrada", [(0, 75, 9000), (80, 0, 9000)])
+def test_escalar_recusa_o_mesmo(params, entrada):
+    horas, ocupacao, preco = entrada
+    with pytest.raises(ValueError, match="Número de horas deve ser maior que zero"):
+        calcular_lucro_mensal_charter(params['modelos_disponiveis'][0], horas, ocupacao, preco, params)
+
+
+def test_linhas_validas_iguais_ao_escalar(params):
+    modelos = params['modelos_disponiveis']
+    bloco = pd.DataFrame({
+        'modelo': modelos,
+        'horas_charter': np.linspace(10, 150, len(modelos)),
+        'taxa_ocupacao': np.linspace(40, 100, len(modelos)),
+        'preco_hora': np.linspace(0, 20000, len(modelos))
+    })
+
+    resultado = precificar_bloco(bloco, params, None)
+
+    assert (resultado['erro'] == "").all()
+    for linha in resultado.itertuples():
+        escalar = calcular_lucro_mensal_charter(
+            linha.modelo, linha.horas_charter, linha.taxa_ocupacao, linha.preco_hora, params
+        )
+        for coluna in COLUNAS_CHARTER:
+            assert getattr(linha, coluna) == escalar[coluna]
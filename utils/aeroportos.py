@@ -0,0 +1,205 @@
+"""
+Índice de aeroportos e estimativa de duração por distância ortodrômica
+Permite cotar qualquer par de aeroportos, não apenas as rotas cadastradas
+
+A cotação busca aeroportos por código, não por proximidade, e a distância
+de todos os pares é calculada de uma vez com haversine vetorizado; por isso
+não há árvore espacial (nem dependência do scipy).
+"""
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.calculations import indices_modelos
+
+AEROPORTOS_FILE = "data/aeroportos.csv"
+
+RAIO_TERRA_KM = 6371.0
+
+# Aerovias não são ortodrômicas: acréscimo médio sobre a distância direta
+FATOR_DESVIO_ROTA = 1.05
+
+# Tempo adicional por trecho para táxi, subida e descida
+TEMPO_SUBIDA_DESCIDA_H = 0.25
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Distância ortodrômica vetorizada (fórmula de haversine)
+
+    Args:
+        lat1, lon1, lat2, lon2: Coordenadas em graus (escalares ou arrays)
+
+    Returns:
+        Distância em km (mesmo formato da entrada, após broadcasting)
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * RAIO_TERRA_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class IndiceAeroportos:
+    """Tabela de aeroportos com busca por código (ICAO ou IATA)"""
+
+    def __init__(self, df_aeroportos):
+        self.icao = df_aeroportos['icao'].astype(str).str.upper().to_numpy()
+        self.iata = df_aeroportos['iata'].fillna('').astype(str).str.upper().to_numpy()
+        self.nome = df_aeroportos['nome'].astype(str).to_numpy()
+        self.lat = df_aeroportos['lat'].astype(float).to_numpy()
+        self.lon = df_aeroportos['lon'].astype(float).to_numpy()
+
+        # Código → linha; IATA e ICAO apontam para o mesmo aeroporto
+        self._posicao = {}
+        for i, (icao, iata) in enumerate(zip(self.icao.tolist(), self.iata.tolist())):
+            self._posicao.setdefault(icao, i)
+            if iata:
+                self._posicao.setdefault(iata, i)
+
+        # Índice pandas para resolver milhões de códigos sem laço Python
+        self._codigos = pd.Index(list(self._posicao))
+        self._linhas = np.fromiter(self._posicao.values(), dtype=np.intp, count=len(self._posicao))
+
+    def __len__(self):
+        return len(self.icao)
+
+    def __contains__(self, codigo):
+        return str(codigo).upper() in self._posicao
+
+    @property
+    def codigos(self):
+        """Códigos de exibição (IATA quando houver, senão ICAO), ordenados"""
+        return tuple(sorted(np.where(self.iata != '', self.iata, self.icao).tolist()))
+
+    def posicoes(self, codigos):
+        """
+        Linhas dos aeroportos no índice
+
+        Raises:
+            KeyError: Se algum código não estiver cadastrado
+        """
+        codigos = pd.Index(np.atleast_1d(codigos).astype(str)).str.upper()
+        posicoes = self._codigos.get_indexer(codigos)
+
+        ausentes = posicoes < 0
+        if ausentes.any():
+            raise KeyError(f"Aeroporto '{codigos[ausentes.argmax()]}' não encontrado")
+
+        return self._linhas[posicoes]
+
+    def codigos_na_forma(self, referencia):
+        """
+        Código de cada linha na forma usada por outra tabela (ex.: rotas.csv)
+
+        Args:
+            referencia: Códigos (ICAO ou IATA) presentes na outra tabela
+
+        Returns:
+            Array indexado pela linha: ICAO se ele estiver na referência,
+            senão IATA (ou ICAO, para aeroportos sem IATA)
+        """
+        padrao = np.where(self.iata != '', self.iata, self.icao)
+        return np.where(np.isin(self.icao, np.asarray(referencia, dtype=str)), self.icao, padrao)
+
+    def distancia_km(self, origens, destinos):
+        """Distância ortodrômica vetorizada entre pares de aeroportos"""
+        i, j = self.posicoes(origens), self.posicoes(destinos)
+        return haversine_km(self.lat[i], self.lon[i], self.lat[j], self.lon[j])
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _indice_em_cache(caminho, mtime_ns, tamanho):
+    """Índice compartilhado entre reruns e sessões, invalidado pelo mtime/tamanho do arquivo"""
+    return IndiceAeroportos(pd.read_csv(caminho))
+
+
+def carregar_indice_aeroportos(caminho=AEROPORTOS_FILE):
+    """
+    Carrega o índice de aeroportos do CSV
+
+    Returns:
+        IndiceAeroportos (vazio se o arquivo não existir ou for inválido)
+    """
+    try:
+        info = Path(caminho).stat()
+        return _indice_em_cache(caminho, info.st_mtime_ns, info.st_size)
+    except (FileNotFoundError, pd.errors.EmptyDataError, KeyError, ValueError) as e:
+        st.warning(f"Erro ao carregar aeroportos: {e}. Estimativa por distância indisponível.")
+        return IndiceAeroportos(pd.DataFrame(columns=['icao', 'iata', 'nome', 'lat', 'lon']))
+
+
+def estimar_duracoes_lote(origens, destinos, modelos, params, indice_aeroportos, indice_rotas=None):
+    """
+    Duração de voo estimada para muitos pares de uma vez
+
+    A duração vem da distância ortodrômica (com desvio de aerovia) dividida
+    pela velocidade de cruzeiro do modelo, mais o tempo de subida/descida
+    (que é também a duração mínima de qualquer trecho). Pares cadastrados
+    no índice de rotas usam a duração cadastrada.
+
+    Args:
+        origens: Sequência de códigos de origem
+        destinos: Sequência de códigos de destino
+        modelos: Modelo único ou sequência de modelos (nomes ou índices)
+        params: Parâmetros do sistema
+        indice_aeroportos: IndiceAeroportos com as coordenadas
+        indice_rotas: IndiceRotas opcional com durações cadastradas
+
+    Returns:
+        Dict com arrays 'distancia_km', 'duracao_h' e 'estimada'
+
+    Raises:
+        KeyError: Aeroporto não cadastrado
+        ValueError: Par com origem e destino no mesmo aeroporto
+    """
+    origens = np.atleast_1d(origens)
+    destinos = np.atleast_1d(destinos)
+
+    # IATA e ICAO do mesmo aeroporto resolvem para a mesma linha
+    linhas_origem = indice_aeroportos.posicoes(origens)
+    linhas_destino = indice_aeroportos.posicoes(destinos)
+    mesmo_aeroporto = linhas_origem == linhas_destino
+    if mesmo_aeroporto.any():
+        i = mesmo_aeroporto.argmax()
+        raise ValueError(f"Origem e destino são o mesmo aeroporto ({origens[i]} → {destinos[i]})")
+
+    velocidades = np.array([params['velocidade_modelos'][m] for m in params['modelos_disponiveis']])
+    velocidade = velocidades[indices_modelos(modelos, params)]
+
+    distancia = haversine_km(indice_aeroportos.lat[linhas_origem], indice_aeroportos.lon[linhas_origem],
+                             indice_aeroportos.lat[linhas_destino], indice_aeroportos.lon[linhas_destino])
+    duracao = distancia * FATOR_DESVIO_ROTA / velocidade + TEMPO_SUBIDA_DESCIDA_H
+    estimada = np.ones(len(duracao), dtype=bool)
+
+    # Rotas cadastradas prevalecem sobre a estimativa; a busca usa o código de
+    # cada aeroporto na forma gravada em rotas.csv (aliases e minúsculas resolvidos)
+    if indice_rotas is not None and len(indice_rotas):
+        codigos = indice_aeroportos.codigos_na_forma(indice_rotas.aeroportos)
+        linhas, _ = indice_rotas.posicoes(codigos[linhas_origem], codigos[linhas_destino])
+        cadastrada = linhas >= 0
+        duracao = np.where(cadastrada, indice_rotas.duracao_h[linhas], duracao)
+        estimada = ~cadastrada
+
+    return {
+        'distancia_km': distancia,
+        'duracao_h': duracao,
+        'estimada': estimada
+    }
+
+
+def estimar_duracao(origem, destino, modelo, params, indice_aeroportos, indice_rotas=None):
+    """
+    Duração de voo de um único par (cadastrada ou estimada por distância)
+
+    Returns:
+        Dict com 'distancia_km', 'duracao_h' e 'estimada'
+    """
+    resultado = estimar_duracoes_lote([origem], [destino], modelo, params,
+                                      indice_aeroportos, indice_rotas)
+    return {
+        'distancia_km': float(resultado['distancia_km'][0]),
+        'duracao_h': float(resultado['duracao_h'][0]),
+        'estimada': bool(resultado['estimada'][0])
+    }
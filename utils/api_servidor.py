@@ -0,0 +1,402 @@
+"""
+API HTTP/JSON dos cálculos, sem Streamlit (biblioteca padrão)
+
+Usa as mesmas funções de utils/calculations.py e o mesmo snapshot de
+parâmetros em cache das páginas, então os resultados são idênticos aos da
+interface e aproveitam os caches em memória e em disco.
+
+    python -m utils.api_servidor
+    python -m utils.api_servidor --host 0.0.0.0 --porta 8600 --workers 16
+
+Rotas:
+    GET  /saude            estado do serviço e hash dos parâmetros ativos
+    GET  /modelos          modelos disponíveis e preço de mercado por hora
+    POST /charter          lucro mensal com operação charter
+    POST /gestao           comparativo gestão própria × gestão Amaro
+    POST /rota             custo de uma rota cadastrada
+    POST /projecao         projeção mensal de receitas, custos e lucro
+    POST /lote             várias operações em uma requisição
+
+Cada POST aceita um objeto JSON ou uma lista de objetos (lote da mesma
+operação). Em /lote, cada item é {"operacao": "charter", "dados": {...}}.
+Nos lotes, um item inválido não derruba os demais: cada resultado vem como
+{"ok": true, "resultado": ...} ou {"ok": false, "erro": "..."}.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from utils.calculations import (
+    calcular_lucro_mensal_charter, calcular_comparativo_gestao,
+    calcular_custo_rota, calcular_projecao_mensal
+)
+from utils.params import load_params
+from utils.rotas import carregar_indice_rotas
+
+logger = logging.getLogger(__name__)
+
+HOST_PADRAO = "127.0.0.1"
+PORTA_PADRAO = 8600
+
+# Limites por requisição
+MAX_CORPO_BYTES = 16 * 1024 * 1024
+MAX_ITENS_LOTE = 10000
+MAX_MESES_PROJECAO = 600
+
+# Conexões keep-alive ociosas são encerradas após este tempo
+TIMEOUT_CONEXAO_S = 30
+
+# Custos fixos anuais padrão da gestão própria (mesmos valores da página 2)
+CUSTOS_FIXOS_PADRAO = {
+    'hangar': 120000,
+    'seguro': 250000,
+    'tripulacao': 300000,
+    'administracao': 50000
+}
+
+
+class ErroRequisicao(ValueError):
+    """Entrada inválida enviada pelo cliente (resposta 400)"""
+
+
+# ========================================================================
+# VALIDAÇÃO DAS ENTRADAS
+# ========================================================================
+def _numero(dados, campo, padrao=None, minimo=None):
+    """
+    Lê um campo numérico do corpo da requisição
+
+    Raises:
+        ErroRequisicao: Se o campo faltar, não for número finito ou estiver abaixo do mínimo
+    """
+    valor = dados.get(campo, padrao)
+    if valor is None:
+        raise ErroRequisicao(f"Campo '{campo}' é obrigatório")
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+        raise ErroRequisicao(f"Campo '{campo}' deve ser numérico")
+    try:
+        finito = math.isfinite(valor)
+    except OverflowError:  # inteiro grande demais para float
+        finito = False
+    if not finito:
+        raise ErroRequisicao(f"Campo '{campo}' deve ser um número finito")
+    if minimo is not None and valor < minimo:
+        raise ErroRequisicao(f"Campo '{campo}' deve ser maior ou igual a {minimo}")
+    return valor
+
+
+def _modelo(dados, params):
+    """Modelo da requisição, validado contra os modelos disponíveis"""
+    modelo = dados.get('modelo')
+    if modelo not in params['modelos_disponiveis']:
+        raise ErroRequisicao(f"Modelo '{modelo}' não encontrado")
+    return modelo
+
+
+def _aeroporto(dados, campo):
+    """Código de aeroporto (texto não vazio, em maiúsculas)"""
+    valor = dados.get(campo)
+    if not isinstance(valor, str) or not valor.strip():
+        raise ErroRequisicao(f"Campo '{campo}' é obrigatório")
+    return valor.strip().upper()
+
+
+# ========================================================================
+# OPERAÇÕES
+# ========================================================================
+def operacao_charter(dados, params):
+    """Lucro mensal com charter; preco_hora padrão é o preço de mercado do modelo"""
+    modelo = _modelo(dados, params)
+    return calcular_lucro_mensal_charter(
+        modelo,
+        _numero(dados, 'horas_charter', minimo=0),
+        _numero(dados, 'taxa_ocupacao', padrao=75, minimo=0),
+        _numero(dados, 'preco_hora', padrao=params['preco_mercado_hora'][modelo], minimo=0),
+        params
+    )
+
+
+def operacao_gestao(dados, params):
+    """Comparativo de gestão; custos_fixos completa os ausentes com os valores padrão"""
+    custos_fixos = dados.get('custos_fixos', {})
+    if not isinstance(custos_fixos, dict):
+        raise ErroRequisicao("Campo 'custos_fixos' deve ser um objeto")
+    custos_fixos = {
+        item: _numero(custos_fixos, item, padrao=valor, minimo=0)
+        for item, valor in CUSTOS_FIXOS_PADRAO.items()
+    }
+    return calcular_comparativo_gestao(
+        _modelo(dados, params), _numero(dados, 'horas_anuais', minimo=0), params, custos_fixos
+    )
+
+
+def operacao_rota(dados, params):
+    """Custo de uma rota cadastrada (permitir_inverso aceita o sentido oposto)"""
+    return calcular_custo_rota(
+        _aeroporto(dados, 'origem'), _aeroporto(dados, 'destino'), _modelo(dados, params),
+        params, carregar_indice_rotas(), bool(dados.get('permitir_inverso', False))
+    )
+
+
+def operacao_projecao(dados, params):
+    """Projeção mensal com crescimento, inflação e reajuste anuais (%)"""
+    num_meses = _numero(dados, 'num_meses', padrao=60, minimo=1)
+    if num_meses != int(num_meses) or num_meses > MAX_MESES_PROJECAO:
+        raise ErroRequisicao(f"Campo 'num_meses' deve ser inteiro entre 1 e {MAX_MESES_PROJECAO}")
+    return calcular_projecao_mensal(
+        _modelo(dados, params),
+        _numero(dados, 'horas_mes', minimo=0),
+        int(num_meses),
+        params,
+        _numero(dados, 'taxa_crescimento', padrao=0),
+        _numero(dados, 'inflacao_custos', padrao=0),
+        _numero(dados, 'reajuste_preco', padrao=0),
+        _numero(dados, 'investimento_inicial', padrao=0)
+    )
+
+
+OPERACOES = {
+    'charter': operacao_charter,
+    'gestao': operacao_gestao,
+    'rota': operacao_rota,
+    'projecao': operacao_projecao
+}
+
+
+def executar(operacao, dados, params):
+    """
+    Executa uma operação sobre um objeto de entrada
+
+    Raises:
+        ErroRequisicao: Operação desconhecida ou entrada inválida
+        ValueError: Erro do cálculo (ex.: rota não cadastrada)
+    """
+    if operacao not in OPERACOES:
+        raise ErroRequisicao(f"Operação '{operacao}' desconhecida")
+    if not isinstance(dados, dict):
+        raise ErroRequisicao("Cada item deve ser um objeto JSON")
+    resultado = OPERACOES[operacao](dados, params)
+    if not _finito(resultado):
+        raise ErroRequisicao("Resultado fora do intervalo numérico; reduza os valores de entrada")
+    return resultado
+
+
+def executar_lote(itens, params, operacao=None):
+    """
+    Executa uma lista de itens; erros de um item ficam no próprio resultado
+
+    Args:
+        itens: Lista de objetos de entrada (ou de {"operacao", "dados"} se
+               operacao for None)
+        params: Snapshot de parâmetros comum a todo o lote
+        operacao: Operação de todos os itens, ou None para lote misto
+
+    Returns:
+        Lista de {"ok": True, "resultado": ...} ou {"ok": False, "erro": ...}
+    """
+    if len(itens) > MAX_ITENS_LOTE:
+        raise ErroRequisicao(f"Lote acima do limite de {MAX_ITENS_LOTE} itens")
+
+    resultados = []
+    for item in itens:
+        try:
+            if operacao is None:
+                if not isinstance(item, dict):
+                    raise ErroRequisicao("Cada item deve ser um objeto JSON")
+                resultado = executar(item.get('operacao'), item.get('dados', {}), params)
+            else:
+                resultado = executar(operacao, item, params)
+            resultados.append({'ok': True, 'resultado': resultado})
+        except (ValueError, KeyError, TypeError) as e:
+            resultados.append({'ok': False, 'erro': str(e)})
+    return resultados
+
+
+def _finito(valor):
+    """Indica se todos os números do resultado são finitos (JSON não aceita NaN/Infinity)"""
+    if isinstance(valor, dict):
+        return all(_finito(v) for v in valor.values())
+    if isinstance(valor, (list, tuple)):
+        return all(_finito(v) for v in valor)
+    if isinstance(valor, np.ndarray):
+        return valor.dtype.kind not in "fc" or bool(np.isfinite(valor).all())
+    if isinstance(valor, (float, np.floating)):
+        return math.isfinite(valor)
+    return True
+
+
+def _json_padrao(valor):
+    """Converte tipos do NumPy para JSON"""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Tipo {type(valor).__name__} não serializável")
+
+
+# ========================================================================
+# SERVIDOR HTTP
+# ========================================================================
+class ManipuladorAPI(BaseHTTPRequestHandler):
+    """Requisições HTTP/1.1 com corpo e resposta JSON"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "AmaroAPI/1.0"
+    timeout = TIMEOUT_CONEXAO_S
+    disable_nagle_algorithm = True  # respostas pequenas saem sem esperar o ACK
+
+    def _responder(self, status, corpo, params=None):
+        try:
+            # allow_nan=False: NaN/Infinity não são JSON válido para os clientes
+            dados = json.dumps(corpo, default=_json_padrao, ensure_ascii=False, allow_nan=False)
+        except ValueError:
+            logger.exception("Resposta com valor não finito em %s", self.path)
+            status, dados = HTTPStatus.INTERNAL_SERVER_ERROR, json.dumps({'erro': "Erro interno"})
+        dados = dados.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(dados)))
+        if params is not None:
+            self.send_header("X-Parametros-Hash", params.hash)
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def _ler_corpo(self):
+        cabecalho = self.headers.get("Content-Length") or "0"
+        try:
+            tamanho = int(cabecalho)
+        except ValueError:
+            raise ErroRequisicao(f"Content-Length inválido: {cabecalho!r}")
+        if tamanho < 0:  # rfile.read(-1) esperaria o fim da conexão
+            raise ErroRequisicao(f"Content-Length inválido: {cabecalho!r}")
+        if tamanho > MAX_CORPO_BYTES:
+            raise ErroRequisicao(f"Corpo acima do limite de {MAX_CORPO_BYTES} bytes")
+        try:
+            return json.loads(self.rfile.read(tamanho) or b"null")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ErroRequisicao(f"JSON inválido: {e}")
+
+    def do_GET(self):
+        params = load_params()
+        if self.path == "/saude":
+            self._responder(HTTPStatus.OK, {
+                'status': 'ok',
+                'parametros_hash': params.hash,
+                'modelos': len(params['modelos_disponiveis'])
+            }, params)
+        elif self.path == "/modelos":
+            self._responder(HTTPStatus.OK, {
+                'modelos': [
+                    {'modelo': m, 'preco_mercado_hora': params['preco_mercado_hora'][m]}
+                    for m in params['modelos_disponiveis']
+                ]
+            }, params)
+        else:
+            self._responder(HTTPStatus.NOT_FOUND, {'erro': f"Rota '{self.path}' não encontrada"})
+
+    def do_POST(self):
+        operacao = self.path.strip("/")
+        if operacao != "lote" and operacao not in OPERACOES:
+            self.close_connection = True  # corpo não lido
+            self._responder(HTTPStatus.NOT_FOUND, {'erro': f"Rota '{self.path}' não encontrada"})
+            return
+
+        try:
+            corpo = self._ler_corpo()
+        except ErroRequisicao as e:
+            self.close_connection = True
+            self._responder(HTTPStatus.BAD_REQUEST, {'erro': str(e)})
+            return
+
+        # Um único snapshot por requisição: todos os itens do lote usam os mesmos parâmetros
+        params = load_params()
+        try:
+            resposta = self.server.calcular(self._processar, operacao, corpo, params)
+        except (ValueError, KeyError, TypeError) as e:
+            self._responder(HTTPStatus.BAD_REQUEST, {'erro': str(e)}, params)
+            return
+        except Exception:
+            logger.exception("Erro ao processar %s", self.path)
+            self._responder(HTTPStatus.INTERNAL_SERVER_ERROR, {'erro': "Erro interno"}, params)
+            return
+
+        self._responder(HTTPStatus.OK, resposta, params)
+
+    @staticmethod
+    def _processar(operacao, corpo, params):
+        if operacao == "lote":
+            itens = corpo.get('requisicoes') if isinstance(corpo, dict) else corpo
+            if not isinstance(itens, list):
+                raise ErroRequisicao("Lote deve ser uma lista ou {\"requisicoes\": [...]}")
+            return {'resultados': executar_lote(itens, params)}
+        if isinstance(corpo, list):
+            return {'resultados': executar_lote(corpo, params, operacao)}
+        return executar(operacao, corpo, params)
+
+    def log_message(self, formato, *args):
+        logger.debug("%s - %s", self.address_string(), formato % args)
+
+
+class ServidorAPI(ThreadingHTTPServer):
+    """
+    Servidor HTTP com uma thread por conexão e um pool fixo para os cálculos
+
+    As threads de conexão só leem e escrevem na rede (conexões keep-alive
+    ociosas não ocupam workers); os cálculos passam pelo pool, que limita
+    quantos rodam ao mesmo tempo. O cache de resultados é compartilhado
+    por todos os workers do processo.
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, endereco, workers=None):
+        super().__init__(endereco, ManipuladorAPI)
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="amaro-api")
+
+    def calcular(self, funcao, *args):
+        """Executa um cálculo no pool e aguarda o resultado"""
+        return self._pool.submit(funcao, *args).result()
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API HTTP/JSON dos cálculos da Amaro Aviation")
+    parser.add_argument("--host", default=HOST_PADRAO, help=f"Endereço (padrão: {HOST_PADRAO})")
+    parser.add_argument("--porta", type=int, default=PORTA_PADRAO, help=f"Porta (padrão: {PORTA_PADRAO})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Cálculos simultâneos (padrão: CPUs + 4, máximo 32)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Fora do Streamlit os caches avisam "No runtime found" a cada uso
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    params = load_params()  # aquece o snapshot e as tabelas de coeficientes
+    carregar_indice_rotas()
+
+    servidor = ServidorAPI((args.host, args.porta), args.workers)
+    print(f"✅ API em http://{args.host}:{args.porta} ({servidor.workers} workers, "
+          f"parâmetros {params.hash[:12]})")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
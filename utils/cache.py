@@ -0,0 +1,192 @@
+"""
+Cache de resultados compartilhado entre sessões (LRU com expiração)
+Chaveado pelo hash do snapshot de parâmetros mais as entradas normalizadas
+"""
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+
+from utils.snapshot import chave_calculo
+
+# Limites padrão do cache de resultados
+MAX_ENTRADAS_CACHE = 2048
+TTL_CACHE_SEGUNDOS = 6 * 3600
+
+
+class CacheResultados:
+    """
+    Cache LRU limitado, com expiração por tempo e seguro para várias threads
+
+    Cada sessão do Streamlit roda em uma thread própria; o mesmo objeto é
+    compartilhado entre todas elas via st.cache_resource.
+    """
+
+    def __init__(self, max_entradas=MAX_ENTRADAS_CACHE, ttl_segundos=TTL_CACHE_SEGUNDOS):
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        self.expiracoes = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obter(self, chave):
+        """
+        Valor em cache para a chave
+
+        Returns:
+            Tuple (encontrado, valor)
+        """
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                self.falhas += 1
+                return False, None
+
+            valor, expira_em = entrada
+            if self.ttl_segundos and time.monotonic() >= expira_em:
+                del self._entradas[chave]
+                self.expiracoes += 1
+                self.falhas += 1
+                return False, None
+
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return True, valor
+
+    def guardar(self, chave, valor):
+        """Guarda um valor, descartando os menos usados acima do limite"""
+        expira_em = time.monotonic() + (self.ttl_segundos or 0)
+        with self._lock:
+            self._entradas[chave] = (valor, expira_em)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.remocoes += 1
+
+    def limpar(self):
+        """Esvazia o cache e zera os contadores"""
+        with self._lock:
+            self._entradas.clear()
+            self.acertos = self.falhas = self.remocoes = self.expiracoes = 0
+
+    def estatisticas(self):
+        """
+        Contadores do cache
+
+        Returns:
+            Dict com entradas, limite, acertos, falhas, remoções, expirações e taxa de acerto (%)
+        """
+        with self._lock:
+            consultas = self.acertos + self.falhas
+            return {
+                'entradas': len(self._entradas),
+                'max_entradas': self.max_entradas,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'remocoes': self.remocoes,
+                'expiracoes': self.expiracoes,
+                'taxa_acerto': (self.acertos / consultas * 100) if consultas else 0.0
+            }
+
+
+def _copiar(valor):
+    """Cópia dos dicts e listas do resultado (os valores escalares são imutáveis)"""
+    if isinstance(valor, dict):
+        return {k: _copiar(v) for k, v in valor.items()}
+    if isinstance(valor, list):
+        return [_copiar(v) for v in valor]
+    return valor
+
+
+@st.cache_resource(show_spinner=False)
+def obter_cache_resultados():
+    """Cache de resultados único do processo, compartilhado entre sessões"""
+    return CacheResultados()
+
+
+def separador_entradas(funcao):
+    """
+    Separa os parâmetros do sistema das demais entradas de uma função de cálculo
+
+    Args:
+        funcao: Função com um argumento chamado 'params'
+
+    Returns:
+        Função (args, kwargs) -> (params, tupla das demais entradas na ordem
+        da assinatura, com valores padrão preenchidos)
+    """
+    assinatura = inspect.signature(funcao)
+    nomes = tuple(assinatura.parameters)
+    posicao_params = nomes.index('params')
+    padroes = tuple(p.default for p in assinatura.parameters.values())
+    obrigatorios = sum(p.default is inspect.Parameter.empty for p in assinatura.parameters.values())
+
+    def separar(args, kwargs):
+        # Caminho rápido (chamada só posicional): completa com os valores padrão
+        if not kwargs and max(obrigatorios, posicao_params + 1) <= len(args) <= len(nomes):
+            args_completos = args + padroes[len(args):]
+            return args[posicao_params], args_completos[:posicao_params] + args_completos[posicao_params + 1:]
+
+        argumentos = assinatura.bind(*args, **kwargs)
+        argumentos.apply_defaults()
+        entradas = dict(argumentos.arguments)
+        params = entradas.pop('params')
+        return params, tuple(entradas[nome] for nome in nomes if nome != 'params')
+
+    return separar
+
+
+def cache_calculo(funcao):
+    """
+    Decorador: guarda o resultado de um cálculo no cache compartilhado
+
+    A chave é (função, hash dos parâmetros, demais entradas), então uma
+    alteração salva nos parâmetros gera chaves novas automaticamente.
+    Exceções não são guardadas. Cada chamada recebe sua própria cópia do
+    resultado, para que alterações feitas pela página não vazem para
+    outras sessões.
+
+    Args:
+        funcao: Função de cálculo com um argumento chamado 'params'
+
+    Returns:
+        Função decorada, com o mesmo comportamento e assinatura
+    """
+    separar = separador_entradas(funcao)
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        params, entradas = separar(args, kwargs)
+
+        try:
+            chave = chave_calculo(funcao, params, *entradas)
+            hash(chave)
+        except TypeError:  # entrada não hasheável: calcula sem cache
+            return funcao(*args, **kwargs)
+
+        cache = obter_cache_resultados()
+        encontrado, valor = cache.obter(chave)
+        if not encontrado:
+            valor = funcao(*args, **kwargs)
+            cache.guardar(chave, _copiar(valor))
+            return valor
+
+        return _copiar(valor)
+
+    envoltorio.sem_cache = funcao
+    return envoltorio
+
+
+def estatisticas_cache():
+    """Contadores do cache de resultados compartilhado"""
+    return obter_cache_resultados().estatisticas()
@@ -0,0 +1,319 @@
+"""
+Cache persistente em disco para resultados em arrays (projeções, grades, matrizes)
+
+Sobrevive a reinícios do Streamlit e é compartilhado entre processos:
+SQLite em modo WAL (leitores concorrentes não bloqueiam), um registro por
+chave com os arrays em formato .npz, limite de tamanho com descarte dos
+menos acessados (LRU).
+
+Configuração por variáveis de ambiente:
+    AMARO_CACHE_DISCO_DB   caminho do banco (padrão: cache/resultados.sqlite;
+                           vazio desativa o cache em disco)
+    AMARO_CACHE_DISCO_MB   limite de tamanho em MB (padrão: 256)
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from utils.cache import separador_entradas
+from utils.snapshot import chave_calculo
+
+CACHE_DISCO_FILE = "cache/resultados.sqlite"
+CACHE_DISCO_ENV = "AMARO_CACHE_DISCO_DB"
+LIMITE_CACHE_DISCO_ENV = "AMARO_CACHE_DISCO_MB"
+LIMITE_CACHE_DISCO_MB = 256
+
+# Versão do formato gravado; alterá-la invalida as entradas antigas
+FORMATO_CACHE_DISCO = 1
+
+# Erros de um registro ilegível (truncado, corrompido ou de outro formato)
+ERROS_DESSERIALIZACAO = (ValueError, KeyError, OSError, EOFError, zipfile.BadZipFile)
+
+# Intervalo mínimo entre atualizações do horário de acesso de uma entrada,
+# para que leituras repetidas não virem uma gravação cada
+RESOLUCAO_ACESSO_S = 60
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    chave TEXT PRIMARY KEY,
+    funcao TEXT NOT NULL,
+    dados BLOB NOT NULL,
+    tamanho INTEGER NOT NULL,
+    criado_em REAL NOT NULL,
+    acessado_em REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_resultados_acesso ON resultados (acessado_em);
+"""
+
+
+def serializar_resultado(resultado):
+    """
+    Converte um dict de resultados em bytes no formato .npz (sem pickle)
+
+    Arrays numéricos são gravados como estão; arrays de objetos (textos)
+    viram arrays de texto; os demais valores precisam ser JSON.
+
+    Raises:
+        TypeError: Se o resultado não for um dict serializável
+    """
+    if not isinstance(resultado, dict):
+        raise TypeError("Cache em disco aceita apenas dicts de resultados")
+
+    arrays = {}
+    estrutura = {}
+    for nome, valor in resultado.items():
+        if isinstance(valor, np.ndarray):
+            if valor.dtype == object:
+                arrays[nome] = valor.astype(str)
+                estrutura[nome] = 'objeto'
+            else:
+                arrays[nome] = valor
+                estrutura[nome] = 'array'
+        else:
+            estrutura[nome] = ['json', valor]
+
+    arrays['__estrutura__'] = np.frombuffer(json.dumps(estrutura).encode("utf-8"), dtype=np.uint8)
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def desserializar_resultado(dados):
+    """
+    Reconstrói o dict gravado por serializar_resultado
+
+    Raises:
+        Um dos ERROS_DESSERIALIZACAO se os bytes não forem um registro válido
+    """
+    with np.load(io.BytesIO(dados), allow_pickle=False) as arquivo:
+        estrutura = json.loads(arquivo['__estrutura__'].tobytes().decode("utf-8"))
+        resultado = {}
+        for nome, tipo in estrutura.items():
+            if tipo == 'array':
+                resultado[nome] = arquivo[nome]
+            elif tipo == 'objeto':
+                resultado[nome] = arquivo[nome].astype(object)
+            else:
+                resultado[nome] = tipo[1]
+    return resultado
+
+
+def chave_disco(funcao, params, *entradas):
+    """
+    Chave textual estável entre processos para um cálculo
+
+    Returns:
+        Hash SHA-256 hexadecimal
+
+    Raises:
+        TypeError: Se alguma entrada não tiver representação estável
+    """
+    texto = repr((FORMATO_CACHE_DISCO, chave_calculo(funcao, params, *entradas)))
+    if " at 0x" in texto:  # objeto sem conteúdo identificável: a chave mudaria a cada processo
+        raise TypeError("Entrada sem representação estável para o cache em disco")
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheDisco:
+    """Cache de resultados em SQLite (WAL) com limite de tamanho e descarte LRU"""
+
+    def __init__(self, caminho, limite_bytes=LIMITE_CACHE_DISCO_MB * 1024 * 1024):
+        self.caminho = str(caminho)
+        self.limite_bytes = limite_bytes
+        Path(self.caminho).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conexao = sqlite3.connect(self.caminho, timeout=10, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(ESQUEMA)
+
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def obter(self, chave):
+        """
+        Resultado gravado para a chave
+
+        Um registro ilegível é apagado e tratado como ausente, para que o
+        resultado seja recalculado e gravado de novo.
+
+        Returns:
+            Tuple (encontrado, resultado)
+        """
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT dados, acessado_em FROM resultados WHERE chave = ?", (chave,)
+            ).fetchone()
+            if linha is None:
+                self.falhas += 1
+                return False, None
+
+            agora = time.time()
+            if agora - linha[1] >= RESOLUCAO_ACESSO_S:
+                with self._conexao:
+                    self._conexao.execute(
+                        "UPDATE resultados SET acessado_em = ? WHERE chave = ?", (agora, chave)
+                    )
+
+        try:
+            resultado = desserializar_resultado(linha[0])
+        except ERROS_DESSERIALIZACAO:
+            with self._lock, self._conexao:
+                # Só o registro lido: outro processo pode já ter gravado um válido
+                self._conexao.execute(
+                    "DELETE FROM resultados WHERE chave = ? AND dados = ?", (chave, linha[0])
+                )
+                self.falhas += 1
+                self.remocoes += 1
+            return False, None
+
+        with self._lock:
+            self.acertos += 1
+        return True, resultado
+
+    def guardar(self, chave, funcao, resultado):
+        """Grava um resultado e descarta os menos acessados acima do limite"""
+        dados = serializar_resultado(resultado)
+        if len(dados) > self.limite_bytes // 4:  # resultado grande demais: descartaria o resto do cache
+            return
+        agora = time.time()
+
+        with self._lock, self._conexao:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO resultados (chave, funcao, dados, tamanho, criado_em, acessado_em) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (chave, funcao, dados, len(dados), agora, agora)
+            )
+
+            excesso = self._conexao.execute(
+                "SELECT COALESCE(SUM(tamanho), 0) FROM resultados"
+            ).fetchone()[0] - self.limite_bytes
+            if excesso <= 0:
+                return
+
+            descartar = []
+            for chave_antiga, tamanho in self._conexao.execute(
+                "SELECT chave, tamanho FROM resultados WHERE chave != ? ORDER BY acessado_em", (chave,)
+            ):
+                if excesso <= 0:
+                    break
+                descartar.append((chave_antiga,))
+                excesso -= tamanho
+
+            self._conexao.executemany("DELETE FROM resultados WHERE chave = ?", descartar)
+            self.remocoes += len(descartar)
+
+    def limpar(self):
+        """Remove todas as entradas"""
+        with self._lock, self._conexao:
+            self._conexao.execute("DELETE FROM resultados")
+        with self._lock:
+            self._conexao.execute("VACUUM")
+
+    def estatisticas(self):
+        """
+        Contadores do processo e ocupação do banco
+
+        Returns:
+            Dict com entradas, tamanho_bytes, limite_bytes, acertos, falhas e remoções
+        """
+        with self._lock:
+            entradas, tamanho = self._conexao.execute(
+                "SELECT COUNT(*), COALESCE(SUM(tamanho), 0) FROM resultados"
+            ).fetchone()
+            return {
+                'entradas': entradas,
+                'tamanho_bytes': tamanho,
+                'limite_bytes': self.limite_bytes,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'remocoes': self.remocoes
+            }
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def obter_cache_disco(caminho=None):
+    """
+    Cache em disco configurado (um por processo e caminho)
+
+    Args:
+        caminho: Caminho do banco; padrão é AMARO_CACHE_DISCO_DB ou CACHE_DISCO_FILE
+
+    Returns:
+        CacheDisco ou None se o cache em disco estiver desativado ou indisponível
+    """
+    if caminho is None:
+        caminho = os.environ.get(CACHE_DISCO_ENV, CACHE_DISCO_FILE)
+    if not caminho:
+        return None
+
+    # Processos filhos (fork) abrem sua própria conexão
+    chave = (caminho, os.getpid())
+    with _caches_lock:
+        if chave not in _caches:
+            try:
+                limite_mb = float(os.environ.get(LIMITE_CACHE_DISCO_ENV, LIMITE_CACHE_DISCO_MB))
+                _caches[chave] = CacheDisco(caminho, int(limite_mb * 1024 * 1024))
+            except (OSError, ValueError, sqlite3.Error):
+                _caches[chave] = None
+        return _caches[chave]
+
+
+def cache_disco(funcao):
+    """
+    Decorador: persiste em disco o dict de arrays retornado por um cálculo
+
+    Mesma chave do cache em memória (função, hash dos parâmetros, entradas).
+    Falhas do banco (bloqueado, corrompido, sem espaço) nunca impedem o
+    cálculo: o resultado é apenas recalculado.
+
+    Args:
+        funcao: Função de cálculo com um argumento chamado 'params' que
+                retorna um dict de arrays e valores JSON
+
+    Returns:
+        Função decorada, com o mesmo comportamento e assinatura
+    """
+    separar = separador_entradas(funcao)
+    nome = funcao.__qualname__
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        cache = obter_cache_disco()
+        if cache is None:
+            return funcao(*args, **kwargs)
+
+        params, entradas = separar(args, kwargs)
+        try:
+            chave = chave_disco(funcao, params, *entradas)
+            encontrado, resultado = cache.obter(chave)
+        except (TypeError, sqlite3.Error):
+            return funcao(*args, **kwargs)
+
+        if encontrado:
+            return resultado
+
+        resultado = funcao(*args, **kwargs)
+        try:
+            cache.guardar(chave, nome, resultado)
+        except (TypeError, ValueError, sqlite3.Error):
+            pass
+        return resultado
+
+    envoltorio.sem_cache = funcao
+    return envoltorio
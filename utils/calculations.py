@@ -1,8 +1,195 @@
 """
 Sistema de cálculos refatorado para estrutura multipage
 Função principal calcula_custo_trecho() atualizada conforme especificação
+Motor vetorizado calcula_custos_lote() para precificação em lote
 """
 
+import numpy as np
+
+from utils.cache import cache_calculo
+from utils.cache_disco import cache_disco
+
+# Componentes do breakdown de custos, na ordem usada pelo total
+COMPONENTES_CUSTO = (
+    "combustivel", "manutencao", "tripulacao", "seguro",
+    "hangar", "ferry", "planejamento", "depreciacao"
+)
+
+# Custos fixos proporcionais (estimativa para o período)
+# Baseado em horas anuais típicas de 400h
+HORAS_ANUAIS_REF = 400
+SEGURO_ANUAL = 200000  # Seguro anual proporcional
+HANGAR_ANUAL = 120000  # Hangar anual proporcional
+FERRY_HORA = 200  # Ferry/posicionamento estimado por hora
+PLANEJAMENTO_HORA = 150  # Planejamento/administração por hora
+
+
+# Colunas da tabela de coeficientes: custo por hora de cada componente,
+# preço de mercado por hora e os fatores do combustível (consumo L/h e
+# preço R$/L) guardados separados para refazer a conta na ordem original
+COLUNAS_COEFICIENTES = COMPONENTES_CUSTO + ("preco_mercado", "consumo", "preco_combustivel")
+
+
+def construir_tabela_coeficientes(params):
+    """
+    Monta a tabela imutável de coeficientes horários por modelo
+
+    Cada linha corresponde a um modelo (na ordem de params['modelos_disponiveis'])
+    e cada coluna a um item de COLUNAS_COEFICIENTES (custos e preço em R$/h).
+
+    Args:
+        params: Dicionário com os dicionários por modelo já calculados
+
+    Returns:
+        Tuple (matriz somente leitura, dict modelo → índice da linha)
+    """
+    nomes = list(params.get('modelos_disponiveis') or params.get('consumo_modelos', {}).keys())
+    n = len(nomes)
+
+    consumo = np.array([params['consumo_modelos'][m] for m in nomes], dtype=float)
+
+    tabela = np.empty((n, len(COLUNAS_COEFICIENTES)), dtype=float)
+    tabela[:, 0] = consumo * params['preco_combustivel']
+    tabela[:, 1] = [params['custo_manutencao'][m] for m in nomes]
+    tabela[:, 2] = [params['custo_piloto_hora_modelo'][m] for m in nomes]
+    tabela[:, 3] = SEGURO_ANUAL / HORAS_ANUAIS_REF
+    tabela[:, 4] = HANGAR_ANUAL / HORAS_ANUAIS_REF
+    tabela[:, 5] = FERRY_HORA
+    tabela[:, 6] = PLANEJAMENTO_HORA
+    tabela[:, 7] = [params['depreciacao_hora'][m] for m in nomes]
+    tabela[:, 8] = [params['preco_mercado_hora'][m] for m in nomes]
+    tabela[:, 9] = consumo
+    tabela[:, 10] = params['preco_combustivel']
+    tabela.setflags(write=False)
+
+    return tabela, {nome: i for i, nome in enumerate(nomes)}
+
+
+def tabela_coeficientes(params):
+    """
+    Retorna a tabela de coeficientes pré-compilada por load_params,
+    ou a constrói a partir dos dicionários se params foi montado à mão
+
+    Returns:
+        Tuple (matriz de coeficientes, dict modelo → índice da linha)
+    """
+    if 'coeficientes_modelos' in params and 'indice_modelos' in params:
+        return params['coeficientes_modelos'], params['indice_modelos']
+    return construir_tabela_coeficientes(params)
+
+
+def indices_modelos(modelos, params):
+    """
+    Converte nomes de modelos (ou índices já resolvidos) em índices de linha
+
+    Args:
+        modelos: Nome, índice ou array/Series de nomes ou índices
+        params: Dicionário com parâmetros carregados
+
+    Returns:
+        np.ndarray de inteiros com o índice de cada modelo
+    """
+    tabela, posicao = tabela_coeficientes(params)
+    modelos = np.asarray(modelos)
+
+    if modelos.dtype.kind in 'iu':
+        if modelos.size and (modelos.min() < 0 or modelos.max() >= len(tabela)):
+            raise ValueError("Índice de modelo fora do intervalo")
+        return modelos.astype(np.intp)
+
+    try:
+        return np.array([posicao[m] for m in modelos.ravel()], dtype=np.intp).reshape(modelos.shape)
+    except KeyError as e:
+        raise ValueError(f"Modelo '{e.args[0]}' não encontrado")
+
+
+def custos_componentes(taxas, horas, preco_combustivel=None):
+    """
+    Custo de cada componente a partir das linhas da tabela de coeficientes
+
+    Repete a ordem das operações de calcula_custo_trecho original
+    (horas × consumo × preço, valor anual × horas / 400, soma na ordem de
+    COMPONENTES_CUSTO), para que os resultados sejam idênticos bit a bit.
+
+    Args:
+        taxas: Linhas da tabela de coeficientes (tabela[idx])
+        horas: Array de horas de voo (mesmo formato de taxas[..., 0])
+        preco_combustivel: Preço do combustível (R$/L) que substitui o da
+                           tabela (opcional, escalar ou array)
+
+    Returns:
+        Dict de arrays com as colunas de COMPONENTES_CUSTO e "total"
+    """
+    coluna = COLUNAS_COEFICIENTES.index
+    if preco_combustivel is None:
+        preco_combustivel = taxas[..., coluna("preco_combustivel")]
+    fator_proporcional = horas / HORAS_ANUAIS_REF
+
+    resultado = {
+        "combustivel": horas * taxas[..., coluna("consumo")] * preco_combustivel,
+        "manutencao": horas * taxas[..., coluna("manutencao")],
+        "tripulacao": horas * taxas[..., coluna("tripulacao")],
+        "seguro": SEGURO_ANUAL * fator_proporcional,
+        "hangar": HANGAR_ANUAL * fator_proporcional,
+        "ferry": horas * FERRY_HORA,
+        "planejamento": horas * PLANEJAMENTO_HORA,
+        "depreciacao": horas * taxas[..., coluna("depreciacao")]
+    }
+
+    total = resultado["combustivel"]
+    for componente in COMPONENTES_CUSTO[1:]:
+        total = total + resultado[componente]
+    resultado["total"] = total
+
+    return resultado
+
+
+def calcula_custo_total_lote(modelos, horas, params):
+    """
+    Custo total (sem breakdown) para vários trechos
+
+    Args:
+        modelos: Array de índices de modelo ou de nomes
+        horas: Array de horas de voo
+        params: Dicionário com parâmetros carregados
+
+    Returns:
+        np.ndarray com o custo total de cada trecho
+    """
+    idx = indices_modelos(modelos, params)
+    tabela, _ = tabela_coeficientes(params)
+    return custos_componentes(tabela[idx], np.asarray(horas, dtype=float))["total"]
+
+
+def calcula_custos_lote(modelos, horas, params):
+    """
+    Calcula o breakdown de custos para vários trechos em uma única passada vetorizada
+
+    Args:
+        modelos: Array de índices de modelo (ver indices_modelos) ou de nomes,
+                 ou DataFrame com colunas 'modelo' e 'horas'
+        horas: Array de horas de voo (ignorado se modelos for DataFrame)
+        params: Dicionário com parâmetros carregados
+
+    Returns:
+        Dict de arrays com as colunas de COMPONENTES_CUSTO e "total",
+        todas com o formato de `horas`
+    """
+    if hasattr(modelos, 'columns'):
+        horas = modelos['horas'].to_numpy()
+        modelos = modelos['modelo'].to_numpy()
+
+    idx = indices_modelos(modelos, params)
+    horas = np.asarray(horas, dtype=float)
+    idx, horas = np.broadcast_arrays(idx, horas)
+
+    if np.any(horas <= 0):
+        raise ValueError("Número de horas deve ser maior que zero")
+
+    tabela, _ = tabela_coeficientes(params)
+    return custos_componentes(tabela[idx], horas)
+
+
 def calcula_custo_trecho(modelo, horas, params):
     """
     Calcula todos os custos para um trecho/período específico
@@ -26,61 +213,176 @@ def calcula_custo_trecho(modelo, horas, params):
             "total": soma
         }
     """
-    if modelo not in params.get('consumo_modelos', {}):
+    if modelo not in tabela_coeficientes(params)[1]:
         raise ValueError(f"Modelo '{modelo}' não encontrado")
     
     if horas <= 0:
         raise ValueError("Número de horas deve ser maior que zero")
     
-    # Cálculo do combustível
-    consumo_lh = params['consumo_modelos'][modelo]
-    preco_combustivel = params['preco_combustivel']
-    custo_combustivel = horas * consumo_lh * preco_combustivel
-    
-    # Cálculo da manutenção
-    custo_manutencao_hora = params['custo_manutencao'][modelo]
-    custo_manutencao = horas * custo_manutencao_hora
-    
-    # Cálculo da tripulação (piloto)
-    custo_piloto_hora = params['custo_piloto_hora_modelo'][modelo]
-    custo_tripulacao = horas * custo_piloto_hora
-    
-    # Cálculo da depreciação
-    depreciacao_hora = params['depreciacao_hora'][modelo]
-    custo_depreciacao = horas * depreciacao_hora
-    
-    # Custos fixos proporcionais (estimativa para o período)
-    # Baseado em horas anuais típicas de 400h
-    horas_anuais_ref = 400
-    fator_proporcional = horas / horas_anuais_ref
-    
-    # Estimativas de custos fixos anuais
-    custo_seguro = 200000 * fator_proporcional  # Seguro anual proporcional
-    custo_hangar = 120000 * fator_proporcional  # Hangar anual proporcional
-    custo_ferry = horas * 200  # Ferry/posicionamento estimado por hora
-    custo_planejamento = horas * 150  # Planejamento/administração por hora
+    lote = calcula_custos_lote([modelo], [horas], params)
+    resultado = {chave: float(valores[0]) for chave, valores in lote.items()}
     
-    # Total
-    total = (custo_combustivel + custo_manutencao + custo_tripulacao + 
-             custo_seguro + custo_hangar + custo_ferry + 
-             custo_planejamento + custo_depreciacao)
+    # Manter compatibilidade com código existente
+    resultado.update({
+        "preco_comb": resultado["combustivel"],
+        "manut": resultado["manutencao"],
+        "piloto": resultado["tripulacao"],
+        "depr": resultado["depreciacao"]
+    })
     
+    return resultado
+
+def _fator_anual(taxas):
+    """
+    Fator anual de cada taxa (mesma composição mensal ** 12 do cálculo original)
+
+    Calculado com float do Python, cuja pow difere de np.power no último
+    dígito, para manter os resultados idênticos aos da versão escalar.
+    """
+    return np.array([((1 + t / 100) ** (1 / 12)) ** 12 for t in np.atleast_1d(taxas).tolist()])
+
+def _degraus_anuais(valor_inicial, fator, num_meses):
+    """
+    Série mensal em degraus anuais: produto acumulado ano a ano, expandido
+    para 12 meses por ano (linhas = cenários, colunas = meses)
+    """
+    valor_inicial = np.atleast_1d(valor_inicial)
+    anos = -(-num_meses // 12)
+    degraus = np.empty((valor_inicial.shape[0], max(anos, 1)))
+    degraus[:, 0] = valor_inicial
+    degraus[:, 1:] = np.atleast_1d(fator)[:, None]
+    return np.repeat(np.multiply.accumulate(degraus, axis=1), 12, axis=1)[:, :num_meses]
+
+def series_projecao(modelos, horas_mes, num_meses, params, taxa_crescimento=0,
+                    inflacao_custos=0, reajuste_preco=0, preco_hora=None):
+    """
+    Séries mensais comuns à projeção e à frota (cenários × meses)
+
+    Crescimento de horas e reajuste de preço são degraus anuais acumulados
+    (aplicados nos meses 13, 25, ...); a inflação de custos incide só sobre
+    os meses de aniversário, como na projeção original. Horas zero são
+    aceitas (aeronave parada, custo zero).
+
+    Args:
+        modelos: Nome/índice do modelo ou array de nomes/índices
+        horas_mes: Horas mensais iniciais por cenário
+        num_meses: Número de meses (comum a todos os cenários)
+        params: Parâmetros do sistema
+        taxa_crescimento: Taxa de crescimento anual (%) por cenário
+        inflacao_custos: Taxa de inflação de custos anual (%) por cenário
+        reajuste_preco: Taxa de reajuste de preços anual (%) por cenário
+        preco_hora: Preço inicial por hora por cenário; None (ou NaN) usa
+                    o preço de mercado do modelo
+
+    Returns:
+        Dict com 'idx' e 'meses' (1-D) e arrays 2-D 'horas_mensais',
+        'preco_hora', 'inflacao' (fator do mês: 1 fora dos aniversários) e
+        'custos' (custo operacional do mês, já com a inflação)
+    """
+    idx, horas_mes, taxa_crescimento, inflacao_custos, reajuste_preco = (
+        np.atleast_1d(a) for a in np.broadcast_arrays(
+            indices_modelos(modelos, params), np.asarray(horas_mes, dtype=float),
+            np.asarray(taxa_crescimento, dtype=float), np.asarray(inflacao_custos, dtype=float),
+            np.asarray(reajuste_preco, dtype=float)
+        )
+    )
+    meses = np.arange(1, num_meses + 1)
+
+    tabela, _ = tabela_coeficientes(params)
+    preco_inicial = tabela[idx, COLUNAS_COEFICIENTES.index("preco_mercado")]
+    if preco_hora is not None:
+        preco_hora = np.broadcast_to(np.asarray(preco_hora, dtype=float), preco_inicial.shape)
+        preco_inicial = np.where(np.isnan(preco_hora), preco_inicial, preco_hora)
+
+    horas_mensais = _degraus_anuais(horas_mes, _fator_anual(taxa_crescimento), num_meses)
+    preco_mensal = _degraus_anuais(preco_inicial, _fator_anual(reajuste_preco), num_meses)
+
+    # Inflação nos meses de aniversário (multiplicar por 1.0 nos demais é exato)
+    aniversario = (meses > 1) & (meses % 12 == 1)
+    inflacao = np.where(aniversario, _fator_anual(inflacao_custos)[:, None], 1.0)
+
+    custos = custos_componentes(tabela[idx][:, None, :], horas_mensais)["total"] * inflacao
+
+    return {
+        'idx': idx,
+        'meses': meses,
+        'horas_mensais': horas_mensais,
+        'preco_hora': preco_mensal,
+        'inflacao': inflacao,
+        'custos': custos
+    }
+
+@cache_disco
+def calcular_projecao_lote(modelos, horas_mes, num_meses, params,
+                           taxa_crescimento=0, inflacao_custos=0,
+                           reajuste_preco=0, investimento_inicial=0):
+    """
+    Calcula a projeção mensal de vários cenários de uma só vez
+
+    Crescimento de horas e reajuste de preço são degraus anuais acumulados
+    (aplicados nos meses 13, 25, ...); a inflação de custos incide sobre os
+    meses de aniversário. Os argumentos de cenário aceitam escalares ou
+    arrays e são combinados por broadcasting.
+
+    Args:
+        modelos: Nome/índice do modelo ou array de nomes/índices
+        horas_mes: Horas mensais iniciais por cenário
+        num_meses: Número de meses para projetar (comum a todos os cenários)
+        params: Parâmetros do sistema
+        taxa_crescimento: Taxa de crescimento anual (%) por cenário
+        inflacao_custos: Taxa de inflação de custos anual (%) por cenário
+        reajuste_preco: Taxa de reajuste de preços anual (%) por cenário
+        investimento_inicial: Investimento inicial por cenário
+
+    Returns:
+        Dict com 'meses' (1-D) e arrays 2-D (cenários × meses) para
+        'receitas', 'custos', 'lucros', 'fluxo_caixa' e 'horas_mensais';
+        'breakeven_mes' é um array por cenário com 0 quando não há breakeven
+    """
+    idx, horas_mes, taxa_crescimento, inflacao_custos, reajuste_preco, investimento_inicial = (
+        np.atleast_1d(a) for a in np.broadcast_arrays(
+            indices_modelos(modelos, params), np.asarray(horas_mes, dtype=float),
+            np.asarray(taxa_crescimento, dtype=float), np.asarray(inflacao_custos, dtype=float),
+            np.asarray(reajuste_preco, dtype=float), np.asarray(investimento_inicial, dtype=float)
+        )
+    )
+    n_cenarios = idx.shape[0]
+
+    series = series_projecao(idx, horas_mes, num_meses, params,
+                             taxa_crescimento, inflacao_custos, reajuste_preco)
+    meses = series['meses']
+    horas_mensais = series['horas_mensais']
+    preco_hora = series['preco_hora']
+    custos = series['custos']
+
+    if np.any(horas_mensais <= 0):
+        raise ValueError("Número de horas deve ser maior que zero")
+
+    # Receita (assumindo 50% das horas para charter com 75% ocupação)
+    horas_charter = horas_mensais * 0.5 * 0.75
+    receita_bruta = horas_charter * preco_hora
+    receitas = receita_bruta * 0.9  # 90% para proprietário
+
+    lucros = receitas - custos
+    fluxo_caixa = np.cumsum(
+        np.concatenate([-investimento_inicial[:, None], lucros], axis=1), axis=1
+    )[:, 1:]
+
+    # Primeiro mês com saldo acumulado positivo (0 = sem breakeven)
+    positivo = fluxo_caixa > 0
+    if num_meses:
+        breakeven_mes = np.where(positivo.any(axis=1), positivo.argmax(axis=1) + 1, 0)
+    else:
+        breakeven_mes = np.zeros(n_cenarios, dtype=int)
+
     return {
-        "combustivel": custo_combustivel,
-        "manutencao": custo_manutencao,
-        "tripulacao": custo_tripulacao,
-        "seguro": custo_seguro,
-        "hangar": custo_hangar,
-        "ferry": custo_ferry,
-        "planejamento": custo_planejamento,
-        "depreciacao": custo_depreciacao,
-        "total": total,
-        
-        # Manter compatibilidade com código existente
-        "preco_comb": custo_combustivel,
-        "manut": custo_manutencao,
-        "piloto": custo_tripulacao,
-        "depr": custo_depreciacao
+        'meses': meses,
+        'receitas': receitas,
+        'custos': custos,
+        'lucros': lucros,
+        'fluxo_caixa': fluxo_caixa,
+        'horas_mensais': horas_mensais,
+        'breakeven_mes': breakeven_mes
     }
 
 def calcular_projecao_mensal(modelo, horas_mes, num_meses, params, 
@@ -102,65 +404,24 @@ def calcular_projecao_mensal(modelo, horas_mes, num_meses, params,
     Returns:
         Dict com projeção detalhada
     """
+    if modelo not in tabela_coeficientes(params)[1]:
+        raise ValueError(f"Modelo '{modelo}' não encontrado")
+    
+    lote = calcular_projecao_lote(
+        [modelo], horas_mes, num_meses, params,
+        taxa_crescimento, inflacao_custos, reajuste_preco, investimento_inicial
+    )
     
     projecao = {
-        'meses': [],
-        'receitas': [],
-        'custos': [],
-        'lucros': [],
-        'fluxo_caixa': [],
-        'horas_mensais': [],
-        'breakeven_mes': None
+        serie: lote[serie][0].tolist()
+        for serie in ('receitas', 'custos', 'lucros', 'fluxo_caixa', 'horas_mensais')
     }
-    
-    # Valores iniciais
-    horas_atual = horas_mes
-    preco_hora_atual = params['preco_mercado_hora'][modelo]
-    saldo_acumulado = -investimento_inicial
-    
-    # Fatores de crescimento mensais
-    fator_crescimento_mensal = (1 + taxa_crescimento/100) ** (1/12)
-    fator_inflacao_mensal = (1 + inflacao_custos/100) ** (1/12)
-    fator_reajuste_mensal = (1 + reajuste_preco/100) ** (1/12)
-    
-    for mes in range(1, num_meses + 1):
-        # Aplicar crescimento
-        if mes > 1:
-            if mes % 12 == 1:  # A cada ano
-                horas_atual *= fator_crescimento_mensal ** 12
-                preco_hora_atual *= fator_reajuste_mensal ** 12
-        
-        # Calcular custos do mês
-        resultado_mes = calcula_custo_trecho(modelo, horas_atual, params)
-        custo_mensal = resultado_mes['total']
-        
-        # Aplicar inflação nos custos
-        if mes > 1 and mes % 12 == 1:  # A cada ano
-            custo_mensal *= fator_inflacao_mensal ** 12
-        
-        # Calcular receita (assumindo 50% das horas para charter com 75% ocupação)
-        horas_charter = horas_atual * 0.5 * 0.75
-        receita_bruta = horas_charter * preco_hora_atual
-        receita_proprietario = receita_bruta * 0.9  # 90% para proprietário
-        
-        # Lucro mensal
-        lucro_mensal = receita_proprietario - custo_mensal
-        saldo_acumulado += lucro_mensal
-        
-        # Verificar breakeven
-        if saldo_acumulado > 0 and projecao['breakeven_mes'] is None:
-            projecao['breakeven_mes'] = mes
-        
-        # Armazenar dados
-        projecao['meses'].append(mes)
-        projecao['receitas'].append(receita_proprietario)
-        projecao['custos'].append(custo_mensal)
-        projecao['lucros'].append(lucro_mensal)
-        projecao['fluxo_caixa'].append(saldo_acumulado)
-        projecao['horas_mensais'].append(horas_atual)
+    projecao['meses'] = lote['meses'].tolist()
+    projecao['breakeven_mes'] = int(lote['breakeven_mes'][0]) or None
     
     return projecao
 
+@cache_calculo
 def calcular_comparativo_gestao(modelo, horas_anuais, params, custos_fixos_externos):
     """
     Calcula comparativo entre gestão própria e gestão Amaro
@@ -223,7 +484,9 @@ def calcular_comparativo_gestao(modelo, horas_anuais, params, custos_fixos_exter
         }
     }
 
-def calcular_custo_rota(origem, destino, modelo, params, rotas_disponiveis):
+@cache_calculo
+def calcular_custo_rota(origem, destino, modelo, params, rotas_disponiveis,
+                        permitir_inverso=False):
     """
     Calcula custo específico para uma rota
     
@@ -232,18 +495,28 @@ def calcular_custo_rota(origem, destino, modelo, params, rotas_disponiveis):
         destino: Código do aeroporto de destino
         modelo: Modelo da aeronave
         params: Parâmetros do sistema
-        rotas_disponiveis: Lista de rotas disponíveis
+        rotas_disponiveis: IndiceRotas (busca O(1)) ou lista de rotas disponíveis
+        permitir_inverso: Aceitar a rota cadastrada no sentido oposto
     
     Returns:
         Dict com análise da rota
     """
     
     # Buscar duração da rota
-    rota_info = None
-    for rota in rotas_disponiveis:
-        if rota['origem'] == origem and rota['destino'] == destino:
-            rota_info = rota
-            break
+    if hasattr(rotas_disponiveis, 'buscar'):
+        rota_info = rotas_disponiveis.buscar(origem, destino, permitir_inverso)
+    else:
+        rota_info = None
+        pares = [(origem, destino)]
+        if permitir_inverso:
+            pares.append((destino, origem))
+        for par in pares:
+            for rota in rotas_disponiveis:
+                if (rota['origem'], rota['destino']) == par:
+                    rota_info = rota
+                    break
+            if rota_info:
+                break
     
     if not rota_info:
         raise ValueError(f"Rota {origem} → {destino} não encontrada")
@@ -277,6 +550,156 @@ def calcular_custo_rota(origem, destino, modelo, params, rotas_disponiveis):
         'viavel': economia > 0
     }
 
+@cache_disco
+def calcular_matriz_rotas(params, rotas_disponiveis, modelos=None):
+    """
+    Calcula custo, preço de mercado e economia de todas as rotas para todos
+    os modelos em uma única passada vetorizada
+
+    Args:
+        params: Parâmetros do sistema
+        rotas_disponiveis: IndiceRotas ou lista de rotas disponíveis
+        modelos: Modelos a considerar (padrão: todos os modelos disponíveis)
+
+    Returns:
+        Dict de arrays (uma linha por par rota × modelo) com 'origem',
+        'destino', 'modelo', 'duracao_horas', 'custo_amaro', 'preco_mercado',
+        'economia', 'economia_percentual' e 'viavel'
+    """
+    if hasattr(rotas_disponiveis, 'duracao_h'):
+        origens = rotas_disponiveis.origem
+        destinos = rotas_disponiveis.destino
+        duracoes = rotas_disponiveis.duracao_h
+    else:
+        origens = np.array([r['origem'] for r in rotas_disponiveis], dtype=object)
+        destinos = np.array([r['destino'] for r in rotas_disponiveis], dtype=object)
+        duracoes = np.array([r['duracao_h'] for r in rotas_disponiveis], dtype=float)
+
+    if np.any(duracoes <= 0):
+        raise ValueError("Número de horas deve ser maior que zero")
+
+    tabela, indice = tabela_coeficientes(params)
+    if modelos is None:
+        modelos = list(indice)
+    idx_modelos = indices_modelos(modelos, params)
+
+    # Produto cartesiano rota × modelo (rotas externas, modelos internos)
+    n_rotas, n_modelos = len(duracoes), len(idx_modelos)
+    linha_rota = np.repeat(np.arange(n_rotas), n_modelos)
+    idx = np.tile(idx_modelos, n_rotas)
+    duracao = duracoes[linha_rota]
+
+    custo_amaro = calcula_custo_total_lote(idx, duracao, params)
+    preco_mercado = duracao * tabela[idx, COLUNAS_COEFICIENTES.index("preco_mercado")]
+
+    economia = preco_mercado - custo_amaro
+    with np.errstate(divide='ignore', invalid='ignore'):
+        economia_percentual = np.where(preco_mercado > 0, economia / preco_mercado * 100, 0.0)
+
+    return {
+        'origem': np.asarray(origens)[linha_rota],
+        'destino': np.asarray(destinos)[linha_rota],
+        'modelo': np.asarray(list(indice), dtype=object)[idx],
+        'duracao_horas': duracao,
+        'custo_amaro': custo_amaro,
+        'preco_mercado': preco_mercado,
+        'economia': economia,
+        'economia_percentual': economia_percentual,
+        'viavel': economia > 0
+    }
+
+def calcular_lucro_charter_lote(modelos, horas_charter, taxa_ocupacao, preco_hora, params,
+                                preco_combustivel=None):
+    """
+    Versão vetorizada de calcular_lucro_mensal_charter para muitos cenários
+
+    Args:
+        modelos: Nome/índice do modelo ou array de nomes/índices
+        horas_charter: Horas disponíveis para charter por mês
+        taxa_ocupacao: Taxa de ocupação (0-100)
+        preco_hora: Preço por hora de charter
+        params: Parâmetros do sistema
+        preco_combustivel: Preço do combustível (R$/L) por cenário;
+                           None usa params['preco_combustivel']
+
+    Returns:
+        Dict de arrays (formato do broadcasting das entradas) com
+        'horas_efetivas', 'receita_bruta', 'receita_proprietario',
+        'taxa_amaro', 'custos_operacionais', 'lucro_liquido' e 'roi_mensal'
+    """
+    idx = indices_modelos(modelos, params)
+    horas_charter = np.asarray(horas_charter, dtype=float)
+    taxa_ocupacao = np.asarray(taxa_ocupacao, dtype=float)
+    preco_hora = np.asarray(preco_hora, dtype=float)
+
+    # Horas efetivas
+    horas_efetivas = horas_charter * (taxa_ocupacao / 100)
+
+    # Receitas
+    receita_bruta = preco_hora * horas_efetivas
+    receita_proprietario = receita_bruta * params.get('percentual_proprietario', 0.9)
+    taxa_amaro = receita_bruta - receita_proprietario
+
+    # Custos operacionais (combustível opcionalmente com outro preço)
+    tabela, _ = tabela_coeficientes(params)
+    if preco_combustivel is not None:
+        preco_combustivel = np.asarray(preco_combustivel, dtype=float)
+    idx_custos, horas_custos = np.broadcast_arrays(idx, horas_efetivas)
+    custos = custos_componentes(tabela[idx_custos], horas_custos, preco_combustivel)["total"]
+
+    # Lucro
+    lucro_liquido = receita_proprietario - custos
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi_mensal = np.where(custos > 0, lucro_liquido / custos * 100, 0.0)
+
+    return {
+        'horas_efetivas': horas_efetivas,
+        'receita_bruta': receita_bruta,
+        'receita_proprietario': receita_proprietario,
+        'taxa_amaro': taxa_amaro,
+        'custos_operacionais': custos,
+        'lucro_liquido': lucro_liquido,
+        'roi_mensal': roi_mensal
+    }
+
+@cache_disco
+def calcular_grade_sensibilidade(modelo, horas_charter, params, ocupacoes=None, precos=None):
+    """
+    Calcula lucro líquido e ROI sobre uma grade ocupação × preço em uma chamada
+
+    Args:
+        modelo: Modelo da aeronave
+        horas_charter: Horas disponíveis para charter por mês
+        params: Parâmetros do sistema
+        ocupacoes: Taxas de ocupação (0-100); padrão 50% a 95% de 5 em 5
+        precos: Preços por hora de charter; padrão ±50% do preço de
+                mercado do modelo em 21 pontos
+
+    Returns:
+        Dict com 'ocupacoes', 'precos' e arrays 2-D (preços × ocupações)
+        para 'lucro_liquido' e 'roi_mensal'
+    """
+    if ocupacoes is None:
+        ocupacoes = np.arange(50, 96, 5)
+    if precos is None:
+        preco_mercado = params['preco_mercado_hora'][modelo]
+        precos = np.linspace(preco_mercado * 0.5, preco_mercado * 1.5, 21)
+
+    ocupacoes = np.asarray(ocupacoes, dtype=float)
+    precos = np.asarray(precos, dtype=float)
+
+    grade = calcular_lucro_charter_lote(
+        modelo, horas_charter, ocupacoes[None, :], precos[:, None], params
+    )
+
+    return {
+        'ocupacoes': ocupacoes,
+        'precos': precos,
+        'lucro_liquido': grade['lucro_liquido'],
+        'roi_mensal': grade['roi_mensal']
+    }
+
+@cache_calculo
 def calcular_lucro_mensal_charter(modelo, horas_charter, taxa_ocupacao, preco_hora, params):
     """
     Calcula análise de lucro mensal com operação charter
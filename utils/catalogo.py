@@ -0,0 +1,424 @@
+"""
+Catálogo SQLite opcional para modelos, rotas e versões de parâmetros
+
+Ativado pela variável de ambiente AMARO_CATALOGO_DB (caminho do banco).
+Sem ela o sistema continua usando config/parametros.json, data/modelos.csv
+e data/rotas.csv, que seguem servindo como formatos de importação/exportação:
+
+    python -m utils.catalogo importar
+    python -m utils.catalogo exportar
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from utils.storage import gravar_json, gravar_csv
+
+CATALOGO_ENV = "AMARO_CATALOGO_DB"
+
+# Remoções mantidas para leitores incrementais: as de revisões mais antigas
+# que esta janela são apagadas a cada gravação, e um leitor que ficou para
+# trás do ponto de poda recarrega a tabela inteira
+JANELA_REMOCOES = 1000
+
+# Tabelas versionadas linha a linha: chave primária e colunas de dados
+TABELAS = {
+    'modelos': {
+        'chave': ('modelo',),
+        'colunas': ('modelo', 'consumo_l_por_h', 'manut_tipo', 'tipo', 'velocidade_cruzeiro_kmh')
+    },
+    'rotas': {
+        'chave': ('origem', 'destino'),
+        'colunas': ('origem', 'destino', 'duracao_h')
+    }
+}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS modelos (
+    modelo TEXT PRIMARY KEY,
+    consumo_l_por_h REAL NOT NULL,
+    manut_tipo TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    velocidade_cruzeiro_kmh REAL,
+    ordem INTEGER NOT NULL,
+    revisao INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_modelos_revisao ON modelos (revisao);
+CREATE TABLE IF NOT EXISTS rotas (
+    origem TEXT NOT NULL,
+    destino TEXT NOT NULL,
+    duracao_h REAL NOT NULL,
+    ordem INTEGER NOT NULL,
+    revisao INTEGER NOT NULL,
+    PRIMARY KEY (origem, destino)
+);
+CREATE INDEX IF NOT EXISTS idx_rotas_destino ON rotas (destino);
+CREATE INDEX IF NOT EXISTS idx_rotas_revisao ON rotas (revisao);
+CREATE TABLE IF NOT EXISTS remocoes (
+    tabela TEXT NOT NULL,
+    chave TEXT NOT NULL,
+    revisao INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_remocoes_revisao ON remocoes (tabela, revisao);
+CREATE TABLE IF NOT EXISTS parametros (
+    versao INTEGER PRIMARY KEY AUTOINCREMENT,
+    dados TEXT NOT NULL,
+    descricao TEXT NOT NULL DEFAULT '',
+    criado_em TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+def _chave_texto(valores):
+    """Chave composta serializada para a tabela de remoções"""
+    return "|".join(str(v) for v in valores)
+
+
+class Catalogo:
+    """
+    Banco SQLite (modo WAL) com revisão por linha
+
+    Cada gravação recebe uma revisão global crescente; leitores guardam a
+    última revisão vista e buscam apenas as linhas alteradas ou removidas
+    desde então. As remoções ficam registradas por JANELA_REMOCOES
+    revisões; leitores mais atrasados que isso recarregam a tabela.
+    """
+
+    def __init__(self, caminho):
+        self.caminho = str(caminho)
+        Path(self.caminho).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conexao = sqlite3.connect(self.caminho, timeout=10, check_same_thread=False)
+        self._conexao.row_factory = sqlite3.Row
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(ESQUEMA)
+
+        # Espelho em memória de cada tabela e revisão já sincronizada
+        self._linhas = {tabela: {} for tabela in TABELAS}
+        self._revisao_lida = {tabela: 0 for tabela in TABELAS}
+        self._df_cache = {}
+
+    # ------------------------------------------------------------------
+    # Revisões
+    # ------------------------------------------------------------------
+    def revisoes(self):
+        """
+        Revisão atual de cada tabela (uma consulta)
+
+        Returns:
+            Dict com 'modelos', 'rotas' e 'parametros'
+        """
+        with self._lock:
+            meta = dict(self._conexao.execute("SELECT chave, valor FROM meta").fetchall())
+        return {
+            'modelos': meta.get('revisao_modelos', 0),
+            'rotas': meta.get('revisao_rotas', 0),
+            'parametros': meta.get('revisao_parametros', 0)
+        }
+
+    def _nova_revisao(self, tabela):
+        """Incrementa a revisão global e marca a tabela (dentro da transação)"""
+        self._conexao.execute(
+            "INSERT INTO meta (chave, valor) VALUES ('revisao', 1) "
+            "ON CONFLICT(chave) DO UPDATE SET valor = valor + 1"
+        )
+        revisao = self._conexao.execute("SELECT valor FROM meta WHERE chave = 'revisao'").fetchone()[0]
+        self._conexao.execute(
+            "INSERT INTO meta (chave, valor) VALUES (?, ?) "
+            "ON CONFLICT(chave) DO UPDATE SET valor = excluded.valor",
+            (f"revisao_{tabela}", revisao)
+        )
+        return revisao
+
+    # ------------------------------------------------------------------
+    # Tabelas versionadas (modelos e rotas)
+    # ------------------------------------------------------------------
+    def _sincronizar(self, tabela):
+        """Traz para memória apenas o que mudou desde a última leitura"""
+        # Uma transação de leitura: revisão, poda e linhas vêm do mesmo instante
+        with self._conexao:
+            self._conexao.execute("BEGIN")
+            meta = dict(self._conexao.execute(
+                "SELECT chave, valor FROM meta WHERE chave IN (?, ?)",
+                (f"revisao_{tabela}", f"remocoes_podadas_{tabela}")
+            ).fetchall())
+            atual = meta.get(f"revisao_{tabela}", 0)
+            lida = self._revisao_lida[tabela]
+            if atual == lida:
+                return False
+
+            spec = TABELAS[tabela]
+            linhas = self._linhas[tabela]
+            if lida < meta.get(f"remocoes_podadas_{tabela}", 0):
+                # Remoções desde a última leitura já foram podadas: recarrega tudo
+                linhas.clear()
+                lida = 0
+
+            # Remoções primeiro: uma chave removida e recriada volta pelas linhas
+            for (chave,) in self._conexao.execute(
+                "SELECT chave FROM remocoes WHERE tabela = ? AND revisao > ?", (tabela, lida)
+            ):
+                linhas.pop(chave, None)
+
+            colunas = ", ".join(spec['colunas'] + ('ordem',))
+            for linha in self._conexao.execute(
+                f"SELECT {colunas} FROM {tabela} WHERE revisao > ?", (lida,)
+            ):
+                registro = dict(linha)
+                linhas[_chave_texto(registro[c] for c in spec['chave'])] = registro
+
+        self._revisao_lida[tabela] = atual
+        return True
+
+    def _podar_remocoes(self, tabela, revisao):
+        """Apaga as remoções fora da janela e registra o ponto de poda (na transação)"""
+        horizonte = revisao - JANELA_REMOCOES
+        if horizonte <= 0:
+            return
+        self._conexao.execute(
+            "DELETE FROM remocoes WHERE tabela = ? AND revisao <= ?", (tabela, horizonte)
+        )
+        self._conexao.execute(
+            "INSERT INTO meta (chave, valor) VALUES (?, ?) "
+            "ON CONFLICT(chave) DO UPDATE SET valor = MAX(valor, excluded.valor)",
+            (f"remocoes_podadas_{tabela}", horizonte)
+        )
+
+    def _ler_tabela(self, tabela):
+        with self._lock:
+            self._sincronizar(tabela)
+            revisao = self._revisao_lida[tabela]
+            cache = self._df_cache.get(tabela)
+            if cache is None or cache[0] != revisao:
+                colunas = list(TABELAS[tabela]['colunas'])
+                registros = sorted(self._linhas[tabela].values(), key=lambda r: r['ordem'])
+                df = pd.DataFrame(registros, columns=colunas + ['ordem'])[colunas]
+                cache = (revisao, df)
+                self._df_cache[tabela] = cache
+            return cache[1].copy()
+
+    def _salvar_tabela(self, tabela, df):
+        """
+        Sincroniza a tabela com o DataFrame gravando só as linhas alteradas
+
+        Returns:
+            Número de linhas inseridas, atualizadas ou removidas
+        """
+        spec = TABELAS[tabela]
+        colunas = spec['colunas']
+        df = df.reindex(columns=colunas)
+
+        desejadas = {}
+        for ordem, registro in enumerate(df.to_dict('records')):
+            registro = {c: (None if pd.isna(v) else v) for c, v in registro.items()}
+            registro['ordem'] = ordem
+            # Chave duplicada: vale a primeira ocorrência, como no CSV
+            desejadas.setdefault(_chave_texto(registro[c] for c in spec['chave']), registro)
+
+        with self._lock:
+            self._sincronizar(tabela)
+            atuais = self._linhas[tabela]
+
+            alteradas = [r for k, r in desejadas.items() if atuais.get(k) != r]
+            removidas = [k for k in atuais if k not in desejadas]
+            if not alteradas and not removidas:
+                return 0
+
+            with self._conexao:
+                revisao = self._nova_revisao(tabela)
+
+                if removidas:
+                    condicao = " AND ".join(f"{c} = ?" for c in spec['chave'])
+                    self._conexao.executemany(
+                        f"DELETE FROM {tabela} WHERE {condicao}",
+                        [tuple(atuais[k][c] for c in spec['chave']) for k in removidas]
+                    )
+                    self._conexao.executemany(
+                        "INSERT INTO remocoes (tabela, chave, revisao) VALUES (?, ?, ?)",
+                        [(tabela, k, revisao) for k in removidas]
+                    )
+
+                if alteradas:
+                    todas = colunas + ('ordem', 'revisao')
+                    self._conexao.executemany(
+                        f"INSERT OR REPLACE INTO {tabela} ({', '.join(todas)}) "
+                        f"VALUES ({', '.join('?' * len(todas))})",
+                        [tuple(r[c] for c in colunas + ('ordem',)) + (revisao,) for r in alteradas]
+                    )
+
+                self._podar_remocoes(tabela, revisao)
+
+            self._sincronizar(tabela)
+            return len(alteradas) + len(removidas)
+
+    def ler_modelos(self):
+        """Modelos em DataFrame (mesmas colunas de data/modelos.csv)"""
+        return self._ler_tabela('modelos')
+
+    def salvar_modelos(self, df_modelos):
+        """Grava apenas os modelos alterados; retorna o número de linhas afetadas"""
+        return self._salvar_tabela('modelos', df_modelos)
+
+    def ler_rotas(self):
+        """Rotas em DataFrame (mesmas colunas de data/rotas.csv)"""
+        return self._ler_tabela('rotas')
+
+    def salvar_rotas(self, df_rotas):
+        """Grava apenas as rotas alteradas; retorna o número de linhas afetadas"""
+        return self._salvar_tabela('rotas', df_rotas)
+
+    def buscar_rota(self, origem, destino):
+        """Consulta indexada de uma rota; retorna a duração ou None"""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT duracao_h FROM rotas WHERE origem = ? AND destino = ?", (origem, destino)
+            ).fetchone()
+        return None if linha is None else linha[0]
+
+    # ------------------------------------------------------------------
+    # Parâmetros versionados
+    # ------------------------------------------------------------------
+    def ler_parametros(self, versao=None):
+        """
+        Parâmetros básicos de uma versão (padrão: a mais recente)
+
+        Returns:
+            Dict de parâmetros ou None se não houver versão gravada
+        """
+        with self._lock:
+            if versao is None:
+                linha = self._conexao.execute(
+                    "SELECT dados FROM parametros ORDER BY versao DESC LIMIT 1"
+                ).fetchone()
+            else:
+                linha = self._conexao.execute(
+                    "SELECT dados FROM parametros WHERE versao = ?", (versao,)
+                ).fetchone()
+        return None if linha is None else json.loads(linha[0])
+
+    def salvar_parametros(self, dados, descricao=""):
+        """
+        Grava uma nova versão dos parâmetros (ignorada se idêntica à atual)
+
+        Returns:
+            Número da versão vigente
+        """
+        conteudo = json.dumps(dados, sort_keys=True, ensure_ascii=False)
+        with self._lock:
+            ultima = self._conexao.execute(
+                "SELECT versao, dados FROM parametros ORDER BY versao DESC LIMIT 1"
+            ).fetchone()
+            if ultima is not None and ultima['dados'] == conteudo:
+                return ultima['versao']
+
+            with self._conexao:
+                cursor = self._conexao.execute(
+                    "INSERT INTO parametros (dados, descricao) VALUES (?, ?)", (conteudo, descricao)
+                )
+                self._conexao.execute(
+                    "INSERT INTO meta (chave, valor) VALUES ('revisao_parametros', ?) "
+                    "ON CONFLICT(chave) DO UPDATE SET valor = excluded.valor",
+                    (cursor.lastrowid,)
+                )
+            return cursor.lastrowid
+
+    def versoes_parametros(self):
+        """Histórico de versões: lista de dicts versao/criado_em/descricao"""
+        with self._lock:
+            return [dict(linha) for linha in self._conexao.execute(
+                "SELECT versao, criado_em, descricao FROM parametros ORDER BY versao DESC"
+            )]
+
+    # ------------------------------------------------------------------
+    # Importação e exportação para os arquivos planos
+    # ------------------------------------------------------------------
+    def vazio(self):
+        """Indica se o catálogo ainda não recebeu dados"""
+        revisoes = self.revisoes()
+        return not any(revisoes.values())
+
+    def importar_arquivos(self, params_file, modelos_file, rotas_file):
+        """Importa os arquivos JSON/CSV existentes (os ausentes são ignorados)"""
+        if Path(params_file).exists():
+            with open(params_file, "r", encoding="utf-8") as f:
+                self.salvar_parametros(json.load(f), "Importado de " + str(params_file))
+        if Path(modelos_file).exists():
+            self.salvar_modelos(pd.read_csv(modelos_file))
+        if Path(rotas_file).exists():
+            self.salvar_rotas(pd.read_csv(rotas_file))
+
+    def exportar_arquivos(self, params_file, modelos_file, rotas_file):
+        """Exporta o conteúdo atual para os arquivos JSON/CSV (gravação atômica)"""
+        dados = self.ler_parametros()
+        if dados is not None:
+            gravar_json(params_file, dados)
+        gravar_csv(modelos_file, self.ler_modelos().dropna(axis=1, how='all'))
+        gravar_csv(rotas_file, self.ler_rotas())
+
+
+_catalogos = {}
+_catalogos_lock = threading.Lock()
+
+
+def obter_catalogo(caminho=None):
+    """
+    Catálogo configurado (um por processo e caminho)
+
+    Na primeira abertura de um banco vazio, importa os arquivos JSON/CSV.
+
+    Args:
+        caminho: Caminho do banco; padrão é a variável AMARO_CATALOGO_DB
+
+    Returns:
+        Catalogo ou None se o catálogo não estiver habilitado
+    """
+    caminho = caminho or os.environ.get(CATALOGO_ENV)
+    if not caminho:
+        return None
+
+    with _catalogos_lock:
+        catalogo = _catalogos.get(caminho)
+        if catalogo is None:
+            from utils.params import PARAMS_FILE, MODELOS_FILE
+            from utils.rotas import ROTAS_FILE
+
+            catalogo = Catalogo(caminho)
+            if catalogo.vazio():
+                catalogo.importar_arquivos(PARAMS_FILE, MODELOS_FILE, ROTAS_FILE)
+            _catalogos[caminho] = catalogo
+        return catalogo
+
+
+def main():
+    from utils.params import PARAMS_FILE, MODELOS_FILE
+    from utils.rotas import ROTAS_FILE
+
+    parser = argparse.ArgumentParser(description="Importa/exporta o catálogo SQLite")
+    parser.add_argument("acao", choices=["importar", "exportar"])
+    parser.add_argument("--db", default=os.environ.get(CATALOGO_ENV, "data/catalogo.db"),
+                        help=f"Banco SQLite (padrão: ${CATALOGO_ENV} ou data/catalogo.db)")
+    args = parser.parse_args()
+
+    catalogo = Catalogo(args.db)
+    if args.acao == "importar":
+        catalogo.importar_arquivos(PARAMS_FILE, MODELOS_FILE, ROTAS_FILE)
+        print(f"✅ Arquivos importados para {args.db}")
+    else:
+        catalogo.exportar_arquivos(PARAMS_FILE, MODELOS_FILE, ROTAS_FILE)
+        print(f"✅ Catálogo {args.db} exportado para JSON/CSV")
+
+
+if __name__ == "__main__":
+    main()
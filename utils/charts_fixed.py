@@ -3,9 +3,9 @@ Sistema de gráficos DEFINITIVO com alto contraste e dados visíveis
 Cores fortes, títulos claros, dados sempre visíveis
 """
 
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+# plotly é importado dentro das funções de render (import comum, seguro entre
+# threads), então a importação só acontece no primeiro gráfico desenhado
+
 
 # CORES CORPORATIVAS AMARO AVIATION
 AMARO_PRIMARY = '#8C1D40'      # Bordô principal
@@ -44,6 +44,7 @@ def render_chart_receitas(receita_proprietario, taxa_amaro, lang='pt'):
     Gráfico de pizza para composição de receitas
     GARANTIDO para mostrar dados
     """
+    import plotly.graph_objects as go
     try:
         # Garantir que os valores são numéricos
         receita_proprietario = float(receita_proprietario or 0)
@@ -105,6 +106,7 @@ def render_chart_custos(custos_dict, lang='pt'):
     Gráfico de barras horizontais para breakdown de custos
     GARANTIDO para mostrar dados
     """
+    import plotly.graph_objects as go
     try:
         # Extrair e garantir valores numéricos
         labels_pt = ['Combustível', 'Tripulação', 'Manutenção', 'Depreciação']
@@ -175,6 +177,7 @@ def render_chart_comparativo(custo_amaro, preco_mercado, lang='pt'):
     Gráfico de barras comparativo Amaro vs Mercado
     GARANTIDO para mostrar dados
     """
+    import plotly.graph_objects as go
     try:
         # Garantir valores numéricos
         custo_amaro = float(custo_amaro or 0)
@@ -253,6 +256,7 @@ def render_chart_projecao(meses, receitas, custos, lang='pt'):
     """
     Gráfico de linha para projeção temporal
     """
+    import plotly.graph_objects as go
     try:
         fig = go.Figure()
         
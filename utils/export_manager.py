@@ -10,6 +10,17 @@ from datetime import datetime
 from pathlib import Path
 from io import BytesIO, StringIO
 import logging
+import multiprocessing
+import os
+import re
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+
+from utils.planilha_streaming import (
+    ArquivoPlanilha, LIMITE_MEMORIA_BYTES, PlanilhaStreaming, formato_resultado, linhas_achatadas
+)
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -46,109 +57,235 @@ class ExportManager:
             "observacoes": "Relatório gerado automaticamente" if lang == 'pt' else "Report generated automatically"
         }
     
-    def export_excel(self, report_data, filename=None):
+    def export_excel(self, report_data, filename=None, tabelas=None):
         """
         Exporta para Excel com formatação premium
         
+        Escrito em fluxo (xlsxwriter constant_memory): números vão como
+        células tipadas e o arquivo vai para o disco quando fica grande.
+        
         Args:
             report_data: Dados do relatório
             filename: Nome do arquivo (opcional)
+            tabelas: Dict nome da aba → DataFrame ou (colunas, iterável de
+                     linhas) com abas adicionais de dados (opcional)
         
         Returns:
-            BytesIO buffer ou None se falhar
+            ArquivoPlanilha (interface de arquivo, com getvalue()) ou None se falhar
         """
         try:
-            buffer = BytesIO()
-            
-            with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                # Criar workbook e worksheet
-                workbook = writer.book
-                
-                # Definir formatos
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'font_color': 'white',
-                    'bg_color': '#8c1d40',
-                    'align': 'center',
-                    'border': 1
-                })
-                
-                currency_format = workbook.add_format({
-                    'num_format': 'R$ #,##0.00',
-                    'align': 'right'
-                })
-                
-                percentage_format = workbook.add_format({
-                    'num_format': '0.0%',
-                    'align': 'right'
-                })
-                
+            with PlanilhaStreaming() as planilha:
                 # Aba 1: Resumo Executivo
-                summary_data = []
-                summary_data.append(['AMARO AVIATION - RELATÓRIO', ''])
-                summary_data.append(['', ''])
-                summary_data.append(['Data:', report_data["data_geracao"]])
-                summary_data.append(['Análise:', report_data["tipo_analise"]])
-                summary_data.append(['Versão:', report_data["versao"]])
-                summary_data.append(['', ''])
-                
-                # Parâmetros
-                summary_data.append(['PARÂMETROS', ''])
-                for key, value in report_data["parametros_entrada"].items():
-                    summary_data.append([key.replace("_", " ").title(), str(value)])
-                
-                summary_data.append(['', ''])
-                
-                # Resultados
-                summary_data.append(['RESULTADOS', ''])
-                for key, value in report_data["resultados"].items():
-                    if isinstance(value, (int, float)):
-                        if value > 1000:
-                            value_str = f"R$ {value:,.2f}"
-                        else:
-                            value_str = f"{value:.2f}%"
-                    else:
-                        value_str = str(value)
-                    summary_data.append([key.replace("_", " ").title(), value_str])
-                
-                df_summary = pd.DataFrame(summary_data, columns=["Campo", "Valor"])
-                df_summary.to_excel(writer, sheet_name="Resumo Executivo", index=False)
-                
-                # Formatar primeira aba
-                worksheet = writer.sheets["Resumo Executivo"]
-                worksheet.set_column('A:A', 25)
-                worksheet.set_column('B:B', 20)
+                resumo = planilha.nova_aba("Resumo Executivo", [25, 20])
+                resumo.escrever_cabecalho(["Campo", "Valor"])
+                self._escrever_resumo(resumo, report_data)
                 
                 # Aba 2: Dados Detalhados
-                detailed_data = []
+                detalhes = planilha.nova_aba("Dados Completos", [30, 25])
+                detalhes.escrever_cabecalho(["Campo", "Valor"])
+                detalhes.escrever_linhas(linhas_achatadas(report_data, rotulo=_rotulo))
                 
-                def flatten_dict(d, prefix=""):
-                    items = []
-                    for k, v in d.items():
-                        new_key = f"{prefix}_{k}" if prefix else k
-                        if isinstance(v, dict):
-                            items.extend(flatten_dict(v, new_key))
-                        else:
-                            items.append([new_key.replace("_", " ").title(), str(v)])
-                    return items
+                # Abas adicionais de dados
+                for nome, tabela in (tabelas or {}).items():
+                    aba = planilha.nova_aba(nome)
+                    if isinstance(tabela, pd.DataFrame):
+                        aba.escrever_dataframe(tabela)
+                    else:
+                        colunas, linhas = tabela
+                        aba.escrever_cabecalho(colunas)
+                        aba.escrever_linhas(linhas)
+            
+            arquivo = planilha.arquivo
+            logger.info(f"Excel exportado com sucesso: {arquivo.tamanho} bytes"
+                        f"{' (em disco)' if arquivo.em_disco else ''}")
+            return arquivo
+            
+        except Exception as e:
+            logger.error(f"Erro ao exportar Excel: {e}")
+            return None
+    
+    @staticmethod
+    def _escrever_resumo(aba, report_data):
+        """Escreve o resumo executivo (cabeçalho, parâmetros e resultados) em uma aba"""
+        aba.escrever_linha(['AMARO AVIATION - RELATÓRIO', ''], 'titulo')
+        aba.escrever_linha(['', ''])
+        aba.escrever_linha(['Data:', report_data["data_geracao"]])
+        aba.escrever_linha(['Análise:', report_data["tipo_analise"]])
+        aba.escrever_linha(['Versão:', report_data["versao"]])
+        aba.escrever_linha(['', ''])
+        
+        # Parâmetros
+        aba.escrever_linha(['PARÂMETROS', ''], 'secao')
+        for key, value in report_data["parametros_entrada"].items():
+            aba.escrever_linha([_rotulo(key), value])
+        
+        aba.escrever_linha(['', ''])
+        
+        # Resultados
+        aba.escrever_linha(['RESULTADOS', ''], 'secao')
+        for key, value in report_data["resultados"].items():
+            if isinstance(value, dict):
+                continue  # detalhes aninhados ficam nos dados completos
+            aba.escrever_linha([_rotulo(key), value], [None, formato_resultado(value)])
+    
+    def export_excel_lote(self, relatorios, progresso=None):
+        """
+        Exporta vários cenários em uma única pasta de trabalho
+        
+        A primeira aba ("Resumo") tem uma linha por cenário com os
+        parâmetros e resultados lado a lado; cada cenário ganha uma aba com
+        seu resumo executivo e dados completos. Os relatórios são lidos e
+        escritos um de cada vez (aceita gerador), em fluxo.
+        
+        Args:
+            relatorios: Iterável de dicts de create_report_data
+            progresso: Função chamada com o número de cenários já escritos (opcional)
+        
+        Returns:
+            ArquivoPlanilha ou None se falhar
+        """
+        try:
+            with PlanilhaStreaming() as planilha:
+                # Criada primeiro para ser a primeira aba; preenchida no final
+                aba_resumo = planilha.nova_aba("Resumo", [6, 28, 30, 18])
+                linhas_resumo = []
+                formatos_resumo = {}
                 
-                detailed_data = flatten_dict(report_data)
-                df_detailed = pd.DataFrame(detailed_data, columns=["Campo", "Valor"])
-                df_detailed.to_excel(writer, sheet_name="Dados Completos", index=False)
+                for numero, report_data in enumerate(relatorios, start=1):
+                    nome_aba = _nome_aba(numero, report_data["tipo_analise"])
+                    aba = planilha.nova_aba(nome_aba, [30, 25])
+                    aba.escrever_cabecalho(["Campo", "Valor"])
+                    self._escrever_resumo(aba, report_data)
+                    aba.escrever_linha(['', ''])
+                    aba.escrever_linha(['DADOS COMPLETOS', ''], 'secao')
+                    aba.escrever_linhas(linhas_achatadas(
+                        {'parametros_entrada': report_data["parametros_entrada"],
+                         'resultados': report_data["resultados"]},
+                        rotulo=_rotulo
+                    ))
+                    linhas_resumo.append(_linha_resumo(numero, nome_aba, report_data))
+                    formatos_resumo.update(_formatos_resumo(report_data))
+                    if progresso:
+                        progresso(numero)
                 
-                # Formatar segunda aba
-                worksheet2 = writer.sheets["Dados Completos"]
-                worksheet2.set_column('A:A', 30)
-                worksheet2.set_column('B:B', 25)
+                _escrever_resumo_lote(aba_resumo, linhas_resumo, formatos_resumo)
             
-            buffer.seek(0)
-            logger.info(f"Excel exportado com sucesso: {len(buffer.getvalue())} bytes")
-            return buffer
+            arquivo = planilha.arquivo
+            logger.info(f"Excel em lote exportado com sucesso: {len(linhas_resumo)} cenários, "
+                        f"{arquivo.tamanho} bytes")
+            return arquivo
+        
+        except Exception as e:
+            logger.error(f"Erro ao exportar Excel em lote: {e}")
+            return None
+    
+    def export_pdf_zip(self, relatorios, workers=None, progresso=None, pool=None):
+        """
+        Exporta vários cenários como um ZIP com um PDF por cenário
+        
+        Os PDFs são gerados em processos paralelos e gravados no ZIP na
+        ordem de entrada assim que ficam prontos; no máximo 2 cenários por
+        processo ficam em andamento, e o ZIP vai para o disco quando cresce.
+        O ZIP inclui resumo.csv com uma linha por cenário (e o erro, se o
+        PDF daquele cenário falhar).
+        
+        Args:
+            relatorios: Iterável de dicts de create_report_data
+            workers: Processos (padrão: número de CPUs; 1 gera no próprio processo)
+            progresso: Função chamada com o número de PDFs já gravados (opcional)
+            pool: Executor de processos já existente para reaproveitar (opcional;
+                  workers deve ser o número de processos dele)
+        
+        Returns:
+            ArquivoPlanilha com o ZIP ou None se falhar
+        """
+        workers = workers or os.cpu_count() or 1
+        arquivo = ArquivoPlanilha(max_size=LIMITE_MEMORIA_BYTES)
+        linhas_resumo = []
+        
+        def gravar(numero, report_data, tarefa):
+            nome = f"{_nome_aba(numero, report_data['tipo_analise'])}.pdf"
+            linha = _linha_resumo(numero, nome, report_data, coluna_nome='Arquivo')
+            try:
+                pacote.writestr(nome, tarefa.result())
+            except Exception as e:
+                linha['Erro'] = str(e)
+            linhas_resumo.append(linha)
+            if progresso:
+                progresso(numero)
+        
+        try:
+            with zipfile.ZipFile(arquivo, "w", zipfile.ZIP_DEFLATED) as pacote:
+                if workers == 1 and pool is None:
+                    for numero, report_data in enumerate(relatorios, start=1):
+                        tarefa = Future()
+                        try:
+                            tarefa.set_result(gerar_pdf_relatorio(report_data))
+                        except Exception as e:
+                            tarefa.set_exception(e)
+                        gravar(numero, report_data, tarefa)
+                else:
+                    with ExitStack() as pilha:
+                        if pool is None:
+                            # 'spawn', como na fila de exportação: fork do servidor com
+                            # várias threads pode herdar travas ocupadas e travar o filho
+                            pool = pilha.enter_context(ProcessPoolExecutor(
+                                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                            ))
+                        pendentes = deque()
+                        for numero, report_data in enumerate(relatorios, start=1):
+                            pendentes.append((numero, report_data,
+                                              pool.submit(gerar_pdf_relatorio, report_data)))
+                            if len(pendentes) >= 2 * workers:
+                                gravar(*pendentes.popleft())
+                        while pendentes:
+                            gravar(*pendentes.popleft())
+                
+                resumo_csv = StringIO()
+                pd.DataFrame(linhas_resumo).to_csv(resumo_csv, index=False)
+                pacote.writestr("resumo.csv", resumo_csv.getvalue().encode("utf-8-sig"))
             
+            arquivo.seek(0)
+            logger.info(f"ZIP de PDFs exportado com sucesso: {len(linhas_resumo)} cenários, "
+                        f"{arquivo.tamanho} bytes")
+            return arquivo
+        
         except Exception as e:
-            logger.error(f"Erro ao exportar Excel: {e}")
+            logger.error(f"Erro ao exportar ZIP de PDFs: {e}")
             return None
     
+    def export_lote(self, relatorios, formato='excel', filename_base="amaro_cenarios", workers=None,
+                    progresso=None, pool=None):
+        """
+        Exporta vários cenários de uma vez
+        
+        Args:
+            relatorios: Iterável de dicts de create_report_data
+            formato: 'excel' (uma pasta de trabalho) ou 'pdf_zip' (ZIP de PDFs)
+            filename_base: Base do nome do arquivo
+            workers: Processos para os PDFs
+            progresso: Função chamada com o número de cenários já exportados (opcional)
+            pool: Executor de processos já existente para os PDFs (opcional)
+        
+        Returns:
+            Tuple (arquivo, filename, mime_type) ou (None, None, None) se falhar
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if formato == 'excel':
+            arquivo = self.export_excel_lote(relatorios, progresso)
+            filename = f"{filename_base}_{timestamp}.xlsx"
+            mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        elif formato == 'pdf_zip':
+            arquivo = self.export_pdf_zip(relatorios, workers, progresso, pool)
+            filename = f"{filename_base}_{timestamp}.zip"
+            mime_type = "application/zip"
+        else:
+            raise ValueError(f"Formato de lote não suportado: {formato}")
+        
+        if arquivo is None:
+            return None, None, None
+        return arquivo, filename, mime_type
+    
     def export_csv(self, report_data, filename=None):
         """
         Exporta para CSV como fallback universal
@@ -318,6 +455,69 @@ class ExportManager:
             st.error(f"❌ Erro ao preparar download: {e}")
             return False
 
+def _rotulo(chave):
+    """Nome de campo legível ('lucro_liquido' → 'Lucro Liquido')"""
+    return chave.replace("_", " ").title()
+
+def _nome_aba(numero, tipo_analise):
+    """Nome único de aba/arquivo para o cenário (máx. 31 caracteres, sem caracteres proibidos)"""
+    nome = re.sub(r'[\[\]:*?/\\]', '-', f"{numero:03d} {tipo_analise}")
+    return nome[:31].strip()
+
+def _linha_resumo(numero, nome, report_data, coluna_nome='Aba'):
+    """
+    Linha do resumo do lote: identificação, parâmetros e resultados escalares
+
+    Args:
+        coluna_nome: Título da coluna do nome ('Aba' na planilha, 'Arquivo' no ZIP)
+    """
+    linha = {
+        'Nº': numero,
+        coluna_nome: nome,
+        'Análise': report_data["tipo_analise"],
+        'Data': report_data["data_geracao"]
+    }
+    for secao in ("parametros_entrada", "resultados"):
+        for chave, valor in report_data[secao].items():
+            if not isinstance(valor, (dict, list, tuple)):
+                linha.setdefault(_rotulo(chave), valor)
+    return linha
+
+def _formatos_resumo(report_data):
+    """Formato (moeda/percentual) das colunas do resumo que vêm dos resultados"""
+    return {
+        _rotulo(chave): formato_resultado(valor)
+        for chave, valor in report_data["resultados"].items()
+        if formato_resultado(valor)
+    }
+
+def _escrever_resumo_lote(aba, linhas, formatos):
+    """Tabela do resumo do lote, com a união das colunas de todos os cenários"""
+    colunas = list(dict.fromkeys(coluna for linha in linhas for coluna in linha))
+    aba.escrever_cabecalho(colunas)
+    formatos_linha = [formatos.get(coluna) for coluna in colunas]
+    for linha in linhas:
+        aba.escrever_linha([linha.get(coluna) for coluna in colunas], formatos_linha)
+
+def gerar_pdf_relatorio(report_data):
+    """
+    Gera o PDF de um relatório (create_report_data)
+    
+    Função de módulo para poder rodar em processos do pool.
+    
+    Returns:
+        Bytes do PDF
+    
+    Raises:
+        RuntimeError: Se a geração falhar
+    """
+    from utils.exportador_pdf import gerar_pdf, dados_pdf_relatorio
+    
+    buffer = BytesIO()
+    if not gerar_pdf(buffer, dados_pdf_relatorio(report_data)):
+        raise RuntimeError("Falha ao gerar o PDF")
+    return buffer.getvalue()
+
 # Instância global do gerenciador
 export_manager = ExportManager()
 
@@ -330,6 +530,10 @@ def gerar_excel_simples(report_data):
     """Função de conveniência para gerar Excel"""
     return export_manager.export_excel(report_data)
 
+def exportar_lote(relatorios, formato='excel', filename_base="amaro_cenarios"):
+    """Função de conveniência para exportar vários cenários (Excel ou ZIP de PDFs)"""
+    return export_manager.export_lote(relatorios, formato, filename_base)
+
 def botao_download_inteligente(report_data, button_text="📊 Baixar Relatório", 
                               preferred_format='excel', filename_base="amaro_report"):
     """Função de conveniência para criar botão com fallback"""
@@ -9,6 +9,8 @@ from datetime import datetime
 from pathlib import Path
 import io
 
+from utils.planilha_streaming import PlanilhaStreaming, formato_resultado, linhas_achatadas
+
 def criar_relatorio_dados(tipo_analise, dados_entrada, resultados):
     """
     Cria estrutura de dados padronizada para relatórios
@@ -42,72 +44,49 @@ def criar_relatorio_dados(tipo_analise, dados_entrada, resultados):
 
 def gerar_excel_simples(dados_relatorio):
     """
-    Gera arquivo Excel simples usando apenas pandas
-    Funciona mesmo sem openpyxl instalado
+    Gera arquivo Excel escrito em fluxo (xlsxwriter constant_memory)
+    Valores numéricos vão como células tipadas (moeda/percentual)
     
     Args:
         dados_relatorio: Dicionário com dados do relatório
     
     Returns:
-        BytesIO buffer com arquivo Excel
+        ArquivoPlanilha (interface de arquivo, com getvalue()) com o Excel
     """
     try:
-        buffer = io.BytesIO()
-        
-        # Criar abas separadas
-        with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
+        with PlanilhaStreaming() as planilha:
             
             # Aba 1: Resumo Executivo
-            resumo_data = []
-            resumo_data.append(["AMARO AVIATION - RELATÓRIO DE ANÁLISE", ""])
-            resumo_data.append(["", ""])
-            resumo_data.append(["Data:", dados_relatorio["data_geracao"]])
-            resumo_data.append(["Tipo de Análise:", dados_relatorio["tipo_analise"]])
-            resumo_data.append(["Versão do Sistema:", dados_relatorio["versao"]])
-            resumo_data.append(["", ""])
+            resumo = planilha.nova_aba("Resumo Executivo")
+            resumo.escrever_linha(["Campo", "Valor"], 'cabecalho')
+            resumo.escrever_linha(["AMARO AVIATION - RELATÓRIO DE ANÁLISE", ""], 'titulo')
+            resumo.escrever_linha(["", ""])
+            resumo.escrever_linha(["Data:", dados_relatorio["data_geracao"]])
+            resumo.escrever_linha(["Tipo de Análise:", dados_relatorio["tipo_analise"]])
+            resumo.escrever_linha(["Versão do Sistema:", dados_relatorio["versao"]])
+            resumo.escrever_linha(["", ""])
             
             # Adicionar parâmetros de entrada
-            resumo_data.append(["PARÂMETROS DE ENTRADA", ""])
+            resumo.escrever_linha(["PARÂMETROS DE ENTRADA", ""], 'secao')
             for chave, valor in dados_relatorio["parametros_entrada"].items():
-                resumo_data.append([chave.replace("_", " ").title(), str(valor)])
+                resumo.escrever_linha([chave.replace("_", " ").title(), valor])
             
-            resumo_data.append(["", ""])
+            resumo.escrever_linha(["", ""])
             
             # Adicionar resultados
-            resumo_data.append(["RESULTADOS", ""])
+            resumo.escrever_linha(["RESULTADOS", ""], 'secao')
             for chave, valor in dados_relatorio["resultados"].items():
-                if isinstance(valor, (int, float)):
-                    if valor > 1000:
-                        valor_str = f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-                    else:
-                        valor_str = f"{valor:.2f}%"
-                else:
-                    valor_str = str(valor)
-                resumo_data.append([chave.replace("_", " ").title(), valor_str])
-            
-            df_resumo = pd.DataFrame(resumo_data, columns=["Campo", "Valor"])
-            df_resumo.to_excel(writer, sheet_name="Resumo Executivo", index=False)
+                if isinstance(valor, dict):
+                    continue  # detalhes aninhados ficam na aba "Dados Completos"
+                resumo.escrever_linha([chave.replace("_", " ").title(), valor],
+                                      [None, formato_resultado(valor)])
             
-            # Aba 2: Dados Brutos
-            dados_brutos = []
-            
-            # Achatar todos os dados para tabela
-            def achatar_dict(d, prefixo=""):
-                items = []
-                for k, v in d.items():
-                    novo_key = f"{prefixo}_{k}" if prefixo else k
-                    if isinstance(v, dict):
-                        items.extend(achatar_dict(v, novo_key))
-                    else:
-                        items.append([novo_key, str(v)])
-                return items
-            
-            dados_brutos = achatar_dict(dados_relatorio)
-            df_brutos = pd.DataFrame(dados_brutos, columns=["Campo", "Valor"])
-            df_brutos.to_excel(writer, sheet_name="Dados Completos", index=False)
+            # Aba 2: Dados Brutos (todos os dados achatados em tabela)
+            brutos = planilha.nova_aba("Dados Completos")
+            brutos.escrever_linha(["Campo", "Valor"], 'cabecalho')
+            brutos.escrever_linhas(linhas_achatadas(dados_relatorio))
         
-        buffer.seek(0)
-        return buffer
+        return planilha.arquivo
         
     except Exception as e:
         print(f"Erro ao gerar Excel: {e}")
@@ -336,6 +336,56 @@ def criar_rodape():
     
     return elementos
 
+def dados_pdf_relatorio(relatorio):
+    """
+    Converte um relatório do ExportManager (create_report_data) para o
+    dicionário plano usado por gerar_pdf
+    
+    Args:
+        relatorio: Dict com tipo_analise, parametros_entrada e resultados
+    
+    Returns:
+        Dict com as chaves esperadas pelas seções do PDF
+    """
+    entrada = relatorio.get('parametros_entrada', {})
+    resultados = relatorio.get('resultados', {})
+    breakdown = resultados.get('breakdown_custos', {})
+    
+    def primeiro(fonte, *chaves):
+        for chave in chaves:
+            if chave in fonte:
+                return fonte[chave]
+        return None
+    
+    dados = {
+        'Análise': relatorio.get('tipo_analise', 'Não especificado'),
+        'Modelo': entrada.get('modelo', 'Não especificado'),
+        'Rota': resultados.get('rota') or (
+            f"{entrada['origem']} → {entrada['destino']}"
+            if 'origem' in entrada and 'destino' in entrada else 'Não especificado'
+        ),
+    }
+    
+    duracao = primeiro(resultados, 'duracao_horas', 'horas_efetivas') or primeiro(entrada, 'horas_anuais', 'horas_charter')
+    if duracao is not None:
+        dados['Duração'] = f"{float(duracao):.1f} h"
+    
+    for chave, nome in (('combustivel', 'Combustível'), ('tripulacao', 'Piloto'),
+                        ('manutencao', 'Manutenção'), ('depreciacao', 'Depreciação')):
+        if chave in breakdown:
+            dados[nome] = float(breakdown[chave])
+    
+    custo = primeiro(resultados, 'custo_amaro', 'custos_operacionais', 'total_gestao_amaro')
+    mercado = primeiro(resultados, 'preco_mercado', 'receita_proprietario', 'total_gestao_propria')
+    if custo is not None:
+        dados['Custo Total Amaro'] = float(custo)
+    if mercado is not None:
+        dados['Preço Mercado'] = float(mercado)
+    if custo is not None and mercado is not None:
+        dados['Economia'] = float(mercado) - float(custo)
+    
+    return dados
+
 def gerar_pdf(buffer_arquivo, dados: dict):
     """
     Gera PDF premium com identidade visual Amaro Aviation
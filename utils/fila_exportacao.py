@@ -0,0 +1,530 @@
+"""
+Fila de exportações em segundo plano (PDF e Excel)
+
+A página envia a tarefa e recebe um id na hora; a geração roda em um pool
+de processos próprio, fora das threads das sessões. O reportlab e o
+xlsxwriter são Python puro e, rodando no servidor, segurariam o GIL e
+atrasariam as reexecuções de todas as sessões enquanto o arquivo é gerado.
+A página acompanha o andamento pelo id e baixa o arquivo quando fica pronto.
+
+Os arquivos prontos ficam em um diretório temporário limitado em bytes,
+em quantidade e em tempo; os mais antigos são descartados primeiro.
+"""
+
+import io
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+import streamlit as st
+
+from utils.session_state import fragmento
+
+logger = logging.getLogger(__name__)
+
+# Limites do armazenamento de arquivos prontos
+MAX_BYTES_ARMAZEM = 256 * 1024 * 1024
+MAX_ARTEFATOS = 64
+TTL_ARTEFATOS_SEGUNDOS = 3600
+
+# Limites da fila
+TAREFAS_SIMULTANEAS = 2
+MAX_TAREFAS_PENDENTES = 32
+MAX_TAREFAS_REGISTRADAS = 512
+PROCESSOS_PADRAO = min(2, os.cpu_count() or 1)
+
+# Intervalo (segundos) de atualização do painel enquanto há tarefas em andamento
+INTERVALO_ACOMPANHAMENTO = 1.5
+
+TIPOS = {
+    'pdf': "PDF",
+    'excel': "Excel",
+    'excel_lote': "Excel (vários cenários)",
+    'pdf_zip': "ZIP de PDFs"
+}
+TIPOS_LOTE = ('excel_lote', 'pdf_zip')
+
+ESTADOS_PENDENTES = ('na_fila', 'executando')
+
+
+class FilaCheia(RuntimeError):
+    """Há tarefas pendentes demais; tente de novo quando alguma terminar"""
+
+
+# ========================================================================
+# TAREFAS
+# ========================================================================
+class TarefaExportacao:
+    """Estado de uma exportação: na_fila → executando → concluida | erro"""
+
+    def __init__(self, tipo, total, filename_base):
+        self.id = uuid.uuid4().hex
+        self.tipo = tipo
+        self.filename_base = filename_base
+        self.estado = 'na_fila'
+        self.concluidos = 0
+        self.total = total
+        self.erro = None
+        self.nome_arquivo = None
+        self.mime = None
+        self.tamanho = 0
+        self.criada_em = time.time()
+        self.iniciada_em = None
+        self.concluida_em = None
+
+    def status(self):
+        """Cópia do estado atual em um dict"""
+        return {
+            'id': self.id,
+            'tipo': self.tipo,
+            'estado': self.estado,
+            'concluidos': self.concluidos,
+            'total': self.total,
+            'progresso': 1.0 if self.estado == 'concluida' else self.concluidos / max(self.total, 1),
+            'erro': self.erro,
+            'nome_arquivo': self.nome_arquivo,
+            'mime': self.mime,
+            'tamanho': self.tamanho,
+            'criada_em': self.criada_em,
+            'iniciada_em': self.iniciada_em,
+            'concluida_em': self.concluida_em
+        }
+
+
+def exportar_para_arquivo(tipo, dados, filename_base, caminho):
+    """
+    Gera uma exportação e grava em caminho (roda nos processos do pool)
+
+    Args:
+        tipo: 'pdf', 'excel' ou 'excel_lote'
+        dados: Dict de create_report_data (lista deles em 'excel_lote')
+        filename_base: Base do nome do arquivo
+        caminho: Arquivo de destino
+
+    Returns:
+        Tuple (nome do arquivo para download, mime_type)
+    """
+    from utils.export_manager import export_manager, gerar_pdf_relatorio
+
+    if tipo == 'pdf':
+        conteudo = gerar_pdf_relatorio(dados)
+        with open(caminho, "wb") as destino:
+            destino.write(conteudo)
+        return f"{filename_base}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf", "application/pdf"
+
+    if tipo == 'excel':
+        arquivo, _, nome, mime = export_manager.export_with_fallback(dados, 'excel', filename_base)
+    else:
+        arquivo, nome, mime = export_manager.export_lote(dados, 'excel', filename_base)
+    if arquivo is None:
+        raise RuntimeError(f"Falha ao gerar {TIPOS[tipo]}")
+
+    arquivo.seek(0)
+    with open(caminho, "wb") as destino:
+        if isinstance(arquivo, io.TextIOBase):
+            # Fallback CSV/JSON (sem xlsxwriter/openpyxl) vem como StringIO
+            destino.write(arquivo.read().encode("utf-8"))
+        else:
+            shutil.copyfileobj(arquivo, destino)
+    return nome, mime
+
+
+# ========================================================================
+# ARMAZENAMENTO DOS ARQUIVOS PRONTOS
+# ========================================================================
+class ArmazemArtefatos:
+    """
+    Diretório temporário de arquivos prontos, limitado em bytes, em
+    quantidade e em tempo de vida
+
+    O arquivo mais recente não é descartado pelos limites de bytes e de
+    quantidade, mesmo que sozinho passe do limite de bytes, para que a tarefa
+    que acabou de terminar possa ser baixada; só o tempo de vida o remove.
+    """
+
+    def __init__(self, diretorio=None, max_bytes=MAX_BYTES_ARMAZEM, max_itens=MAX_ARTEFATOS,
+                 ttl_segundos=TTL_ARTEFATOS_SEGUNDOS):
+        """
+        Args:
+            diretorio: Diretório dos arquivos; None cria um temporário,
+                       apagado quando o armazém deixa de existir
+            max_bytes: Total de bytes mantidos
+            max_itens: Quantidade de arquivos mantidos
+            ttl_segundos: Tempo de vida de cada arquivo
+        """
+        if diretorio is None:
+            diretorio = tempfile.mkdtemp(prefix="amaro-exportacoes-")
+            weakref.finalize(self, shutil.rmtree, diretorio, True)
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+        self.max_bytes = max_bytes
+        self.max_itens = max_itens
+        self.ttl_segundos = ttl_segundos
+        self.bytes_usados = 0
+        self.descartes = 0
+        self._itens = OrderedDict()  # chave -> (tamanho, guardado_em)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._itens)
+
+    def caminho(self, chave):
+        return os.path.join(self.diretorio, chave)
+
+    def registrar(self, chave):
+        """
+        Passa a controlar o arquivo já gravado em caminho(chave)
+
+        Returns:
+            Tamanho do arquivo em bytes
+        """
+        tamanho = os.path.getsize(self.caminho(chave))
+        with self._lock:
+            anterior = self._itens.pop(chave, None)
+            if anterior is not None:
+                self.bytes_usados -= anterior[0]
+            self._itens[chave] = (tamanho, time.time())
+            self.bytes_usados += tamanho
+            self._descartar(manter=chave)
+        return tamanho
+
+    def contem(self, chave):
+        with self._lock:
+            self._descartar()
+            return chave in self._itens
+
+    def ler(self, chave):
+        """Conteúdo do arquivo ou None se não existe mais"""
+        if not self.contem(chave):
+            return None
+        try:
+            with open(self.caminho(chave), "rb") as arquivo:
+                return arquivo.read()
+        except FileNotFoundError:  # descartado entre a verificação e a leitura
+            return None
+
+    def remover(self, chave):
+        with self._lock:
+            self._remover(chave)
+
+    def _remover(self, chave):
+        item = self._itens.pop(chave, None)
+        if item is not None:
+            self.bytes_usados -= item[0]
+        try:
+            os.remove(self.caminho(chave))
+        except FileNotFoundError:
+            pass
+
+    def _descartar(self, manter=None):
+        """
+        Remove os expirados e depois os mais antigos até caber nos limites
+
+        O mais recente só sai por tempo de vida; `manter` não sai nem por ele.
+        """
+        limite_tempo = time.time() - self.ttl_segundos
+        mais_recente = next(reversed(self._itens), None)
+        for chave, (_, guardado_em) in list(self._itens.items()):
+            excedido = chave != mais_recente and (
+                len(self._itens) > self.max_itens or self.bytes_usados > self.max_bytes
+            )
+            if chave != manter and (guardado_em < limite_tempo or excedido):
+                self._remover(chave)
+                self.descartes += 1
+
+
+# ========================================================================
+# FILA
+# ========================================================================
+class FilaExportacao:
+    """
+    Fila de exportações com pool de processos próprio
+
+    Cada tarefa é coordenada por uma thread leve (no máximo `simultaneas`
+    ao mesmo tempo); a geração em si roda nos processos do pool. Um ZIP de
+    PDFs distribui os cenários pelos processos e informa o progresso a cada
+    PDF gravado; as demais tarefas informam só o início e o fim.
+    """
+
+    def __init__(self, simultaneas=TAREFAS_SIMULTANEAS, processos=PROCESSOS_PADRAO,
+                 max_pendentes=MAX_TAREFAS_PENDENTES, armazem=None):
+        """
+        Args:
+            simultaneas: Tarefas executadas ao mesmo tempo
+            processos: Processos do pool de geração
+            max_pendentes: Tarefas na fila ou executando aceitas ao mesmo tempo
+            armazem: ArmazemArtefatos (padrão: um diretório temporário novo)
+        """
+        self.processos = processos
+        self.max_pendentes = max_pendentes
+        self.armazem = armazem if armazem is not None else ArmazemArtefatos()
+        self._coordenacao = ThreadPoolExecutor(max_workers=simultaneas,
+                                               thread_name_prefix="amaro-exportacao")
+        self._pool = None
+        self._tarefas = OrderedDict()
+        self._lock = threading.Lock()
+
+    def enviar(self, tipo, dados, filename_base="amaro_relatorio"):
+        """
+        Coloca uma exportação na fila
+
+        Args:
+            tipo: 'pdf', 'excel', 'excel_lote' ou 'pdf_zip'
+            dados: Dict de create_report_data (iterável deles nos tipos de lote)
+            filename_base: Base do nome do arquivo
+
+        Returns:
+            Id da tarefa
+
+        Raises:
+            ValueError: Tipo desconhecido ou lote vazio
+            FilaCheia: Limite de tarefas pendentes atingido
+        """
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de exportação não suportado: {tipo}")
+        if tipo in TIPOS_LOTE:
+            dados = list(dados)
+            if not dados:
+                raise ValueError("Nenhum cenário para exportar")
+        tarefa = TarefaExportacao(tipo, len(dados) if tipo in TIPOS_LOTE else 1, filename_base)
+
+        with self._lock:
+            pendentes = sum(t.estado in ESTADOS_PENDENTES for t in self._tarefas.values())
+            if pendentes >= self.max_pendentes:
+                raise FilaCheia(f"{pendentes} exportações pendentes; aguarde alguma terminar")
+            self._tarefas[tarefa.id] = tarefa
+            self._esquecer_antigas()
+
+        self._coordenacao.submit(self._executar, tarefa, dados)
+        return tarefa.id
+
+    def status(self, tarefa_id):
+        """
+        Estado de uma tarefa (ver TarefaExportacao.status)
+
+        Uma tarefa concluída cujo arquivo já foi descartado aparece como 'expirada'.
+
+        Returns:
+            Dict ou None se o id não é conhecido
+        """
+        with self._lock:
+            tarefa = self._tarefas.get(tarefa_id)
+            if tarefa is None:
+                return None
+            status = tarefa.status()
+        if status['estado'] == 'concluida' and not self.armazem.contem(tarefa_id):
+            status['estado'] = 'expirada'
+        return status
+
+    def obter_arquivo(self, tarefa_id):
+        """
+        Arquivo pronto de uma tarefa concluída
+
+        Returns:
+            Tuple (bytes, nome do arquivo, mime_type) ou None se não disponível
+        """
+        status = self.status(tarefa_id)
+        if status is None or status['estado'] != 'concluida':
+            return None
+        conteudo = self.armazem.ler(tarefa_id)
+        if conteudo is None:
+            return None
+        return conteudo, status['nome_arquivo'], status['mime']
+
+    def encerrar(self, esperar=True):
+        """Para de aceitar tarefas e encerra as threads e o pool de processos"""
+        self._coordenacao.shutdown(wait=esperar, cancel_futures=not esperar)
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=esperar, cancel_futures=not esperar)
+
+    def _pool_processos(self):
+        """
+        Pool criado no primeiro uso, com processos iniciados por 'spawn':
+        copiar (fork) o servidor com várias threads ativas pode herdar
+        travas ocupadas e travar o processo filho
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.processos,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+            return self._pool
+
+    def _descartar_pool(self, pool):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _esquecer_antigas(self):
+        """Mantém o registro limitado, esquecendo as tarefas terminadas mais antigas"""
+        excesso = len(self._tarefas) - MAX_TAREFAS_REGISTRADAS
+        for tarefa_id, tarefa in list(self._tarefas.items()):
+            if excesso <= 0:
+                break
+            if tarefa.estado not in ESTADOS_PENDENTES:
+                del self._tarefas[tarefa_id]
+                self.armazem.remover(tarefa_id)
+                excesso -= 1
+
+    def _executar(self, tarefa, dados):
+        tarefa.iniciada_em = time.time()
+        tarefa.estado = 'executando'
+        caminho = self.armazem.caminho(tarefa.id)
+        pool = self._pool_processos()
+        try:
+            if tarefa.tipo == 'pdf_zip':
+                nome, mime = self._exportar_zip(tarefa, dados, caminho, pool)
+            else:
+                nome, mime = pool.submit(
+                    exportar_para_arquivo, tarefa.tipo, dados, tarefa.filename_base, caminho
+                ).result()
+            tarefa.tamanho = self.armazem.registrar(tarefa.id)
+            tarefa.nome_arquivo, tarefa.mime = nome, mime
+            tarefa.concluidos = tarefa.total
+            tarefa.estado = 'concluida'
+        except Exception as e:
+            logger.error(f"Erro na exportação {tarefa.id} ({tarefa.tipo}): {e}")
+            if isinstance(e, BrokenProcessPool):
+                self._descartar_pool(pool)
+            self.armazem.remover(tarefa.id)
+            tarefa.erro = str(e) or type(e).__name__
+            tarefa.estado = 'erro'
+        finally:
+            tarefa.concluida_em = time.time()
+
+    def _exportar_zip(self, tarefa, dados, caminho, pool):
+        """ZIP de PDFs: cada cenário vai para um processo e o ZIP é montado aqui"""
+        from utils.export_manager import export_manager
+
+        def progresso(concluidos):
+            tarefa.concluidos = concluidos
+
+        arquivo, nome, mime = export_manager.export_lote(
+            dados, 'pdf_zip', tarefa.filename_base, self.processos, progresso, pool
+        )
+        if arquivo is None:
+            raise RuntimeError(f"Falha ao gerar {TIPOS['pdf_zip']}")
+        with arquivo, open(caminho, "wb") as destino:
+            shutil.copyfileobj(arquivo, destino)
+        return nome, mime
+
+
+@st.cache_resource(show_spinner=False)
+def obter_fila_exportacao():
+    """Fila de exportações única do processo, compartilhada entre sessões"""
+    return FilaExportacao()
+
+
+# ========================================================================
+# INTERFACE (STREAMLIT)
+# ========================================================================
+def _chave_tarefas(chave):
+    return f"_tarefas_exportacao_{chave}"
+
+
+def painel_exportacao_segundo_plano(report_data, chave, filename_base="amaro_relatorio", lang='pt'):
+    """
+    Botões de PDF e Excel em segundo plano e acompanhamento das tarefas da sessão
+
+    Os ids das tarefas ficam no session_state, então o painel sobrevive às
+    reexecuções da página; enquanto houver tarefa em andamento ele se
+    atualiza sozinho e, ao terminar, mostra o botão de download.
+
+    Args:
+        report_data: Dados do relatório (create_report_data)
+        chave: Identificador do painel na página (prefixo das keys dos widgets)
+        filename_base: Base do nome do arquivo
+        lang: Idioma dos textos
+    """
+    fila = obter_fila_exportacao()
+    rotulo_fundo = "em segundo plano" if lang == 'pt' else "in background"
+
+    col_pdf, col_excel = st.columns(2)
+    pedidos = (
+        (col_pdf, 'pdf', f"📄 PDF {rotulo_fundo}"),
+        (col_excel, 'excel', f"📊 Excel {rotulo_fundo}")
+    )
+    for coluna, tipo, rotulo in pedidos:
+        with coluna:
+            if st.button(rotulo, key=f"{chave}_enviar_{tipo}", use_container_width=True):
+                try:
+                    tarefa_id = fila.enviar(tipo, report_data, filename_base)
+                    ids = st.session_state.setdefault(_chave_tarefas(chave), [])
+                    ids.append(tarefa_id)
+                    del ids[:-5]  # só as últimas da sessão
+                except FilaCheia as e:
+                    st.warning(f"⚠️ {e}")
+
+    ids = st.session_state.get(_chave_tarefas(chave), [])
+    if any((fila.status(i) or {}).get('estado') in ESTADOS_PENDENTES for i in ids):
+        _acompanhar_tarefas(chave, lang)
+    else:
+        _mostrar_tarefas(chave, lang)
+
+
+@fragmento(run_every=INTERVALO_ACOMPANHAMENTO)
+def _acompanhar_tarefas(chave, lang):
+    """Reexecuta sozinho até as tarefas terminarem; então atualiza a página uma vez"""
+    if not _mostrar_tarefas(chave, lang):
+        st.rerun()  # para a atualização periódica e mostra os downloads
+
+
+def _mostrar_tarefas(chave, lang):
+    """
+    Progresso ou download de cada tarefa da sessão (mais recente primeiro)
+
+    Returns:
+        True se ainda há tarefa em andamento
+    """
+    fila = obter_fila_exportacao()
+    em_andamento = False
+
+    for tarefa_id in reversed(st.session_state.get(_chave_tarefas(chave), [])):
+        status = fila.status(tarefa_id)
+        if status is None:
+            continue
+        tipo = TIPOS[status['tipo']]
+
+        if status['estado'] in ESTADOS_PENDENTES:
+            em_andamento = True
+            if status['estado'] == 'na_fila':
+                texto = f"⏳ {tipo}: na fila" if lang == 'pt' else f"⏳ {tipo}: queued"
+            else:
+                texto = f"⚙️ {tipo}: gerando ({status['concluidos']}/{status['total']})" if lang == 'pt' \
+                    else f"⚙️ {tipo}: generating ({status['concluidos']}/{status['total']})"
+            st.progress(status['progresso'], text=texto)
+
+        elif status['estado'] == 'concluida':
+            arquivo = fila.obter_arquivo(tarefa_id)
+            if arquivo is None:
+                continue
+            conteudo, nome, mime = arquivo
+            st.download_button(
+                label=f"⬇️ {nome} ({status['tamanho'] / 1024:,.0f} KB)",
+                data=conteudo,
+                file_name=nome,
+                mime=mime,
+                key=f"{chave}_baixar_{tarefa_id}",
+                use_container_width=True
+            )
+
+        elif status['estado'] == 'erro':
+            st.warning(f"⚠️ {tipo}: {status['erro']}")
+
+        else:
+            st.caption(f"{tipo}: arquivo expirado, gere novamente" if lang == 'pt'
+                       else f"{tipo}: file expired, please generate again")
+
+    return em_andamento
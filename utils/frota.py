@@ -0,0 +1,169 @@
+"""
+Calculadora de frota: custos, receitas e ROI por aeronave e da frota inteira
+Todas as matrículas e meses calculados de uma vez (matrículas × meses)
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.calculations import indices_modelos, series_projecao
+
+# Colunas obrigatórias da tabela de frota
+COLUNAS_FROTA = ('matricula', 'modelo', 'horas_mes', 'percentual_charter', 'custos_fixos_mes')
+
+# Coluna opcional: preço por hora de charter (padrão: preço de mercado do modelo)
+COLUNA_PRECO_HORA = 'preco_hora'
+
+
+def validar_frota(df_frota, params):
+    """
+    Valida a tabela de frota e normaliza os tipos das colunas
+
+    Args:
+        df_frota: DataFrame com uma linha por aeronave (matrícula)
+        params: Parâmetros do sistema
+
+    Returns:
+        DataFrame normalizado
+
+    Raises:
+        ValueError: Se faltarem colunas ou houver valores inválidos
+    """
+    faltando = [c for c in COLUNAS_FROTA if c not in df_frota.columns]
+    if faltando:
+        raise ValueError(f"Colunas ausentes na frota: {', '.join(faltando)}")
+
+    frota = df_frota.copy()
+    frota['matricula'] = frota['matricula'].astype(str)
+    for coluna in ('horas_mes', 'percentual_charter', 'custos_fixos_mes'):
+        frota[coluna] = pd.to_numeric(frota[coluna], errors='raise').astype(float)
+
+    if frota['matricula'].duplicated().any():
+        raise ValueError("Matrículas devem ser únicas")
+    if (frota['horas_mes'] < 0).any():
+        raise ValueError("Horas mensais não podem ser negativas")
+    if ((frota['percentual_charter'] < 0) | (frota['percentual_charter'] > 100)).any():
+        raise ValueError("Percentual de charter deve estar entre 0 e 100")
+
+    # Modelos desconhecidos geram ValueError aqui
+    indices_modelos(frota['modelo'].to_numpy(), params)
+
+    return frota
+
+
+def calcular_frota(df_frota, params, num_meses=12, taxa_crescimento=0,
+                   inflacao_custos=0, reajuste_preco=0):
+    """
+    Calcula custos, receitas e ROI de cada aeronave e da frota
+
+    As horas mensais de cada matrícula são voadas integralmente (custo
+    variável pelas fórmulas de calcula_custo_trecho); a parcela de charter
+    gera receita, da qual o proprietário recebe percentual_proprietario.
+    Crescimento, reajuste e inflação seguem as mesmas séries da projeção
+    mensal (series_projecao): uma aeronave sem custo fixo, com 37,5% de
+    charter e o preço de mercado reproduz calcular_projecao_lote. A inflação
+    dos meses de aniversário também incide sobre os custos fixos.
+
+    Args:
+        df_frota: DataFrame com COLUNAS_FROTA (e opcionalmente 'preco_hora')
+        params: Parâmetros do sistema
+        num_meses: Número de meses do horizonte
+        taxa_crescimento: Crescimento anual das horas (%)
+        inflacao_custos: Inflação anual dos custos variáveis e fixos (%)
+        reajuste_preco: Reajuste anual do preço de charter (%)
+
+    Returns:
+        Dict com 'matriculas', 'modelos', 'meses', arrays 2-D (matrículas ×
+        meses) 'horas_voadas', 'horas_charter', 'receitas', 'custos' e
+        'lucros', totais por aeronave ('receita_total', 'custo_total',
+        'lucro_total', 'roi') e da frota ('frota_receitas', 'frota_custos',
+        'frota_lucros' por mês e 'frota_roi')
+    """
+    frota = validar_frota(df_frota, params)
+    idx = indices_modelos(frota['modelo'].to_numpy(), params)
+
+    # Preço de charter por matrícula; sem valor, vale o preço de mercado do modelo
+    preco_informado = None
+    if COLUNA_PRECO_HORA in frota:
+        preco_informado = pd.to_numeric(frota[COLUNA_PRECO_HORA], errors='coerce').to_numpy(dtype=float)
+
+    series = series_projecao(idx, frota['horas_mes'].to_numpy(), num_meses, params,
+                             taxa_crescimento, inflacao_custos, reajuste_preco, preco_informado)
+    meses = series['meses']
+    horas_voadas = series['horas_mensais']
+    preco_hora = series['preco_hora']
+
+    # Custos: variável pelas horas voadas (aceita aeronaves paradas) + fixo
+    # mensal, com a mesma inflação de aniversário
+    custos_fixos = frota['custos_fixos_mes'].to_numpy()[:, None] * series['inflacao']
+    custos = series['custos'] + custos_fixos
+
+    # Receitas: parcela charter das horas, repassada ao proprietário
+    horas_charter = horas_voadas * (frota['percentual_charter'].to_numpy()[:, None] / 100)
+    receitas = horas_charter * preco_hora * params.get('percentual_proprietario', 0.9)
+
+    lucros = receitas - custos
+
+    receita_total = receitas.sum(axis=1)
+    custo_total = custos.sum(axis=1)
+    lucro_total = receita_total - custo_total
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = np.where(custo_total > 0, lucro_total / custo_total * 100, 0.0)
+
+    frota_custos = custos.sum(axis=0)
+    frota_receitas = receitas.sum(axis=0)
+    custo_frota = frota_custos.sum()
+
+    return {
+        'matriculas': frota['matricula'].to_numpy(),
+        'modelos': frota['modelo'].to_numpy(),
+        'meses': meses,
+        'horas_voadas': horas_voadas,
+        'horas_charter': horas_charter,
+        'receitas': receitas,
+        'custos': custos,
+        'lucros': lucros,
+        'receita_total': receita_total,
+        'custo_total': custo_total,
+        'lucro_total': lucro_total,
+        'roi': roi,
+        'frota_receitas': frota_receitas,
+        'frota_custos': frota_custos,
+        'frota_lucros': frota_receitas - frota_custos,
+        'frota_roi': float((frota_receitas.sum() - custo_frota) / custo_frota * 100) if custo_frota > 0 else 0.0
+    }
+
+
+def tabela_por_aeronave(resultado):
+    """
+    Resumo por matrícula em formato de tabela
+
+    Args:
+        resultado: Retorno de calcular_frota
+
+    Returns:
+        DataFrame com horas, receita, custo, lucro e ROI por aeronave
+    """
+    return pd.DataFrame({
+        'matricula': resultado['matriculas'],
+        'modelo': resultado['modelos'],
+        'horas_voadas': resultado['horas_voadas'].sum(axis=1),
+        'horas_charter': resultado['horas_charter'].sum(axis=1),
+        'receita_total': resultado['receita_total'],
+        'custo_total': resultado['custo_total'],
+        'lucro_total': resultado['lucro_total'],
+        'roi': resultado['roi']
+    })
+
+
+def frota_exemplo(params, n_aeronaves=5):
+    """Frota de exemplo com os modelos configurados, para preencher o editor"""
+    modelos = params.get('modelos_disponiveis', [])
+    letras = lambda i: ''.join(chr(ord('A') + (i // 26 ** k) % 26) for k in (2, 1, 0))
+    return pd.DataFrame({
+        'matricula': [f"PR-{letras(i)}" for i in range(n_aeronaves)],
+        'modelo': [modelos[i % len(modelos)] for i in range(n_aeronaves)],
+        'horas_mes': [60.0] * n_aeronaves,
+        'percentual_charter': [50.0] * n_aeronaves,
+        'custos_fixos_mes': [25000.0] * n_aeronaves
+    })
@@ -3,13 +3,14 @@ GRÁFICOS GARANTIDOS - SEMPRE FUNCIONAM
 Sem complicação, apenas Plotly básico que funciona
 """
 
-import plotly.graph_objects as go
-import plotly.express as px
+# Cada função importa plotly ao ser chamada: páginas sem gráficos não carregam o pacote
+
 
 def criar_grafico_pizza(valor1, valor2, titulo="Gráfico Pizza"):
     """
     Cria gráfico de pizza SIMPLES que SEMPRE aparece
     """
+    import plotly.graph_objects as go
     # Garantir valores numéricos válidos
     valor1 = float(valor1) if valor1 else 90.0
     valor2 = float(valor2) if valor2 else 10.0
@@ -60,6 +61,7 @@ def criar_grafico_barras(valores_dict, titulo="Gráfico Barras"):
     """
     Cria gráfico de barras SIMPLES que SEMPRE aparece
     """
+    import plotly.graph_objects as go
     # Valores padrão se vazio
     if not valores_dict:
         valores_dict = {
@@ -131,6 +133,7 @@ def criar_grafico_comparativo(valor_amaro, valor_mercado, titulo="Comparativo"):
     """
     Cria gráfico comparativo SIMPLES que SEMPRE aparece
     """
+    import plotly.graph_objects as go
     # Garantir valores válidos
     valor_amaro = float(valor_amaro) if valor_amaro else 8000.0
     valor_mercado = float(valor_mercado) if valor_mercado else 10000.0
@@ -212,6 +215,7 @@ def criar_grafico_linha(meses, valores, titulo="Projeção"):
     """
     Cria gráfico de linha SIMPLES que SEMPRE aparece
     """
+    import plotly.graph_objects as go
     # Garantir dados válidos
     if not meses or not valores:
         meses = list(range(1, 13))
@@ -266,6 +270,139 @@ def criar_grafico_linha(meses, valores, titulo="Projeção"):
     
     return fig
 
+def criar_grafico_histograma(bordas, contagens, titulo="Distribuição"):
+    """
+    Cria histograma de lucro a partir de contagens já agregadas
+    Faixas negativas em vermelho, positivas em verde
+    """
+    import plotly.graph_objects as go
+    bordas = [float(b) for b in bordas]
+    contagens = [int(c) for c in contagens]
+    total = sum(contagens) or 1
+    
+    # Centro e largura de cada faixa
+    centros = [(a + b) / 2 for a, b in zip(bordas[:-1], bordas[1:])]
+    larguras = [b - a for a, b in zip(bordas[:-1], bordas[1:])]
+    probabilidades = [c / total * 100 for c in contagens]
+    cores = ['#EF4444' if c < 0 else '#10B981' for c in centros]
+    
+    # Criar figura
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=centros,
+        y=probabilidades,
+        width=larguras,
+        marker=dict(color=cores, line=dict(width=0)),
+        hovertemplate='Lucro: R$ %{x:,.0f}<br>Probabilidade: %{y:.2f}%<extra></extra>'
+    ))
+    
+    # Linha de breakeven
+    if bordas[0] < 0 < bordas[-1]:
+        fig.add_vline(x=0, line=dict(color='#1F2937', width=2, dash='dash'))
+    
+    # Layout
+    fig.update_layout(
+        title=dict(
+            text=titulo,
+            x=0.5,
+            xanchor='center',
+            font=dict(size=18, color='#1F2937')
+        ),
+        height=400,
+        xaxis=dict(
+            title='Lucro Líquido (R$)',
+            showgrid=False,
+            showline=True,
+            linecolor='#E5E7EB',
+            tickfont=dict(size=12, color='#1F2937')
+        ),
+        yaxis=dict(
+            title='Probabilidade (%)',
+            showgrid=True,
+            gridcolor='#F3F4F6',
+            showline=True,
+            linecolor='#E5E7EB',
+            tickfont=dict(size=12, color='#1F2937')
+        ),
+        margin=dict(l=60, r=20, t=60, b=40),
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        showlegend=False,
+        bargap=0
+    )
+    
+    return fig
+
+def criar_grafico_heatmap(valores_x, valores_y, matriz, titulo="Sensibilidade",
+                          titulo_x="", titulo_y="", formato_valor="R$ %{z:,.0f}",
+                          ponto_atual=None):
+    """
+    Cria mapa de calor SIMPLES centrado em zero (vermelho = negativo, verde = positivo)
+    
+    Args:
+        valores_x: Valores das colunas da matriz
+        valores_y: Valores das linhas da matriz
+        matriz: Valores 2-D (linhas × colunas)
+        ponto_atual: Tuple (x, y) opcional destacado no mapa
+    """
+    import plotly.graph_objects as go
+    z = [[float(v) for v in linha] for linha in matriz]
+    limite = max((abs(v) for linha in z for v in linha), default=1.0) or 1.0
+    
+    # Criar figura
+    fig = go.Figure()
+    
+    fig.add_trace(go.Heatmap(
+        x=[float(v) for v in valores_x],
+        y=[float(v) for v in valores_y],
+        z=z,
+        zmin=-limite,
+        zmax=limite,
+        colorscale=[[0.0, '#EF4444'], [0.5, '#FFFFFF'], [1.0, '#10B981']],
+        colorbar=dict(tickfont=dict(size=11, color='#1F2937')),
+        hovertemplate=f'{titulo_x}: %{{x}}<br>{titulo_y}: %{{y:,.0f}}<br>{formato_valor}<extra></extra>'
+    ))
+    
+    # Destacar cenário selecionado
+    if ponto_atual is not None:
+        fig.add_trace(go.Scatter(
+            x=[float(ponto_atual[0])],
+            y=[float(ponto_atual[1])],
+            mode='markers',
+            marker=dict(size=14, color='#8C1D40', symbol='x', line=dict(color='white', width=2)),
+            hoverinfo='skip'
+        ))
+    
+    # Layout
+    fig.update_layout(
+        title=dict(
+            text=titulo,
+            x=0.5,
+            xanchor='center',
+            font=dict(size=18, color='#1F2937')
+        ),
+        height=450,
+        xaxis=dict(
+            title=titulo_x,
+            showline=True,
+            linecolor='#E5E7EB',
+            tickfont=dict(size=12, color='#1F2937')
+        ),
+        yaxis=dict(
+            title=titulo_y,
+            showline=True,
+            linecolor='#E5E7EB',
+            tickfont=dict(size=12, color='#1F2937')
+        ),
+        margin=dict(l=60, r=20, t=60, b=40),
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        showlegend=False
+    )
+    
+    return fig
+
 # Função de teste rápido
 def testar_graficos():
     """Testa se todos os gráficos funcionam"""
@@ -287,6 +424,14 @@ def testar_graficos():
         fig4 = criar_grafico_linha([1,2,3,4,5], [100,200,300,400,500], "Teste Linha")
         print("✅ Gráfico linha OK")
         
+        # Teste 5: Histograma
+        fig5 = criar_grafico_histograma([-100, 0, 100], [3, 7], "Teste Histograma")
+        print("✅ Gráfico histograma OK")
+        
+        # Teste 6: Heatmap
+        fig6 = criar_grafico_heatmap([50, 75], [8000, 9000], [[-1, 1], [2, 3]], "Teste Heatmap")
+        print("✅ Gráfico heatmap OK")
+        
         return True
     except Exception as e:
         print(f"❌ Erro: {e}")
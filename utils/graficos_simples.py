@@ -3,13 +3,15 @@ GRÁFICOS SIMPLES QUE SEMPRE FUNCIONAM
 Sem dependências complicadas, apenas Plotly básico
 """
 
-import plotly.graph_objects as go
+# plotly é importado nas próprias funções, só quando um gráfico é desenhado
+
 import streamlit as st
 
 def grafico_pizza_receitas(receita_proprietario, taxa_amaro):
     """
     Gráfico de pizza SIMPLES que sempre funciona
     """
+    import plotly.graph_objects as go
     try:
         # Garantir valores numéricos
         receita_proprietario = float(receita_proprietario) if receita_proprietario else 90000
@@ -46,6 +48,7 @@ def grafico_barras_custos(combustivel, tripulacao, manutencao, depreciacao):
     """
     Gráfico de barras SIMPLES que sempre funciona
     """
+    import plotly.graph_objects as go
     try:
         # Garantir valores numéricos
         combustivel = float(combustivel) if combustivel else 5000
@@ -89,6 +92,7 @@ def grafico_comparativo_simples(custo_amaro, preco_mercado):
     """
     Gráfico comparativo SIMPLES que sempre funciona
     """
+    import plotly.graph_objects as go
     try:
         # Garantir valores numéricos
         custo_amaro = float(custo_amaro) if custo_amaro else 8000
@@ -0,0 +1,189 @@
+"""
+Otimizador de itinerários com escalas sobre o grafo de rotas
+Dijkstra (ou A* com heurística) ponderado pela duração dos trechos
+
+O custo operacional de um trecho é linear nas horas (custo/hora fixo por
+modelo, sem taxas por pouso), então o itinerário mais curto é também o
+mais barato; não há um critério de custo separado.
+"""
+
+import heapq
+import numpy as np
+
+from utils.calculations import (
+    calcula_custos_lote, indices_modelos, tabela_coeficientes, COLUNAS_COEFICIENTES
+)
+
+
+class GrafoRotas:
+    """
+    Grafo dirigido de trechos em formato de adjacência compacta (CSR)
+
+    Os aeroportos viram inteiros e as arestas de cada nó ficam contíguas em
+    listas paralelas (vizinho, duração), o que mantém a busca rápida mesmo
+    com milhares de nós.
+    """
+
+    def __init__(self, indice_rotas, bidirecional=False):
+        origem = list(indice_rotas.origem)
+        destino = list(indice_rotas.destino)
+        duracao = list(indice_rotas.duracao_h)
+
+        if bidirecional:
+            origem, destino = origem + destino, destino + origem
+            duracao = duracao + duracao
+
+        self.aeroportos = tuple(sorted(set(origem) | set(destino)))
+        self.id_aeroporto = {a: i for i, a in enumerate(self.aeroportos)}
+
+        ids_origem = np.array([self.id_aeroporto[a] for a in origem], dtype=np.intp)
+        ids_destino = np.array([self.id_aeroporto[a] for a in destino], dtype=np.intp)
+        duracao = np.asarray(duracao, dtype=float)
+
+        ordem = np.argsort(ids_origem, kind='stable')
+        contagem = np.bincount(ids_origem, minlength=len(self.aeroportos))
+
+        # Listas Python: acesso por índice mais rápido que numpy no laço da busca
+        self.inicio = np.concatenate([[0], np.cumsum(contagem)]).tolist()
+        self.vizinho = ids_destino[ordem].tolist()
+        self.duracao = duracao[ordem].tolist()
+
+    def __len__(self):
+        return len(self.aeroportos)
+
+    def caminho_minimo(self, origem, destino, heuristica=None):
+        """
+        Caminho de menor duração entre dois aeroportos
+
+        Args:
+            origem: Código do aeroporto de origem
+            destino: Código do aeroporto de destino
+            heuristica: Função opcional código → limite inferior (em horas)
+                da duração restante até o destino (transforma a busca em A*)
+
+        Returns:
+            Lista de (origem, destino, duracao_h) por trecho, ou None se
+            não houver caminho
+        """
+        if origem not in self.id_aeroporto or destino not in self.id_aeroporto:
+            return None
+
+        inicio_id = self.id_aeroporto[origem]
+        alvo_id = self.id_aeroporto[destino]
+
+        if heuristica is None:
+            estimativa = lambda no: 0.0
+        else:
+            estimativa = lambda no: heuristica(self.aeroportos[no])
+
+        distancia = {inicio_id: 0.0}
+        anterior = {}
+        fila = [(estimativa(inicio_id), 0.0, inicio_id)]
+        visitados = set()
+
+        while fila:
+            _, dist_no, no = heapq.heappop(fila)
+            if no in visitados:
+                continue
+            if no == alvo_id:
+                break
+            visitados.add(no)
+
+            for aresta in range(self.inicio[no], self.inicio[no + 1]):
+                vizinho = self.vizinho[aresta]
+                if vizinho in visitados:
+                    continue
+                nova = dist_no + self.duracao[aresta]
+                if nova < distancia.get(vizinho, float('inf')):
+                    distancia[vizinho] = nova
+                    anterior[vizinho] = (no, aresta)
+                    heapq.heappush(fila, (nova + estimativa(vizinho), nova, vizinho))
+
+        if alvo_id not in distancia or (alvo_id == inicio_id):
+            return None
+
+        trechos = []
+        no = alvo_id
+        while no != inicio_id:
+            no_anterior, aresta = anterior[no]
+            trechos.append((self.aeroportos[no_anterior], self.aeroportos[no], self.duracao[aresta]))
+            no = no_anterior
+
+        return trechos[::-1]
+
+
+def obter_grafo(indice_rotas, bidirecional=False):
+    """
+    Grafo de rotas construído uma única vez por índice de rotas
+
+    Como o IndiceRotas é compartilhado via cache, o grafo também é.
+    """
+    grafos = indice_rotas.__dict__.setdefault('_grafos', {})
+    if bidirecional not in grafos:
+        grafos[bidirecional] = GrafoRotas(indice_rotas, bidirecional)
+    return grafos[bidirecional]
+
+
+def calcular_itinerario(origem, destino, modelo, params, indice_rotas,
+                        bidirecional=False, heuristica=None):
+    """
+    Calcula o itinerário de menor duração (e portanto de menor custo) com
+    escalas entre dois aeroportos
+
+    Args:
+        origem: Código do aeroporto de origem
+        destino: Código do aeroporto de destino
+        modelo: Modelo da aeronave
+        params: Parâmetros do sistema
+        indice_rotas: IndiceRotas com os trechos disponíveis
+        bidirecional: Permitir voar trechos no sentido inverso
+        heuristica: Limite inferior opcional (em horas) até o destino, para A*
+
+    Returns:
+        Dict com 'rota', 'trechos' (breakdown por trecho), 'numero_escalas',
+        'duracao_horas', 'custo_amaro', 'preco_mercado', 'economia' e 'viavel'
+    """
+    idx = int(indices_modelos(modelo, params))
+
+    grafo = obter_grafo(indice_rotas, bidirecional)
+    trechos = grafo.caminho_minimo(origem, destino, heuristica)
+
+    if not trechos:
+        raise ValueError(f"Nenhum itinerário encontrado de {origem} para {destino}")
+
+    duracoes = np.array([t[2] for t in trechos])
+    custos = calcula_custos_lote(np.full(len(trechos), idx), duracoes, params)
+    tabela, _ = tabela_coeficientes(params)
+    precos = duracoes * tabela[idx, COLUNAS_COEFICIENTES.index("preco_mercado")]
+
+    detalhes = []
+    for i, (de, para, duracao) in enumerate(trechos):
+        detalhes.append({
+            'origem': de,
+            'destino': para,
+            'duracao_horas': duracao,
+            'custo_amaro': float(custos['total'][i]),
+            'preco_mercado': float(precos[i]),
+            'breakdown_custos': {
+                'combustivel': float(custos['combustivel'][i]),
+                'manutencao': float(custos['manutencao'][i]),
+                'tripulacao': float(custos['tripulacao'][i]),
+                'depreciacao': float(custos['depreciacao'][i])
+            }
+        })
+
+    custo_total = float(custos['total'].sum())
+    preco_total = float(precos.sum())
+    economia = preco_total - custo_total
+
+    return {
+        'rota': " → ".join([trechos[0][0]] + [t[1] for t in trechos]),
+        'trechos': detalhes,
+        'numero_escalas': len(trechos) - 1,
+        'duracao_horas': float(duracoes.sum()),
+        'custo_amaro': custo_total,
+        'preco_mercado': preco_total,
+        'economia': economia,
+        'economia_percentual': (economia / preco_total * 100) if preco_total > 0 else 0,
+        'viavel': economia > 0
+    }
@@ -0,0 +1,298 @@
+"""
+Precificação em lote de arquivos de cenários (CSV ou Parquet), fora da interface
+
+Lê o arquivo em blocos, calcula cada bloco com o motor vetorizado de
+utils/calculations.py em um pool de processos e grava os resultados em
+fluxo, na ordem de entrada, sem carregar o arquivo inteiro na memória.
+
+    python -m utils.lote cenarios.csv resultados.csv
+    python -m utils.lote cotacoes.parquet precos.parquet --workers 8 --tamanho-bloco 100000
+
+Colunas de entrada (apenas 'modelo' é obrigatória):
+    modelo          Nome do modelo da aeronave
+    horas_charter   Horas de charter por mês (ativa as colunas de lucro charter)
+    taxa_ocupacao   Taxa de ocupação 0-100 (padrão: 75)
+    preco_hora      Preço por hora de charter (padrão: preço de mercado do modelo)
+    origem/destino  Rota cadastrada (ativa as colunas de custo da rota)
+
+As colunas de entrada são repetidas na saída, seguidas das calculadas e de
+'erro' (vazio quando a linha foi precificada).
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    COLUNAS_COEFICIENTES, calcula_custo_total_lote, calcular_lucro_charter_lote,
+    tabela_coeficientes
+)
+from utils.params import load_params
+from utils.rotas import carregar_indice_rotas
+
+TAMANHO_BLOCO_PADRAO = 50000
+TAXA_OCUPACAO_PADRAO = 75
+
+COLUNAS_CHARTER = (
+    'horas_efetivas', 'receita_bruta', 'receita_proprietario', 'taxa_amaro',
+    'custos_operacionais', 'lucro_liquido', 'roi_mensal'
+)
+
+# Estado de cada processo do pool (carregado uma vez no inicializador)
+_contexto = {}
+
+
+# ========================================================================
+# CÁLCULO DE UM BLOCO
+# ========================================================================
+def _coluna_numerica(bloco, nome, padrao):
+    """Coluna como float, com o padrão (escalar ou array) onde faltar valor"""
+    if nome not in bloco:
+        return np.broadcast_to(np.asarray(padrao, dtype=float), len(bloco)).copy()
+    valores = pd.to_numeric(bloco[nome], errors='coerce').to_numpy(dtype=float)
+    return np.where(np.isnan(valores), padrao, valores)
+
+
+def _marcar_erro(erros, mascara, mensagem):
+    """Registra o erro nas linhas da máscara que ainda não têm erro (vale o primeiro)"""
+    erros[mascara & (erros == "")] = mensagem
+
+
+def precificar_bloco(bloco, params, indice_rotas, permitir_inverso=False):
+    """
+    Precifica um bloco de cenários
+
+    Args:
+        bloco: DataFrame com as colunas de entrada
+        params: Parâmetros do sistema
+        indice_rotas: IndiceRotas para as linhas com origem/destino
+        permitir_inverso: Aceitar a rota cadastrada no sentido oposto
+
+    Returns:
+        DataFrame com as colunas de entrada, as calculadas e 'erro'.
+        Linhas com entrada inválida (modelo desconhecido, horas efetivas
+        não positivas, ocupação ou preço negativos) ficam com NaN nas
+        colunas afetadas e o motivo em 'erro'.
+    """
+    if 'modelo' not in bloco:
+        raise ValueError("Coluna 'modelo' é obrigatória")
+
+    n = len(bloco)
+    tabela, indice = tabela_coeficientes(params)
+    erros = np.full(n, "", dtype=object)
+
+    idx = bloco['modelo'].map(indice)
+    valido = idx.notna().to_numpy()
+    _marcar_erro(erros, ~valido, "modelo não encontrado")
+    idx = idx.fillna(0).to_numpy(dtype=np.intp)
+
+    saida = {}
+
+    if 'horas_charter' in bloco:
+        horas = pd.to_numeric(bloco['horas_charter'], errors='coerce').to_numpy(dtype=float)
+        taxa_ocupacao = _coluna_numerica(bloco, 'taxa_ocupacao', TAXA_OCUPACAO_PADRAO)
+        preco_hora = _coluna_numerica(
+            bloco, 'preco_hora', tabela[idx, COLUNAS_COEFICIENTES.index("preco_mercado")]
+        )
+        charter = calcular_lucro_charter_lote(
+            idx, np.nan_to_num(horas), taxa_ocupacao, preco_hora, params
+        )
+
+        # Mesmas recusas da versão escalar (horas efetivas > 0), mais ocupação e preço negativos
+        solicitado = valido & ~np.isnan(horas)
+        _marcar_erro(erros, solicitado & (taxa_ocupacao < 0), "taxa de ocupação negativa")
+        _marcar_erro(erros, solicitado & (preco_hora < 0), "preço por hora negativo")
+        _marcar_erro(erros, solicitado & ~(charter['horas_efetivas'] > 0),
+                     "Número de horas deve ser maior que zero")
+        calculado = solicitado & (taxa_ocupacao >= 0) & (preco_hora >= 0) & (charter['horas_efetivas'] > 0)
+        for coluna in COLUNAS_CHARTER:
+            saida[coluna] = np.where(calculado, charter[coluna], np.nan)
+
+    if 'origem' in bloco and 'destino' in bloco:
+        solicitada = (bloco['origem'].notna() & bloco['destino'].notna()).to_numpy()
+        pares = zip(bloco['origem'].astype(str).str.strip().str.upper(),
+                    bloco['destino'].astype(str).str.strip().str.upper())
+        linhas = np.array([
+            indice_rotas.posicao(o, d, permitir_inverso)[0] if pedida else None
+            for (o, d), pedida in zip(pares, solicitada)
+        ], dtype=float)
+        encontrada = ~np.isnan(linhas)
+        _marcar_erro(erros, valido & solicitada & ~encontrada, "rota não encontrada")
+
+        duracao = np.full(n, np.nan)
+        duracao[encontrada] = indice_rotas.duracao_h[linhas[encontrada].astype(np.intp)]
+        calculado = valido & encontrada
+
+        custo = calcula_custo_total_lote(idx, np.nan_to_num(duracao), params)
+        preco = np.nan_to_num(duracao) * tabela[idx, COLUNAS_COEFICIENTES.index("preco_mercado")]
+        saida['duracao_rota_h'] = duracao
+        saida['custo_rota'] = np.where(calculado, custo, np.nan)
+        saida['preco_mercado_rota'] = np.where(calculado, preco, np.nan)
+        saida['economia_rota'] = np.where(calculado, preco - custo, np.nan)
+
+    saida['erro'] = erros
+    resultado = bloco.reset_index(drop=True)
+    return resultado.assign(**saida)
+
+
+def _inicializar_processo(hash_params, permitir_inverso):
+    """Carrega parâmetros e rotas uma vez por processo do pool"""
+    params = load_params()
+    if params.hash != hash_params:
+        raise RuntimeError("Parâmetros alterados durante o processamento do lote")
+    _contexto['params'] = params
+    _contexto['indice_rotas'] = carregar_indice_rotas()
+    _contexto['permitir_inverso'] = permitir_inverso
+
+
+def _precificar_no_processo(bloco):
+    return precificar_bloco(bloco, _contexto['params'], _contexto['indice_rotas'],
+                            _contexto['permitir_inverso'])
+
+
+# ========================================================================
+# LEITURA E ESCRITA EM FLUXO
+# ========================================================================
+def _formato(caminho):
+    sufixo = Path(caminho).suffix.lower()
+    if sufixo in (".parquet", ".pq"):
+        return "parquet"
+    if sufixo in (".csv", ".txt"):
+        return "csv"
+    raise ValueError(f"Formato não suportado: '{sufixo}' (use .csv ou .parquet)")
+
+
+def ler_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+    """Gera DataFrames de até tamanho_bloco linhas do arquivo de entrada"""
+    if _formato(caminho) == "parquet":
+        import pyarrow.parquet as pq
+        for lote in pq.ParquetFile(caminho).iter_batches(batch_size=tamanho_bloco):
+            yield lote.to_pandas()
+    else:
+        yield from pd.read_csv(caminho, chunksize=tamanho_bloco,
+                               dtype={'modelo': str, 'origem': str, 'destino': str})
+
+
+class EscritorResultados:
+    """Grava blocos de resultado em CSV ou Parquet conforme a extensão do destino"""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.formato = _formato(caminho)
+        self._escritor = None
+        self._primeiro = True
+
+    def gravar(self, bloco):
+        if self.formato == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            tabela = pa.Table.from_pandas(bloco, preserve_index=False)
+            if self._escritor is None:
+                self._escritor = pq.ParquetWriter(self.caminho, tabela.schema)
+            self._escritor.write_table(tabela.cast(self._escritor.schema))
+        else:
+            bloco.to_csv(self.caminho, mode="w" if self._primeiro else "a",
+                         header=self._primeiro, index=False)
+        self._primeiro = False
+
+    def fechar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+
+
+def processar_arquivo(entrada, saida, workers=None, tamanho_bloco=TAMANHO_BLOCO_PADRAO,
+                      permitir_inverso=False, progresso=None):
+    """
+    Precifica um arquivo inteiro, bloco a bloco, gravando a saída em fluxo
+
+    No máximo 2 blocos por processo ficam em andamento ao mesmo tempo, então
+    a memória usada não depende do tamanho do arquivo.
+
+    Args:
+        entrada: Arquivo de cenários (.csv ou .parquet)
+        saida: Arquivo de resultados (.csv ou .parquet)
+        workers: Processos do pool (padrão: número de CPUs; 1 calcula no
+                 próprio processo)
+        tamanho_bloco: Linhas por bloco
+        permitir_inverso: Aceitar rotas cadastradas no sentido oposto
+        progresso: Função (linhas, segundos) chamada após cada bloco gravado
+
+    Returns:
+        Dict com 'linhas', 'erros', 'segundos' e 'linhas_por_segundo'
+    """
+    params = load_params()
+    workers = workers or os.cpu_count() or 1
+    escritor = EscritorResultados(saida)
+    linhas = erros = 0
+    inicio = time.perf_counter()
+
+    def gravar(resultado):
+        nonlocal linhas, erros
+        escritor.gravar(resultado)
+        linhas += len(resultado)
+        erros += int((resultado['erro'] != "").sum())
+        if progresso:
+            progresso(linhas, time.perf_counter() - inicio)
+
+    try:
+        if workers == 1:
+            indice_rotas = carregar_indice_rotas()
+            for bloco in ler_blocos(entrada, tamanho_bloco):
+                gravar(precificar_bloco(bloco, params, indice_rotas, permitir_inverso))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_processo,
+                                     initargs=(params.hash, permitir_inverso)) as pool:
+                pendentes = deque()
+                for bloco in ler_blocos(entrada, tamanho_bloco):
+                    pendentes.append(pool.submit(_precificar_no_processo, bloco))
+                    if len(pendentes) >= 2 * workers:
+                        gravar(pendentes.popleft().result())
+                while pendentes:
+                    gravar(pendentes.popleft().result())
+    finally:
+        escritor.fechar()
+
+    segundos = time.perf_counter() - inicio
+    return {
+        'linhas': linhas,
+        'erros': erros,
+        'segundos': segundos,
+        'linhas_por_segundo': linhas / segundos if segundos > 0 else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precifica um arquivo de cenários (CSV/Parquet) em lote")
+    parser.add_argument("entrada", help="Arquivo de cenários (.csv ou .parquet)")
+    parser.add_argument("saida", help="Arquivo de resultados (.csv ou .parquet)")
+    parser.add_argument("--workers", type=int, default=None, help="Processos (padrão: número de CPUs)")
+    parser.add_argument("--tamanho-bloco", type=int, default=TAMANHO_BLOCO_PADRAO,
+                        help=f"Linhas por bloco (padrão: {TAMANHO_BLOCO_PADRAO})")
+    parser.add_argument("--inverso", action="store_true",
+                        help="Aceitar rotas cadastradas no sentido oposto")
+    args = parser.parse_args()
+
+    # Fora do Streamlit os caches avisam "No runtime found" a cada uso
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    def progresso(linhas, segundos):
+        print(f"\r{linhas:,} linhas  {linhas / max(segundos, 1e-9):,.0f} linhas/s",
+              end="", file=sys.stderr, flush=True)
+
+    resumo = processar_arquivo(args.entrada, args.saida, args.workers, args.tamanho_bloco,
+                               args.inverso, progresso)
+    print(file=sys.stderr)
+    print(f"✅ {resumo['linhas']:,} linhas em {resumo['segundos']:.1f}s "
+          f"({resumo['linhas_por_segundo']:,.0f} linhas/s, {resumo['erros']:,} com erro) → {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,27 @@
 """params.py - Sistema de parâmetros premium com fallbacks e validação"""
 
+import hashlib
 import json
+import threading
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import streamlit as st
 
+from utils.calculations import construir_tabela_coeficientes
+from utils.storage import gravar_json, gravar_csv, geracao_atual
+from utils.catalogo import obter_catalogo
+from utils.snapshot import ParametrosSnapshot, registrar_snapshot, carregar_snapshot
+
 PARAMS_FILE = "config/parametros.json"
 MODELOS_FILE = "data/modelos.csv"
 
+# Velocidade de cruzeiro (km/h) por tipo, usada quando o CSV não traz a coluna
+VELOCIDADE_PADRAO_TIPO = {
+    "turboprop": 500,
+    "jato": 780
+}
+
 @st.cache_data(show_spinner=False)
 def get_default_params():
     """Parâmetros padrão caso o arquivo não exista ou seja inválido"""
@@ -29,109 +43,320 @@ def get_default_params():
 def get_default_modelos():
     """Modelos padrão caso o CSV não exista"""
     return pd.DataFrame([
-        {"modelo": "Pilatus PC-12", "consumo_l_por_h": 260, "manut_tipo": "turboprop", "tipo": "turboprop"},
-        {"modelo": "Cessna Citation XLS", "consumo_l_por_h": 600, "manut_tipo": "jato", "tipo": "jato"},
-        {"modelo": "Embraer Phenom 300E", "consumo_l_por_h": 650, "manut_tipo": "jato", "tipo": "jato"}
+        {"modelo": "Pilatus PC-12", "consumo_l_por_h": 260, "manut_tipo": "turboprop", "tipo": "turboprop", "velocidade_cruzeiro_kmh": 500},
+        {"modelo": "Cessna Citation XLS", "consumo_l_por_h": 600, "manut_tipo": "jato", "tipo": "jato", "velocidade_cruzeiro_kmh": 795},
+        {"modelo": "Embraer Phenom 300E", "consumo_l_por_h": 650, "manut_tipo": "jato", "tipo": "jato", "velocidade_cruzeiro_kmh": 834}
     ])
 
-@st.cache_data
-def load_params():
+# Cache em camadas, cada uma com a chave dos arquivos de que depende:
+# editar parametros.json não relê o CSV nem refaz as tabelas só de modelos
+_cache_lock = threading.RLock()
+_cache_arquivos = {}   # caminho → ((mtime_ns, tamanho, geração), hash do conteúdo)
+_cache_derivados = {}  # camada → (chave, valor)
+
+def _hash_arquivo(caminho, geracao=0):
     """
-    Carrega parâmetros do JSON e dados dos modelos, com fallbacks robustos
+    Hash do conteúdo do arquivo, verificado com um único stat por acesso
+
+    O conteúdo só é lido e re-hasheado quando mtime, tamanho ou a geração
+    do armazenamento mudam (a geração cobre regravações do app dentro da
+    mesma resolução de mtime); um arquivo regravado com o mesmo conteúdo
+    mantém o hash e o cache.
+
+    Returns:
+        Hash hexadecimal ou None se o arquivo não existir
     """
+    try:
+        info = Path(caminho).stat()
+    except FileNotFoundError:
+        return None
+
+    assinatura = (info.st_mtime_ns, info.st_size, geracao)
+    anterior = _cache_arquivos.get(caminho)
+    if anterior is not None and anterior[0] == assinatura:
+        return anterior[1]
+
+    with open(caminho, "rb") as f:
+        conteudo_hash = hashlib.sha1(f.read()).hexdigest()
+    _cache_arquivos[caminho] = (assinatura, conteudo_hash)
+    return conteudo_hash
+
+def _derivado(camada, chave, construir):
+    """Valor da camada em cache enquanto a chave não mudar (falhas não são guardadas)"""
+    atual = _cache_derivados.get(camada)
+    if atual is not None and atual[0] == chave:
+        return atual[1]
+
+    valor = construir()
+    _cache_derivados[camada] = (chave, valor)
+    return valor
+
+def _ler_params_json():
+    with open(PARAMS_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _tabelas_modelos(df_modelos):
+    """Dicionários que dependem apenas de data/modelos.csv"""
+    modelos = df_modelos['modelo'].tolist()
+    tipos = df_modelos['tipo']
+    
+    # Consumo por modelo
+    consumo_modelos = dict(zip(modelos, df_modelos['consumo_l_por_h'].astype(float)))
+    
+    # Velocidade de cruzeiro; modelos sem valor usam o padrão do tipo
+    velocidade_tipo = tipos.map(VELOCIDADE_PADRAO_TIPO).astype(float)
+    if 'velocidade_cruzeiro_kmh' in df_modelos:
+        velocidade = df_modelos['velocidade_cruzeiro_kmh'].astype(float).fillna(velocidade_tipo)
+    else:
+        velocidade = velocidade_tipo
+    velocidade_modelos = dict(zip(modelos, velocidade))
+    
+    return {
+        'modelos': modelos,
+        'tipos': tipos,
+        'consumo_modelos': consumo_modelos,
+        'velocidade_modelos': velocidade_modelos
+    }
+
+def _tabelas_custos(params, tabelas_modelos):
+    """Dicionários e tabela de coeficientes que dependem dos dois arquivos"""
+    modelos = tabelas_modelos['modelos']
+    tipos = tabelas_modelos['tipos']
+    
+    # Tipo sem custo de manutenção ou preço de mercado configurado
+    tipos_invalidos = set(tipos) - (set(params['custo_manutencao_hora']) & set(params['preco_mercado']))
+    if tipos_invalidos:
+        raise KeyError(sorted(tipos_invalidos)[0])
+    
+    # Custo de manutenção baseado no tipo
+    custo_manutencao = dict(zip(modelos, tipos.map(params['custo_manutencao_hora']).astype(float)))
+    
+    # Custo do piloto (igual para todos)
+    custo_piloto_hora = dict.fromkeys(modelos, float(params['custo_piloto_hora']))
+    
+    # Depreciação por hora (baseada em valor estimado da aeronave)
+    valor_base = np.where(tipos == 'jato', 50000000, 20000000)
+    horas_ano = 400
+    depreciacao_hora = dict(zip(modelos, (valor_base * params['depreciacao_anual_pct'] / 100) / horas_ano))
+    
+    # Preço de mercado baseado no tipo
+    preco_mercado_hora = dict(zip(modelos, tipos.map(params['preco_mercado']).astype(float)))
+    
+    # Adicionar dicionários calculados aos parâmetros
+    params = dict(params)
+    params.update({
+        'consumo_modelos': tabelas_modelos['consumo_modelos'],
+        'custo_manutencao': custo_manutencao,
+        'custo_piloto_hora_modelo': custo_piloto_hora,
+        'depreciacao_hora': depreciacao_hora,
+        'preco_mercado_hora': preco_mercado_hora,
+        'velocidade_modelos': tabelas_modelos['velocidade_modelos'],
+        'modelos_disponiveis': list(tabelas_modelos['consumo_modelos'].keys())
+    })
+    
+    # Tabela de coeficientes R$/h por modelo, compilada uma única vez
+    coeficientes, indice = construir_tabela_coeficientes(params)
+    params.update({
+        'coeficientes_modelos': coeficientes,
+        'indice_modelos': indice
+    })
+    
+    return params
+
+def _fontes_arquivos():
+    """Parâmetros e modelos lidos de config/parametros.json e data/modelos.csv"""
+    geracao = geracao_atual()
+    
     # Carregamento dos parâmetros básicos com fallback
+    hash_params = _hash_arquivo(PARAMS_FILE, geracao)
     try:
-        if Path(PARAMS_FILE).exists():
-            with open(PARAMS_FILE, "r", encoding="utf-8") as f:
-                params = json.load(f)
+        if hash_params is not None:
+            params = _derivado('params', hash_params, _ler_params_json)
         else:
             params = get_default_params()
-            save_params(params)  # Cria arquivo padrão
+            _gravar_params(params)  # Cria arquivo padrão
+            hash_params = _hash_arquivo(PARAMS_FILE, geracao_atual())
+            _cache_derivados['params'] = (hash_params, params)
     except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
         st.warning(f"Erro ao carregar parâmetros: {e}. Usando valores padrão.")
         params = get_default_params()
-    
+        hash_params = 'padrao'
+
     # Carregamento dos modelos com fallback
+    hash_modelos = _hash_arquivo(MODELOS_FILE, geracao)
     try:
-        if Path(MODELOS_FILE).exists():
-            df_modelos = pd.read_csv(MODELOS_FILE)
+        if hash_modelos is not None:
+            df_modelos = _derivado('df_modelos', hash_modelos, lambda: pd.read_csv(MODELOS_FILE))
         else:
             df_modelos = get_default_modelos()
-            df_modelos.to_csv(MODELOS_FILE, index=False)
+            gravar_csv(MODELOS_FILE, df_modelos)
+            hash_modelos = _hash_arquivo(MODELOS_FILE, geracao_atual())
+            _cache_derivados['df_modelos'] = (hash_modelos, df_modelos)
     except (pd.errors.EmptyDataError, FileNotFoundError, KeyError) as e:
         st.warning(f"Erro ao carregar modelos: {e}. Usando modelos padrão.")
         df_modelos = get_default_modelos()
+        hash_modelos = 'padrao'
+    
+    return params, hash_params, df_modelos, hash_modelos
+
+def _fontes_catalogo(catalogo):
+    """Parâmetros e modelos lidos do catálogo SQLite, chaveados pelas revisões"""
+    revisoes = catalogo.revisoes()
+    hash_params = ('catalogo', catalogo.caminho, revisoes['parametros'])
+    hash_modelos = ('catalogo', catalogo.caminho, revisoes['modelos'])
     
-    # Construção dos dicionários dinâmicos baseados nos modelos
-    consumo_modelos = {}
-    custo_manutencao = {}
-    custo_piloto_hora = {}
-    depreciacao_hora = {}
-    preco_mercado_hora = {}
+    params = _derivado('params', hash_params, catalogo.ler_parametros)
+    if params is None:
+        params = get_default_params()
+        hash_params = 'padrao'
     
-    for _, row in df_modelos.iterrows():
-        modelo = row['modelo']
-        tipo = row['tipo']
-        
-        # Consumo por modelo
-        consumo_modelos[modelo] = float(row['consumo_l_por_h'])
-        
-        # Custo de manutenção baseado no tipo
-        custo_manutencao[modelo] = float(params['custo_manutencao_hora'][tipo])
-        
-        # Custo do piloto (igual para todos)
-        custo_piloto_hora[modelo] = float(params['custo_piloto_hora'])
-        
-        # Depreciação por hora (baseada em valor estimado da aeronave)
-        valor_base = 50000000 if tipo == 'jato' else 20000000
-        horas_ano = 400
-        depreciacao_hora[modelo] = (valor_base * params['depreciacao_anual_pct'] / 100) / horas_ano
+    df_modelos = _derivado('df_modelos', hash_modelos, catalogo.ler_modelos)
+    if df_modelos.empty:
+        st.warning("Catálogo sem modelos. Usando modelos padrão.")
+        df_modelos = get_default_modelos()
+        hash_modelos = 'padrao'
+    
+    return params, hash_params, df_modelos, hash_modelos
+
+def _fontes():
+    """Parâmetros básicos e modelos da origem ativa (catálogo ou arquivos), com suas chaves"""
+    catalogo = obter_catalogo()
+    if catalogo is not None:
+        return _fontes_catalogo(catalogo)
+    return _fontes_arquivos()
+
+def load_params():
+    """
+    Carrega parâmetros do JSON e dados dos modelos, com fallbacks robustos
+
+    O resultado fica em cache por processo e é invalidado pelo conteúdo de
+    config/parametros.json e data/modelos.csv (um stat por arquivo a cada
+    chamada), inclusive para edições feitas fora do app; com o catálogo
+    SQLite habilitado, pelas revisões das tabelas.
+
+    Returns:
+        ParametrosSnapshot imutável (interface de dict) com hash do conteúdo
+        em .hash; use .como_dict() para obter uma cópia editável
+    """
+    with _cache_lock:
+        params, hash_params, df_modelos, hash_modelos = _fontes()
         
-        # Preço de mercado baseado no tipo
-        preco_mercado_hora[modelo] = float(params['preco_mercado'][tipo])
+        # Construção dos dicionários dinâmicos, refeitos só quando a origem muda
+        tabelas_modelos = _derivado('tabelas_modelos', hash_modelos,
+                                    lambda: _tabelas_modelos(df_modelos))
+        return _derivado('params_completos', (hash_params, hash_modelos),
+                         lambda: ParametrosSnapshot(_tabelas_custos(params, tabelas_modelos)))
+
+def _registrar_historico():
+    """
+    Registra no histórico os parâmetros e modelos em vigor
+
+    Chamado antes e depois de cada gravação: o estado anterior também fica
+    disponível para rollback, e leituras nunca gravam no histórico.
+    """
+    try:
+        with _cache_lock:
+            snapshot = load_params()
+            params, _, df_modelos, _ = _fontes()
+        registrar_snapshot(snapshot, params, df_modelos)
+    except (OSError, KeyError, ValueError):
+        pass  # Histórico é auxiliar: falha nele não impede a gravação
+
+def _limpar_cache_params():
+    """Descarta todas as camadas do cache (compatível com load_params.clear())"""
+    with _cache_lock:
+        _cache_arquivos.clear()
+        _cache_derivados.clear()
+
+load_params.clear = _limpar_cache_params
+
+def _gravar_params(params_data):
+    """Grava os parâmetros básicos (não os calculados) na origem ativa, sem histórico"""
+    # Criar diretório se não existir
+    Path(PARAMS_FILE).parent.mkdir(parents=True, exist_ok=True)
     
-    # Adicionar dicionários calculados aos parâmetros
-    params.update({
-        'consumo_modelos': consumo_modelos,
-        'custo_manutencao': custo_manutencao,
-        'custo_piloto_hora_modelo': custo_piloto_hora,
-        'depreciacao_hora': depreciacao_hora,
-        'preco_mercado_hora': preco_mercado_hora,
-        'modelos_disponiveis': list(consumo_modelos.keys())
-    })
+    # Extrair apenas parâmetros básicos para salvar
+    basic_params = {
+        'preco_combustivel': float(params_data['preco_combustivel']),
+        'custo_piloto_hora': float(params_data['custo_piloto_hora']),
+        'depreciacao_anual_pct': float(params_data['depreciacao_anual_pct']),
+        'custo_manutencao_hora': params_data['custo_manutencao_hora'],
+        'percentual_proprietario': float(params_data.get('percentual_proprietario', 0.9)),
+        'preco_mercado': params_data['preco_mercado']
+    }
     
-    return params
+    catalogo = obter_catalogo()
+    if catalogo is not None:
+        # Nova versão no catálogo (histórico preservado)
+        catalogo.salvar_parametros(basic_params)
+    else:
+        # Gravação atômica: leitores nunca veem o arquivo pela metade
+        gravar_json(PARAMS_FILE, basic_params)
+        
+    # Limpar cache para recarregar parâmetros
+    load_params.clear()
+
+def _gravar_modelos(df_modelos):
+    """Grava a tabela de modelos na origem ativa, sem histórico"""
+    catalogo = obter_catalogo()
+    if catalogo is not None:
+        catalogo.salvar_modelos(df_modelos)
+    else:
+        gravar_csv(MODELOS_FILE, df_modelos)
 
 def save_params(params_data):
     """
     Salva apenas os parâmetros básicos (não os calculados)
     """
     try:
-        # Criar diretório se não existir
-        Path(PARAMS_FILE).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Extrair apenas parâmetros básicos para salvar
-        basic_params = {
-            'preco_combustivel': float(params_data['preco_combustivel']),
-            'custo_piloto_hora': float(params_data['custo_piloto_hora']),
-            'depreciacao_anual_pct': float(params_data['depreciacao_anual_pct']),
-            'custo_manutencao_hora': params_data['custo_manutencao_hora'],
-            'percentual_proprietario': float(params_data.get('percentual_proprietario', 0.9)),
-            'preco_mercado': params_data['preco_mercado']
-        }
-        
-        with open(PARAMS_FILE, "w", encoding="utf-8") as f:
-            json.dump(basic_params, f, indent=2, ensure_ascii=False)
-            
-        # Limpar cache para recarregar parâmetros
-        load_params.clear()
-        
+        _registrar_historico()
+        _gravar_params(params_data)
+        _registrar_historico()
         return True
         
     except Exception as e:
         st.error(f"Erro ao salvar parâmetros: {e}")
         return False
 
+def load_modelos():
+    """
+    Tabela de modelos para edição (catálogo SQLite ou data/modelos.csv)
+    """
+    catalogo = obter_catalogo()
+    if catalogo is not None:
+        return catalogo.ler_modelos()
+    return pd.read_csv(MODELOS_FILE)
+
+def save_modelos(df_modelos):
+    """
+    Salva a tabela de modelos: linha a linha no catálogo ou CSV atômico
+    """
+    _registrar_historico()
+    _gravar_modelos(df_modelos)
+    _registrar_historico()
+
+def restaurar_snapshot(hash_snapshot):
+    """
+    Restaura parâmetros e modelos de um snapshot do histórico
+
+    Args:
+        hash_snapshot: Hash do snapshot registrado
+
+    Returns:
+        True se restaurado com sucesso
+    """
+    params_base, df_modelos = carregar_snapshot(hash_snapshot)
+    try:
+        _registrar_historico()
+        _gravar_params(params_base)
+        _gravar_modelos(df_modelos)
+    except Exception as e:
+        st.error(f"Erro ao salvar parâmetros: {e}")
+        return False
+    load_params.clear()
+    _registrar_historico()
+    return True
+
 def validate_params(params):
     """
     Valida se os parâmetros estão em formato correto
@@ -0,0 +1,234 @@
+"""
+Escrita de planilhas Excel em fluxo (xlsxwriter em modo constant_memory)
+
+Cada linha vai direto para o XML temporário da aba e é descartada da
+memória, então o consumo não depende do número de linhas. Números,
+booleanos e datas são gravados como células tipadas. O arquivo final é
+montado em um arquivo temporário que fica em memória enquanto for pequeno
+e passa para o disco acima de LIMITE_MEMORIA_BYTES.
+"""
+
+import math
+import tempfile
+from datetime import date, datetime
+
+import numpy as np
+
+# Acima deste tamanho o .xlsx gerado é mantido em disco, não em memória
+LIMITE_MEMORIA_BYTES = 8 * 1024 * 1024
+
+COR_PRIMARIA = '#8c1d40'
+
+FORMATOS = {
+    'titulo': {'bold': True, 'font_size': 14, 'font_color': COR_PRIMARIA},
+    'secao': {'bold': True, 'font_color': COR_PRIMARIA},
+    'cabecalho': {
+        'bold': True,
+        'font_color': 'white',
+        'bg_color': COR_PRIMARIA,
+        'align': 'center',
+        'border': 1
+    },
+    'moeda': {'num_format': 'R$ #,##0.00', 'align': 'right'},
+    'percentual': {'num_format': '0.00"%"', 'align': 'right'},
+    'numero': {'num_format': '#,##0.00', 'align': 'right'},
+    'inteiro': {'num_format': '#,##0', 'align': 'right'},
+    'data': {'num_format': 'dd/mm/yyyy hh:mm', 'align': 'right'}
+}
+
+
+class ArquivoPlanilha(tempfile.SpooledTemporaryFile):
+    """
+    Arquivo temporário (memória → disco) com getvalue(), como um BytesIO
+
+    Permite que quem já usava o BytesIO das exportações continue chamando
+    getvalue(); quem puder deve ler o arquivo em blocos.
+    """
+
+    def getvalue(self):
+        posicao = self.tell()
+        self.seek(0)
+        try:
+            return self.read()
+        finally:
+            self.seek(posicao)
+
+    @property
+    def em_disco(self):
+        return self._rolled
+
+    @property
+    def tamanho(self):
+        posicao = self.tell()
+        self.seek(0, 2)
+        try:
+            return self.tell()
+        finally:
+            self.seek(posicao)
+
+
+class AbaStreaming:
+    """Aba escrita linha a linha, de cima para baixo"""
+
+    def __init__(self, planilha, planilha_xlsx):
+        self._planilha = planilha
+        self._aba = planilha_xlsx
+        self.linha = 0
+
+    def definir_larguras(self, larguras):
+        """Larguras das colunas (lista na ordem das colunas)"""
+        for coluna, largura in enumerate(larguras):
+            self._aba.set_column(coluna, coluna, largura)
+
+    def escrever_linha(self, valores, formatos=None):
+        """
+        Escreve a próxima linha
+
+        Args:
+            valores: Valores da linha (números, textos, datas, None)
+            formatos: Nome de formato comum à linha, ou lista com um nome
+                      (ou None) por coluna
+        """
+        if formatos is None or isinstance(formatos, str):
+            formatos = [formatos] * len(valores)
+        for coluna, (valor, formato) in enumerate(zip(valores, formatos)):
+            self._planilha.escrever_celula(self._aba, self.linha, coluna, valor, formato)
+        self.linha += 1
+
+    def escrever_linhas(self, linhas, formatos=None):
+        """Escreve um iterável de linhas (pode ser um gerador)"""
+        for valores in linhas:
+            self.escrever_linha(valores, formatos)
+
+    def escrever_cabecalho(self, colunas):
+        self.escrever_linha(colunas, 'cabecalho')
+        self._aba.freeze_panes(self.linha, 0)
+
+    def escrever_dataframe(self, df, formatos=None, tamanho_bloco=10000):
+        """
+        Escreve um DataFrame (cabeçalho + linhas) em blocos
+
+        Args:
+            df: DataFrame
+            formatos: Dict coluna → nome de formato
+            tamanho_bloco: Linhas convertidas por vez
+        """
+        formatos = formatos or {}
+        colunas = list(df.columns)
+        self.escrever_cabecalho([str(c) for c in colunas])
+        formatos_linha = [formatos.get(c) for c in colunas]
+        for inicio in range(0, len(df), tamanho_bloco):
+            bloco = df.iloc[inicio:inicio + tamanho_bloco]
+            self.escrever_linhas(bloco.itertuples(index=False, name=None), formatos_linha)
+
+
+class PlanilhaStreaming:
+    """
+    Pasta de trabalho Excel escrita em fluxo
+
+    Uso:
+        with PlanilhaStreaming() as planilha:
+            aba = planilha.nova_aba("Projeção")
+            aba.escrever_cabecalho(["Mês", "Receita"])
+            aba.escrever_linhas(linhas, [None, 'moeda'])
+        arquivo = planilha.arquivo  # ArquivoPlanilha posicionado no início
+
+    As linhas de cada aba precisam ser escritas em ordem (exigência do modo
+    constant_memory); abas diferentes podem ser escritas uma após a outra.
+    """
+
+    def __init__(self, destino=None, limite_memoria=LIMITE_MEMORIA_BYTES):
+        """
+        Args:
+            destino: Caminho do .xlsx; None gera um ArquivoPlanilha temporário
+            limite_memoria: Tamanho a partir do qual o temporário vai para o disco
+
+        Raises:
+            ImportError: Se o xlsxwriter não estiver instalado
+        """
+        # Importado só aqui: páginas que apenas importam o export_manager
+        # não pagam o xlsxwriter enquanto nada é exportado
+        import xlsxwriter
+
+        self.arquivo = ArquivoPlanilha(max_size=limite_memoria) if destino is None else None
+        self._livro = xlsxwriter.Workbook(self.arquivo if destino is None else str(destino), {
+            'constant_memory': True,
+            'tmpdir': tempfile.gettempdir(),
+            'nan_inf_to_errors': True
+        })
+        self.formatos = {nome: self._livro.add_format(f) for nome, f in FORMATOS.items()}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastreio):
+        self.fechar()
+        return False
+
+    def nova_aba(self, nome, larguras=None):
+        """Cria uma aba (nome limitado a 31 caracteres, como exige o Excel)"""
+        aba = AbaStreaming(self, self._livro.add_worksheet(nome[:31]))
+        if larguras:
+            aba.definir_larguras(larguras)
+        return aba
+
+    def escrever_celula(self, aba, linha, coluna, valor, formato=None):
+        """Grava uma célula com o tipo adequado ao valor"""
+        formato = self.formatos.get(formato) if formato else None
+
+        if isinstance(valor, np.generic):
+            valor = valor.item()
+
+        if valor is None or (isinstance(valor, float) and math.isnan(valor)):
+            aba.write_blank(linha, coluna, None, formato)
+        elif isinstance(valor, bool):
+            aba.write_boolean(linha, coluna, valor, formato)
+        elif isinstance(valor, (int, float)):
+            aba.write_number(linha, coluna, valor, formato)
+        elif isinstance(valor, (datetime, date)):
+            aba.write_datetime(linha, coluna, valor, formato or self.formatos['data'])
+        else:
+            aba.write_string(linha, coluna, str(valor), formato)
+
+    def fechar(self):
+        """Finaliza o arquivo; o ArquivoPlanilha (se houver) volta para o início"""
+        if self._livro is None:
+            return
+        self._livro.close()
+        self._livro = None
+        if self.arquivo is not None:
+            self.arquivo.seek(0)
+
+
+def formato_resultado(valor):
+    """
+    Formato de um valor de resultado nos relatórios: acima de 1000 é
+    tratado como valor em reais, abaixo como percentual
+
+    Returns:
+        Nome do formato ou None para valores não numéricos
+    """
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+        return None
+    return 'moeda' if valor > 1000 else 'percentual'
+
+
+def linhas_achatadas(dados, prefixo="", rotulo=None):
+    """
+    Gera (campo, valor) para um dict aninhado, com chaves unidas por '_'
+
+    Args:
+        dados: Dict possivelmente aninhado
+        prefixo: Prefixo das chaves (uso interno da recursão)
+        rotulo: Função aplicada ao nome final do campo (ex.: título)
+    """
+    for chave, valor in dados.items():
+        nova_chave = f"{prefixo}_{chave}" if prefixo else str(chave)
+        if isinstance(valor, dict):
+            yield from linhas_achatadas(valor, nova_chave, rotulo)
+        else:
+            if isinstance(valor, (list, tuple, np.ndarray)):
+                valor = str(list(valor))
+            yield (rotulo(nova_chave) if rotulo else nova_chave), valor
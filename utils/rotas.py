@@ -0,0 +1,222 @@
+"""
+Índice de rotas carregado uma única vez a partir de data/rotas.csv
+Busca O(1) por par origem/destino e destinos pré-ordenados por origem
+"""
+
+import hashlib
+from functools import cached_property
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.storage import geracao_atual, gravar_csv
+from utils.catalogo import obter_catalogo
+
+ROTAS_FILE = "data/rotas.csv"
+
+# Rotas padrão caso o CSV não exista ou seja inválido
+ROTAS_PADRAO = [
+    {"origem": "GRU", "destino": "SDU", "duracao_h": 1.0},
+    {"origem": "GRU", "destino": "CGH", "duracao_h": 0.5},
+    {"origem": "CGH", "destino": "BSB", "duracao_h": 1.4},
+    {"origem": "BSB", "destino": "SDU", "duracao_h": 1.7},
+    {"origem": "GRU", "destino": "CNF", "duracao_h": 1.0}
+]
+
+
+class IndiceRotas:
+    """Tabela de rotas em colunas com índice por par (origem, destino)"""
+
+    def __init__(self, df_rotas):
+        self.origem = df_rotas['origem'].astype(str).to_numpy()
+        self.destino = df_rotas['destino'].astype(str).to_numpy()
+        self.duracao_h = df_rotas['duracao_h'].astype(float).to_numpy()
+
+        # Par → linha; em caso de duplicata vale a primeira ocorrência
+        self._posicao = {}
+        for i, par in enumerate(zip(self.origem.tolist(), self.destino.tolist())):
+            self._posicao.setdefault(par, i)
+
+        # Destinos ordenados por origem, diretos e incluindo sentido inverso
+        diretos = {}
+        inversos = {}
+        for origem, destino in self._posicao:
+            diretos.setdefault(origem, set()).add(destino)
+            inversos.setdefault(destino, set()).add(origem)
+
+        self.origens = tuple(sorted(diretos))
+        self.aeroportos = tuple(sorted(set(diretos) | set(inversos)))
+        self._destinos = {o: tuple(sorted(d)) for o, d in diretos.items()}
+        self._destinos_com_inversos = {
+            a: tuple(sorted(diretos.get(a, set()) | inversos.get(a, set())))
+            for a in self.aeroportos
+        }
+
+    @classmethod
+    def from_registros(cls, rotas):
+        """Cria o índice a partir de uma lista de dicts origem/destino/duracao_h"""
+        return cls(pd.DataFrame(list(rotas), columns=['origem', 'destino', 'duracao_h']))
+
+    def __len__(self):
+        return len(self.duracao_h)
+
+    @cached_property
+    def hash(self):
+        """Hash do conteúdo das rotas (identifica o índice nas chaves de cache)"""
+        conteudo = hashlib.sha1()
+        for coluna in (self.origem, self.destino):
+            conteudo.update("\x1f".join(coluna.tolist()).encode("utf-8"))
+            conteudo.update(b"\x1e")
+        conteudo.update(self.duracao_h.tobytes())
+        return conteudo.hexdigest()
+
+    def posicao(self, origem, destino, permitir_inverso=False):
+        """
+        Linha da rota no índice
+
+        Returns:
+            Tuple (linha, invertida) ou (None, False) se não existir
+        """
+        linha = self._posicao.get((origem, destino))
+        if linha is not None:
+            return linha, False
+
+        if permitir_inverso:
+            linha = self._posicao.get((destino, origem))
+            if linha is not None:
+                return linha, True
+
+        return None, False
+
+    @cached_property
+    def _pares(self):
+        """Índice pandas dos pares (primeira ocorrência de cada um) para buscas em lote"""
+        pares = pd.MultiIndex.from_tuples(list(self._posicao), names=['origem', 'destino'])
+        linhas = np.fromiter(self._posicao.values(), dtype=np.intp, count=len(self._posicao))
+        return pares, linhas
+
+    def posicoes(self, origens, destinos, permitir_inverso=False):
+        """
+        Linhas de muitos pares de uma vez, sem laço Python
+
+        Args:
+            origens: Sequência de códigos de origem
+            destinos: Sequência de códigos de destino
+            permitir_inverso: Aceitar a rota cadastrada no sentido oposto
+
+        Returns:
+            Tuple (array de linhas com -1 onde o par não existe, array
+            booleano indicando os pares encontrados no sentido inverso)
+        """
+        origens = np.atleast_1d(np.asarray(origens, dtype=object)).astype(str)
+        destinos = np.atleast_1d(np.asarray(destinos, dtype=object)).astype(str)
+        pares, linhas_pares = self._pares
+        if not len(pares):
+            vazio = np.full(len(origens), -1, dtype=np.intp)
+            return vazio, np.zeros(len(origens), dtype=bool)
+
+        def localizar(de, para):
+            posicoes = pares.get_indexer(pd.MultiIndex.from_arrays([de, para]))
+            return np.where(posicoes >= 0, linhas_pares[posicoes], -1)
+
+        linhas = localizar(origens, destinos)
+        invertida = np.zeros(len(linhas), dtype=bool)
+        if permitir_inverso:
+            linhas_inversas = localizar(destinos, origens)
+            invertida = (linhas < 0) & (linhas_inversas >= 0)
+            linhas = np.where(invertida, linhas_inversas, linhas)
+        return linhas, invertida
+
+    def buscar(self, origem, destino, permitir_inverso=False):
+        """
+        Busca uma rota pelo par origem/destino
+
+        Args:
+            origem: Código do aeroporto de origem
+            destino: Código do aeroporto de destino
+            permitir_inverso: Aceitar a rota cadastrada no sentido oposto
+
+        Returns:
+            Dict com origem, destino, duracao_h e invertida, ou None
+        """
+        linha, invertida = self.posicao(origem, destino, permitir_inverso)
+        if linha is None:
+            return None
+
+        return {
+            'origem': origem,
+            'destino': destino,
+            'duracao_h': float(self.duracao_h[linha]),
+            'invertida': invertida
+        }
+
+    def destinos(self, origem, incluir_inversos=False):
+        """Destinos ordenados a partir de uma origem"""
+        if incluir_inversos:
+            return self._destinos_com_inversos.get(origem, ())
+        return self._destinos.get(origem, ())
+
+    def registros(self):
+        """Rotas como lista de dicts (formato de rotas_disponiveis)"""
+        return self.to_dataframe().to_dict('records')
+
+    def to_dataframe(self):
+        """Rotas como DataFrame origem/destino/duracao_h"""
+        return pd.DataFrame({
+            'origem': self.origem,
+            'destino': self.destino,
+            'duracao_h': self.duracao_h
+        })
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _indice_em_cache(caminho, mtime_ns, tamanho, geracao):
+    """Índice compartilhado entre reruns e sessões, invalidado pelo mtime/tamanho do arquivo e pela geração do armazenamento"""
+    return IndiceRotas(pd.read_csv(caminho))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _indice_catalogo_em_cache(caminho_db, revisao):
+    """Índice do catálogo SQLite, invalidado pela revisão da tabela de rotas"""
+    return IndiceRotas(obter_catalogo(caminho_db).ler_rotas())
+
+
+def carregar_indice_rotas(caminho=ROTAS_FILE):
+    """
+    Carrega o índice de rotas do CSV (ou do catálogo SQLite, se habilitado),
+    com fallback para as rotas padrão
+
+    Returns:
+        IndiceRotas
+    """
+    try:
+        catalogo = obter_catalogo()
+        if catalogo is not None:
+            indice = _indice_catalogo_em_cache(catalogo.caminho, catalogo.revisoes()['rotas'])
+        else:
+            info = Path(caminho).stat()
+            indice = _indice_em_cache(caminho, info.st_mtime_ns, info.st_size, geracao_atual())
+        if len(indice) == 0:
+            raise ValueError("Nenhuma rota encontrada")
+        return indice
+    except (FileNotFoundError, pd.errors.EmptyDataError, KeyError, ValueError) as e:
+        st.warning(f"Erro ao carregar rotas: {e}. Usando rotas padrão.")
+        return IndiceRotas.from_registros(ROTAS_PADRAO)
+
+
+def carregar_rotas(caminho=ROTAS_FILE):
+    """Tabela de rotas para edição (catálogo SQLite ou CSV)"""
+    catalogo = obter_catalogo()
+    if catalogo is not None:
+        return catalogo.ler_rotas()
+    return pd.read_csv(caminho)
+
+
+def salvar_rotas(df_rotas, caminho=ROTAS_FILE):
+    """Salva a tabela de rotas: linha a linha no catálogo ou CSV atômico"""
+    catalogo = obter_catalogo()
+    if catalogo is not None:
+        catalogo.salvar_rotas(df_rotas)
+    else:
+        gravar_csv(caminho, df_rotas)
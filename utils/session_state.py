@@ -133,6 +133,26 @@ def persistent_slider(label, key, min_value=0, max_value=100, default_value=50,
     
     return value
 
+# st.fragment (1.37+), st.experimental_fragment (1.33-1.36) ou nada
+_decorador_fragmento = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+def fragmento(funcao=None, *, run_every=None):
+    """
+    Marca uma seção da página como fragmento: mudanças nos widgets dela
+    reexecutam só a seção, não o script inteiro (tema, sidebar, status).
+    Em versões do Streamlit sem fragmentos, a seção roda normalmente.
+    
+    Uso: @fragmento ou @fragmento(run_every=2) para reexecutar a seção
+    sozinha a cada 2 segundos (acompanhamento de tarefas em andamento).
+    """
+    if funcao is None:
+        return lambda f: fragmento(f, run_every=run_every)
+    if _decorador_fragmento is None:
+        return funcao
+    if run_every is None:
+        return _decorador_fragmento(funcao)
+    return _decorador_fragmento(funcao, run_every=run_every)
+
 def reset_all_persistent_values():
     """Reset todos os valores persistentes (para debug)"""
     keys_to_reset = [
@@ -0,0 +1,246 @@
+"""
+Simulação de risco (Monte Carlo) para a operação charter
+Amostragem vetorizada em blocos, com agregação em streaming e execução
+opcional em processos paralelos
+"""
+
+# concurrent.futures só carrega multiprocessing ao acessar ProcessPoolExecutor
+from concurrent import futures
+import numpy as np
+
+from utils.calculations import calcular_lucro_charter_lote, indices_modelos
+
+# Variáveis incertas da operação charter
+VARIAVEIS_RISCO = ('preco_combustivel', 'taxa_ocupacao', 'preco_hora')
+
+# Percentis reportados por padrão
+PERCENTIS_PADRAO = (5, 10, 25, 50, 75, 90, 95)
+
+# Resolução do histograma usado na agregação
+NUM_FAIXAS_HISTOGRAMA = 1000
+
+# Amostras por bloco (limita a memória de cada passada vetorizada)
+TAMANHO_BLOCO_PADRAO = 25000
+
+# Distribuições normais são truncadas em média ± 4 desvios
+LIMITE_DESVIOS_NORMAL = 4
+
+
+def distribuicoes_padrao(params, taxa_ocupacao, preco_hora, variacao_combustivel=15,
+                         variacao_ocupacao=10, variacao_preco=10):
+    """
+    Monta distribuições triangulares centradas nos valores informados
+
+    Args:
+        params: Parâmetros do sistema (fornece o preço do combustível)
+        taxa_ocupacao: Taxa de ocupação esperada (0-100)
+        preco_hora: Preço por hora de charter esperado
+        variacao_combustivel: Variação do combustível para cima/baixo (%)
+        variacao_ocupacao: Variação da ocupação para cima/baixo (pontos percentuais)
+        variacao_preco: Variação do preço de charter para cima/baixo (%)
+
+    Returns:
+        Dict variável → especificação de distribuição
+    """
+    preco_combustivel = float(params['preco_combustivel'])
+
+    return {
+        'preco_combustivel': {
+            'distribuicao': 'triangular',
+            'min': preco_combustivel * (1 - variacao_combustivel / 100),
+            'moda': preco_combustivel,
+            'max': preco_combustivel * (1 + variacao_combustivel / 100)
+        },
+        'taxa_ocupacao': {
+            'distribuicao': 'triangular',
+            'min': max(taxa_ocupacao - variacao_ocupacao, 0),
+            'moda': taxa_ocupacao,
+            'max': min(taxa_ocupacao + variacao_ocupacao, 100)
+        },
+        'preco_hora': {
+            'distribuicao': 'triangular',
+            'min': preco_hora * (1 - variacao_preco / 100),
+            'moda': preco_hora,
+            'max': preco_hora * (1 + variacao_preco / 100)
+        }
+    }
+
+
+def _limites(dist):
+    """Suporte (mínimo, máximo) de uma distribuição"""
+    tipo = dist['distribuicao']
+
+    if tipo == 'fixo':
+        return dist['valor'], dist['valor']
+    if tipo in ('triangular', 'uniforme'):
+        return dist['min'], dist['max']
+    if tipo == 'normal':
+        minimo = dist['media'] - LIMITE_DESVIOS_NORMAL * dist['desvio']
+        maximo = dist['media'] + LIMITE_DESVIOS_NORMAL * dist['desvio']
+        return max(minimo, dist.get('min', minimo)), min(maximo, dist.get('max', maximo))
+
+    raise ValueError(f"Distribuição '{tipo}' não suportada")
+
+
+def _amostrar(rng, dist, n):
+    """Sorteia n valores de uma distribuição"""
+    tipo = dist['distribuicao']
+
+    if tipo == 'fixo':
+        return np.full(n, float(dist['valor']))
+    if tipo == 'uniforme':
+        return rng.uniform(dist['min'], dist['max'], n)
+    if tipo == 'triangular':
+        if dist['min'] == dist['max']:
+            return np.full(n, float(dist['min']))
+        return rng.triangular(dist['min'], dist['moda'], dist['max'], n)
+    if tipo == 'normal':
+        return np.clip(rng.normal(dist['media'], dist['desvio'], n), *_limites(dist))
+
+    raise ValueError(f"Distribuição '{tipo}' não suportada")
+
+
+def _simular_bloco(tarefa):
+    """
+    Avalia um bloco de amostras e devolve apenas os agregados
+
+    Função de nível de módulo para poder ser enviada a um ProcessPoolExecutor.
+    """
+    n, semente, idx_modelo, horas_charter, params, distribuicoes, bordas = tarefa
+    rng = np.random.default_rng(semente)
+
+    amostras = {var: _amostrar(rng, distribuicoes[var], n) for var in VARIAVEIS_RISCO}
+    lucro = calcular_lucro_charter_lote(
+        idx_modelo, horas_charter, amostras['taxa_ocupacao'], amostras['preco_hora'],
+        params, preco_combustivel=amostras['preco_combustivel']
+    )['lucro_liquido']
+
+    contagens, _ = np.histogram(np.clip(lucro, bordas[0], bordas[-1]), bins=bordas)
+
+    return {
+        'n': n,
+        'soma': float(lucro.sum()),
+        'soma_quadrados': float(np.square(lucro).sum()),
+        'prejuizos': int(np.count_nonzero(lucro < 0)),
+        'minimo': float(lucro.min()),
+        'maximo': float(lucro.max()),
+        'contagens': contagens
+    }
+
+
+def _percentil_histograma(bordas, acumulado, p):
+    """Percentil interpolado linearmente dentro da faixa do histograma"""
+    alvo = p / 100 * acumulado[-1]
+    faixa = min(int(np.searchsorted(acumulado, alvo)), len(acumulado) - 1)
+    anterior = acumulado[faixa - 1] if faixa > 0 else 0
+    na_faixa = acumulado[faixa] - anterior
+    fracao = (alvo - anterior) / na_faixa if na_faixa else 0.0
+    return float(bordas[faixa] + fracao * (bordas[faixa + 1] - bordas[faixa]))
+
+
+def simular_lucro_charter(modelo, horas_charter, params, distribuicoes, n_amostras=100000,
+                          tamanho_bloco=TAMANHO_BLOCO_PADRAO, seed=None, workers=None,
+                          percentis=PERCENTIS_PADRAO, num_faixas=NUM_FAIXAS_HISTOGRAMA):
+    """
+    Simulação Monte Carlo do lucro líquido mensal da operação charter
+
+    O preço do combustível, a taxa de ocupação e o preço de charter são
+    sorteados das distribuições informadas. As amostras são avaliadas em
+    blocos e apenas os agregados (somas e histograma) são mantidos, então a
+    memória não cresce com n_amostras. Cada bloco recebe sua própria semente
+    derivada de `seed`, de modo que o resultado é o mesmo com ou sem workers.
+
+    Args:
+        modelo: Modelo da aeronave
+        horas_charter: Horas disponíveis para charter por mês
+        params: Parâmetros do sistema
+        distribuicoes: Dict variável → especificação, para cada item de
+            VARIAVEIS_RISCO. Especificações aceitas:
+            {'distribuicao': 'triangular', 'min', 'moda', 'max'},
+            {'distribuicao': 'uniforme', 'min', 'max'},
+            {'distribuicao': 'normal', 'media', 'desvio'[, 'min', 'max']},
+            {'distribuicao': 'fixo', 'valor'}
+        n_amostras: Número total de sorteios
+        tamanho_bloco: Sorteios avaliados por bloco
+        seed: Semente para resultados reproduzíveis (None = aleatório)
+        workers: Número de processos; None ou 1 executa no processo atual
+        percentis: Percentis a reportar (0-100)
+        num_faixas: Número de faixas do histograma
+
+    Returns:
+        Dict com 'n_amostras', 'media', 'desvio_padrao', 'minimo', 'maximo',
+        'percentis' (percentil → lucro), 'probabilidade_prejuizo' (%) e
+        'histograma' ({'bordas', 'contagens'})
+    """
+    if n_amostras <= 0:
+        raise ValueError("Número de amostras deve ser maior que zero")
+
+    faltando = [var for var in VARIAVEIS_RISCO if var not in distribuicoes]
+    if faltando:
+        raise ValueError(f"Distribuição ausente para: {', '.join(faltando)}")
+
+    idx_modelo = int(indices_modelos(modelo, params))
+
+    # O lucro é monotônico em cada variável: os extremos estão nos vértices
+    # do domínio, o que fixa as bordas do histograma antes da amostragem
+    limites = [_limites(distribuicoes[var]) for var in VARIAVEIS_RISCO]
+    vertices = np.array(np.meshgrid(*limites)).reshape(len(VARIAVEIS_RISCO), -1)
+    lucro_vertices = calcular_lucro_charter_lote(
+        idx_modelo, horas_charter, vertices[1], vertices[2], params,
+        preco_combustivel=vertices[0]
+    )['lucro_liquido']
+    inferior, superior = float(lucro_vertices.min()), float(lucro_vertices.max())
+    if inferior == superior:
+        inferior, superior = inferior - 1, superior + 1
+    bordas = np.linspace(inferior, superior, num_faixas + 1)
+
+    # Blocos com sementes independentes
+    tamanhos = [tamanho_bloco] * (n_amostras // tamanho_bloco)
+    if n_amostras % tamanho_bloco:
+        tamanhos.append(n_amostras % tamanho_bloco)
+    sementes = np.random.SeedSequence(seed).spawn(len(tamanhos))
+    tarefas = [
+        (n, semente, idx_modelo, horas_charter, params, distribuicoes, bordas)
+        for n, semente in zip(tamanhos, sementes)
+    ]
+
+    # Agregação em streaming
+    total = {'n': 0, 'soma': 0.0, 'soma_quadrados': 0.0, 'prejuizos': 0,
+             'minimo': np.inf, 'maximo': -np.inf}
+    contagens = np.zeros(num_faixas, dtype=np.int64)
+
+    def agregar(parcial):
+        total['n'] += parcial['n']
+        total['soma'] += parcial['soma']
+        total['soma_quadrados'] += parcial['soma_quadrados']
+        total['prejuizos'] += parcial['prejuizos']
+        total['minimo'] = min(total['minimo'], parcial['minimo'])
+        total['maximo'] = max(total['maximo'], parcial['maximo'])
+        contagens[:] += parcial['contagens']
+
+    if workers and workers > 1 and len(tarefas) > 1:
+        with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            for parcial in executor.map(_simular_bloco, tarefas):
+                agregar(parcial)
+    else:
+        for tarefa in tarefas:
+            agregar(_simular_bloco(tarefa))
+
+    n = total['n']
+    media = total['soma'] / n
+    variancia = max(total['soma_quadrados'] / n - media ** 2, 0.0)
+    acumulado = np.cumsum(contagens)
+
+    return {
+        'n_amostras': n,
+        'media': media,
+        'desvio_padrao': variancia ** 0.5,
+        'minimo': total['minimo'],
+        'maximo': total['maximo'],
+        'percentis': {p: _percentil_histograma(bordas, acumulado, p) for p in percentis},
+        'probabilidade_prejuizo': total['prejuizos'] / n * 100,
+        'histograma': {
+            'bordas': bordas,
+            'contagens': contagens
+        }
+    }
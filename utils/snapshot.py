@@ -0,0 +1,272 @@
+"""
+Snapshots imutáveis dos parâmetros, identificados pelo hash do conteúdo
+
+Cada resultado pode ser chaveado por (hash do snapshot, entradas), e cada
+conjunto de parâmetros gravado pelo app fica registrado em config/historico/
+(os MAX_HISTORICO mais recentes) para reprodução e rollback.
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.storage import gravar_json
+
+HISTORICO_DIR = "config/historico"
+
+# Registros mantidos no histórico (os mais antigos são apagados)
+MAX_HISTORICO = 50
+
+
+class _DictCongelado(dict):
+    """Dicionário somente leitura (continua sendo um dict para quem o consome)"""
+
+    def _somente_leitura(self, *args, **kwargs):
+        raise TypeError("Parâmetros são imutáveis; use como_dict() para obter uma cópia editável")
+
+    __setitem__ = __delitem__ = __ior__ = _somente_leitura
+    clear = pop = popitem = setdefault = update = _somente_leitura
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _congelar(valor):
+    """Converte recursivamente dicts, listas e arrays em equivalentes imutáveis"""
+    if isinstance(valor, Mapping):
+        return _DictCongelado({k: _congelar(v) for k, v in valor.items()})
+    if isinstance(valor, (list, tuple)):
+        return tuple(_congelar(v) for v in valor)
+    if isinstance(valor, np.ndarray):
+        if valor.flags.writeable:
+            valor = valor.copy()
+            valor.setflags(write=False)
+        return valor
+    return valor
+
+
+def _descongelar(valor):
+    """Cópia editável (dicts e listas comuns) de uma estrutura congelada"""
+    if isinstance(valor, Mapping):
+        return {k: _descongelar(v) for k, v in valor.items()}
+    if isinstance(valor, tuple):
+        return [_descongelar(v) for v in valor]
+    return valor
+
+
+def _canonico(valor):
+    """Forma JSON determinística de parâmetros e entradas de cálculo"""
+    if isinstance(valor, Mapping):
+        return {str(k): _canonico(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_canonico(v) for v in valor]
+    if isinstance(valor, np.ndarray):
+        return _canonico(valor.tolist())
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return valor
+
+
+def hash_parametros(params):
+    """
+    Hash estável (SHA-256) do conteúdo dos parâmetros
+
+    Args:
+        params: ParametrosSnapshot ou dict de parâmetros
+
+    Returns:
+        Hash hexadecimal
+    """
+    if isinstance(params, ParametrosSnapshot):
+        return params.hash
+    conteudo = json.dumps(_canonico(params), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+
+class ParametrosSnapshot(_DictCongelado):
+    """
+    Parâmetros imutáveis e hasheáveis, identificados pelo hash do conteúdo
+
+    Mantém a interface de dict (params['...'], params.get(...)) para todo o
+    código existente; alterações exigem como_dict() e save_params.
+    """
+
+    def __init__(self, dados, hash_conteudo=None):
+        super().__init__({k: _congelar(v) for k, v in dados.items()})
+        self.hash = hash_conteudo or hash_parametros(dict(self))
+
+    def __hash__(self):
+        return hash(self.hash)
+
+    def __eq__(self, outro):
+        if isinstance(outro, ParametrosSnapshot):
+            return self.hash == outro.hash
+        return dict.__eq__(self, outro)
+
+    def __ne__(self, outro):
+        return not self.__eq__(outro)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self), self.hash))
+
+    def __repr__(self):
+        return f"ParametrosSnapshot({self.hash[:12]})"
+
+    def como_dict(self):
+        """Cópia editável dos parâmetros"""
+        return _descongelar(self)
+
+
+# Entradas que já são hasheáveis e estáveis como estão
+_TIPOS_SIMPLES = (str, int, float, bool, type(None))
+
+
+def _normalizar_entrada(valor):
+    """Converte uma entrada de cálculo em algo hasheável e estável"""
+    if type(valor) in _TIPOS_SIMPLES:
+        return valor
+    if type(valor) is tuple:
+        return tuple(_normalizar_entrada(v) for v in valor)
+    if isinstance(valor, ParametrosSnapshot):
+        return ('params', valor.hash)
+    if isinstance(valor, np.ndarray):
+        if valor.dtype == object:  # bytes de um array de objetos são ponteiros: hasheia o texto
+            conteudo = "\x1f".join(map(repr, valor.ravel().tolist())).encode("utf-8")
+        else:
+            conteudo = np.ascontiguousarray(valor).tobytes()
+        return ('ndarray', valor.dtype.str, valor.shape, hashlib.sha1(conteudo).hexdigest())
+    if isinstance(valor, (pd.DataFrame, pd.Series)):
+        return ('pandas', tuple(map(str, getattr(valor, 'columns', [valor.name]))),
+                hashlib.sha1(pd.util.hash_pandas_object(valor, index=True).values.tobytes()).hexdigest())
+    if isinstance(valor, Mapping):
+        return tuple(sorted((str(k), _normalizar_entrada(v)) for k, v in valor.items()))
+    if isinstance(valor, (list, tuple)):
+        return tuple(_normalizar_entrada(v) for v in valor)
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(getattr(valor, 'hash', None), str):
+        return (type(valor).__name__, valor.hash)
+    return valor
+
+
+def chave_calculo(funcao, params, *args, **kwargs):
+    """
+    Chave de cache de um cálculo: (função, hash dos parâmetros, entradas)
+
+    Args:
+        funcao: Função ou nome do cálculo
+        params: ParametrosSnapshot (ou dict, hasheado na hora)
+        *args, **kwargs: Demais entradas do cálculo
+
+    Returns:
+        Tupla hasheável
+    """
+    nome = getattr(funcao, '__qualname__', str(funcao))
+    return (
+        nome,
+        hash_parametros(params),
+        _normalizar_entrada(args),
+        _normalizar_entrada(kwargs)
+    )
+
+
+# ========================================================================
+# HISTÓRICO EM DISCO
+# ========================================================================
+
+def registrar_snapshot(snapshot, parametros_base, df_modelos, historico_dir=HISTORICO_DIR,
+                       max_registros=MAX_HISTORICO):
+    """
+    Registra a origem de um snapshot no histórico (idempotente por hash)
+
+    Chamado só nas gravações (save_params, save_modelos, restauração), nunca
+    na leitura. O registro não avança a geração do armazenamento, e o
+    histórico é podado para os max_registros usados mais recentemente.
+
+    Args:
+        snapshot: ParametrosSnapshot carregado
+        parametros_base: Parâmetros básicos (conteúdo de parametros.json)
+        df_modelos: Tabela de modelos usada
+        max_registros: Registros mantidos no histórico
+
+    Returns:
+        True se um novo registro foi gravado
+    """
+    arquivo = Path(historico_dir) / f"{snapshot.hash}.json"
+    novo = not arquivo.exists()
+
+    if novo:
+        gravar_json(arquivo, {
+            'hash': snapshot.hash,
+            'criado_em': datetime.now().isoformat(timespec='seconds'),
+            'parametros': _canonico(parametros_base),
+            'modelos': json.loads(df_modelos.to_json(orient='records'))
+        }, avancar_geracao=False)
+    else:
+        arquivo.touch()  # Voltou a ser usado: fica entre os mais recentes na poda
+
+    _podar_historico(historico_dir, max_registros)
+    return novo
+
+
+def _podar_historico(historico_dir, max_registros):
+    """Apaga os registros além dos max_registros usados mais recentemente"""
+    arquivos = []
+    for arquivo in Path(historico_dir).glob("*.json"):
+        try:
+            arquivos.append((arquivo.stat().st_mtime_ns, arquivo))
+        except FileNotFoundError:
+            continue
+    arquivos.sort(reverse=True)
+    for _, arquivo in arquivos[max_registros:]:
+        try:
+            arquivo.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def listar_snapshots(historico_dir=HISTORICO_DIR):
+    """
+    Snapshots registrados, do mais recente para o mais antigo
+
+    Returns:
+        Lista de dicts com 'hash', 'criado_em', 'parametros' e 'modelos'
+    """
+    registros = []
+    for arquivo in Path(historico_dir).glob("*.json"):
+        try:
+            with open(arquivo, "r", encoding="utf-8") as f:
+                registros.append(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return sorted(registros, key=lambda r: r.get('criado_em', ''), reverse=True)
+
+
+def carregar_snapshot(hash_snapshot, historico_dir=HISTORICO_DIR):
+    """
+    Origem de um snapshot registrado
+
+    Returns:
+        Tupla (parametros_base, df_modelos)
+
+    Raises:
+        KeyError: Se o hash não estiver no histórico
+    """
+    arquivo = Path(historico_dir) / f"{hash_snapshot}.json"
+    if not arquivo.exists():
+        raise KeyError(f"Snapshot {hash_snapshot[:12]} não encontrado no histórico")
+
+    with open(arquivo, "r", encoding="utf-8") as f:
+        registro = json.load(f)
+    return registro['parametros'], pd.DataFrame(registro['modelos'])
@@ -0,0 +1,129 @@
+"""
+Camada de armazenamento: gravação atômica com bloqueio entre processos
+Evita que leitores concorrentes vejam arquivos pela metade
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem bloqueio consultivo, a troca atômica continua valendo
+    fcntl = None
+
+# Bloqueio único para todas as gravações e contador de gerações
+LOCK_FILE = "config/.armazenamento.lock"
+GERACAO_FILE = "config/.geracao"
+
+
+@contextmanager
+def bloqueio_gravacao(caminho_lock=LOCK_FILE):
+    """
+    Bloqueio consultivo exclusivo (fcntl.flock) compartilhado entre processos
+
+    Args:
+        caminho_lock: Arquivo usado como trava
+    """
+    Path(caminho_lock).parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho_lock, "a") as trava:
+        if fcntl is not None:
+            fcntl.flock(trava.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(trava.fileno(), fcntl.LOCK_UN)
+
+
+def _fsync_diretorio(diretorio):
+    """Persiste a entrada de diretório após o rename (ignorado onde não suportado)"""
+    try:
+        fd = os.open(diretorio, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _substituir_atomico(caminho, conteudo):
+    """Grava em arquivo temporário no mesmo diretório, faz fsync e renomeia"""
+    destino = Path(caminho)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temporario = tempfile.mkstemp(dir=destino.parent, prefix=f".{destino.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, destino)
+    except BaseException:
+        try:
+            os.unlink(temporario)
+        except FileNotFoundError:
+            pass
+        raise
+
+    _fsync_diretorio(destino.parent)
+
+
+def geracao_atual():
+    """
+    Geração atual do armazenamento (incrementada a cada gravação)
+
+    Leitores comparam com o valor anterior para saber, com uma única
+    leitura, se algo foi gravado desde a última consulta.
+
+    Returns:
+        Inteiro (0 se nada foi gravado ainda)
+    """
+    try:
+        with open(GERACAO_FILE, "r", encoding="utf-8") as f:
+            return int(f.read().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def gravar_atomico(caminho, conteudo, avancar_geracao=True):
+    """
+    Substitui o arquivo de forma atômica, sob bloqueio, e avança a geração
+
+    Args:
+        caminho: Arquivo de destino
+        conteudo: str (gravado em UTF-8) ou bytes
+        avancar_geracao: False para arquivos auxiliares (ex.: histórico) que
+                         não alteram o que os leitores carregam; assim a
+                         gravação não invalida os caches baseados na geração
+
+    Returns:
+        Geração do armazenamento após a gravação
+    """
+    if isinstance(conteudo, str):
+        conteudo = conteudo.encode("utf-8")
+
+    with bloqueio_gravacao():
+        _substituir_atomico(caminho, conteudo)
+        geracao = geracao_atual()
+        if avancar_geracao:
+            geracao += 1
+            _substituir_atomico(GERACAO_FILE, str(geracao).encode("utf-8"))
+
+    return geracao
+
+
+def gravar_json(caminho, dados, avancar_geracao=True):
+    """Grava um dicionário como JSON de forma atômica"""
+    return gravar_atomico(caminho, json.dumps(dados, indent=2, ensure_ascii=False),
+                          avancar_geracao)
+
+
+def gravar_csv(caminho, df):
+    """Grava um DataFrame como CSV (sem índice) de forma atômica"""
+    return gravar_atomico(caminho, df.to_csv(index=False))